@@ -1,24 +1,22 @@
 # ingestion_service/src/api/v1/ingest.py
 from uuid import uuid4, UUID
+import hashlib
 import json
 import logging
-import threading
-from typing import Optional
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator, Optional, Tuple
 
-import httpx
 from fastapi import APIRouter, HTTPException, UploadFile, File, Form, status
+from sqlalchemy import select, text
+from sqlalchemy.orm import Session
 from src.api.v1.models import IngestResponse
 from src.core.database_session import get_sessionmaker
 from src.core.models import IngestionRequest
-from src.core.pipeline import IngestionPipeline
-from src.core.status_manager import StatusManager
-from src.core.http_vectorstore import HttpVectorStore
 from src.core.config import get_settings
-from shared.embedders.factory import get_embedder
+from src.core.job_queue import IngestionJobQueue
 from src.core.ocr.ocr_factory import get_ocr_engine
-from src.core.extractors.pdf import PDFExtractor
-from src.core.document_graph.builder import DocumentGraphBuilder
-from src.core.chunk_assembly.pdf_chunk_assembler import PDFChunkAssembler
+from src.core.ingest_runner import extract_text_from_bytes  # noqa: F401 (re-export)
 
 SessionLocal = get_sessionmaker()
 router = APIRouter(tags=["ingestion"])
@@ -26,30 +24,12 @@ router = APIRouter(tags=["ingestion"])
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+SPOOL_COPY_BUFFER = 1024 * 1024
+DUPLICATE_POLICIES = ("skip", "link", "reingest")
+
 # -----------------------------
 # Helpers
 # -----------------------------
-class NoOpValidator:
-    def validate(self, text: str) -> None:
-        return None
-
-
-def _build_pipeline(provider: str) -> IngestionPipeline:
-    settings = get_settings()
-    embedder = get_embedder(
-        provider=settings.EMBEDDING_PROVIDER,
-        ollama_base_url=settings.OLLAMA_BASE_URL,
-        ollama_model=settings.OLLAMA_EMBED_MODEL,
-        ollama_batch_size=settings.OLLAMA_BATCH_SIZE,
-    )
-    vector_store = HttpVectorStore(base_url=settings.VECTOR_STORE_SERVICE_URL, provider=provider)
-    return IngestionPipeline(
-        validator=NoOpValidator(),
-        embedder=embedder,
-        vector_store=vector_store,
-    )
-
-
 def extract_text_from_bytes_bak(file_bytes: bytes, filename: str, content_type: str, ocr_provider: Optional[str]) -> str:
     if content_type.startswith("image/") or filename.endswith((".png", ".jpg", ".jpeg")):
         ocr_engine = get_ocr_engine(ocr_provider or "tesseract")
@@ -58,105 +38,203 @@ def extract_text_from_bytes_bak(file_bytes: bytes, filename: str, content_type:
         return file_bytes.decode("utf-8")
     except Exception:
         raise ValueError("Unable to decode file as UTF-8")
-    
-def extract_text_from_bytes(file_bytes: bytes, filename: str, content_type: str, ocr_provider: Optional[str]) -> str:
-    # Images → OCR
-    if content_type.startswith("image/") or filename.lower().endswith((".png", ".jpg", ".jpeg", ".tiff")):
-        logger.info(f"🖼️ OCR processing: {filename}")
-        ocr_engine = get_ocr_engine(ocr_provider or "tesseract")
-        return ocr_engine.extract_text(file_bytes) or ""
-    
-    # Text files → Robust multi-encoding decoder
-    encodings = ['utf-8', 'utf-8-sig', 'windows-1252', 'latin-1', 'cp1252', 'iso-8859-1']
-    
-    for encoding in encodings:
-        try:
-            text = file_bytes.decode(encoding)
-            logger.debug(f"✅ Decoded {filename} as {encoding}")
-            return text
-        except UnicodeDecodeError:
-            logger.debug(f"Failed {encoding} for {filename}, trying next...")
-            continue
-    
-    # Final fallback: latin-1 ignores errors
-    logger.warning(f"⚠️ Using fallback decoder for {filename}")
-    return file_bytes.decode('latin-1', errors='ignore')
-
 
 
-# -----------------------------
-# Background ingestion
-# -----------------------------
-def background_ingest_file(*, ingestion_id: UUID, file_bytes: bytes, filename: str, content_type: str, metadata: dict):
+def _get_job_queue() -> IngestionJobQueue:
     settings = get_settings()
-    provider = settings.EMBEDDING_PROVIDER
-    pipeline = _build_pipeline(provider)
+    return IngestionJobQueue(
+        SessionLocal,
+        lease_seconds=settings.INGEST_LEASE_SECONDS,
+        backoff_seconds=settings.INGEST_RETRY_BACKOFF_SECONDS,
+        backoff_max_seconds=settings.INGEST_RETRY_BACKOFF_MAX_SECONDS,
+    )
 
-    is_pdf = filename.endswith(".pdf") or content_type == "application/pdf"
-    ocr_provider = metadata.get("ocr_provider")
 
-    with SessionLocal() as session:
-        StatusManager(session).mark_running(ingestion_id)
+def spool_upload(file: UploadFile, ingestion_id: UUID) -> Tuple[Path, str]:
+    """
+    Stream the upload to the spool directory without buffering it in memory.
 
+    Returns the spooled path and the SHA-256 hex digest of the content.
+    """
+    spool_dir = Path(get_settings().INGEST_SPOOL_DIR)
+    spool_dir.mkdir(parents=True, exist_ok=True)
+    final_path = spool_dir / str(ingestion_id)
+    tmp_path = spool_dir / f"{ingestion_id}.part"
+    digest = hashlib.sha256()
     try:
-        # PDF handling
-        if is_pdf:
-            pdf_extractor = PDFExtractor()
-            artifacts = pdf_extractor.extract(file_bytes=file_bytes, source_name=filename)
-            graph = DocumentGraphBuilder().build(artifacts)
-            chunks = PDFChunkAssembler().assemble(graph)
-            if not chunks:
-                raise RuntimeError("No extractable text found in uploaded PDF")
-            pipeline.run_with_chunks(chunks=chunks, ingestion_id=str(ingestion_id))
-        else:
-            text = extract_text_from_bytes(file_bytes=file_bytes, filename=filename, content_type=content_type, ocr_provider=ocr_provider)
-            if not text.strip():
-                raise RuntimeError("No extractable text found in uploaded file")
-            pipeline.run(text=text, ingestion_id=str(ingestion_id), source_type="file", provider=provider)
-
-        # Mark completed
-        with SessionLocal() as session:
-            StatusManager(session).mark_completed(ingestion_id)
-
-        # Fire-and-forget summary trigger
-        summary_url = f"http://llm-service:8000/v1/summarize/{ingestion_id}"
+        with tmp_path.open("wb") as out:
+            while block := file.file.read(SPOOL_COPY_BUFFER):
+                digest.update(block)
+                out.write(block)
+        tmp_path.replace(final_path)
+    except Exception:
+        tmp_path.unlink(missing_ok=True)
+        raise
+    return final_path, digest.hexdigest()
+
+
+@contextmanager
+def content_lock(content_sha256: str) -> Iterator[Session]:
+    """
+    Serialize dedup decisions for identical content across API processes.
+
+    Yields the session holding a transaction-scoped advisory lock on the
+    content hash. The caller looks for a duplicate and records the new
+    ingestion on that same session, so two simultaneous identical uploads
+    can't both miss find_duplicate() and each upload uses one connection.
+    Committing the insert ends the transaction and releases the lock.
+    """
+    with SessionLocal() as session:
+        session.execute(
+            text("SELECT pg_advisory_xact_lock(hashtextextended(:content_sha256, 0))"),
+            {"content_sha256": content_sha256},
+        )
         try:
-            httpx.post(summary_url, timeout=1000)
-            logger.info(f"✅ Summary task dispatched: {summary_url}")
-        except Exception as e:
-            logger.warning(f"⚠️ Summary dispatch failed: {e}")
+            yield session
+        finally:
+            session.rollback()  # releases the lock if nothing was committed
+
+
+def find_duplicate(session: Session, content_sha256: str) -> Optional[IngestionRequest]:
+    """Earliest non-failed ingestion of byte-identical content, if any."""
+    statement = (
+        select(IngestionRequest)
+        .where(
+            IngestionRequest.content_sha256 == content_sha256,
+            IngestionRequest.status != "failed",
+        )
+        .order_by(IngestionRequest.created_at)
+        .limit(1)
+    )
+    return session.execute(statement).scalars().first()
+
+
+def link_duplicate(
+    session: Session,
+    *,
+    ingestion_id: UUID,
+    original_id: UUID,
+    metadata: dict,
+    content_sha256: str,
+) -> None:
+    """Record a completed ingestion that reuses the original's chunks."""
+    request = IngestionRequest()
+    request.ingestion_id = ingestion_id
+    request.source_type = "file"
+    request.ingestion_metadata = {**metadata, "duplicate_of": str(original_id)}
+    request.status = "completed"
+    request.content_sha256 = content_sha256
+    session.add(request)
+    session.commit()
+
+
+def enqueue_upload(
+    ingestion_id: UUID,
+    metadata: dict,
+    filename: str,
+    content_type: str,
+    payload_path: Path,
+    content_sha256: str,
+    session: Optional[Session] = None,
+) -> IngestResponse:
+    """Queue the spooled upload for the worker pool."""
+    try:
+        _get_job_queue().enqueue(
+            ingestion_id=ingestion_id,
+            source_type="file",
+            metadata=metadata,
+            filename=filename,
+            content_type=content_type,
+            payload_path=str(payload_path),
+            max_attempts=get_settings().INGEST_MAX_ATTEMPTS,
+            content_sha256=content_sha256,
+            session=session,
+        )
+    except Exception:
+        payload_path.unlink(missing_ok=True)
+        raise
 
-    except Exception as exc:
-        with SessionLocal() as session:
-            StatusManager(session).mark_failed(ingestion_id, error=str(exc))
-        logger.error(f"❌ Background ingestion failed: {ingestion_id} - {exc}")
+    return IngestResponse(ingestion_id=ingestion_id, status="accepted")
 
 
 # -----------------------------
 # API endpoints
 # -----------------------------
 @router.post("/ingest/file", response_model=IngestResponse, status_code=status.HTTP_202_ACCEPTED)
-def ingest_file(file: UploadFile = File(...), metadata: Optional[str] = Form(default=None)) -> IngestResponse:
+def ingest_file(
+    file: UploadFile = File(...),
+    metadata: Optional[str] = Form(default=None),
+    duplicate_policy: Optional[str] = Form(default=None),
+    document_id: Optional[str] = Form(default=None),
+) -> IngestResponse:
     try:
         parsed_metadata = json.loads(metadata) if metadata else {}
     except json.JSONDecodeError as exc:
         raise HTTPException(status_code=400, detail="Invalid metadata JSON") from exc
 
+    # Re-upload of an existing document: only changed chunks are re-embedded
+    if document_id:
+        try:
+            parsed_metadata["update_document_id"] = str(UUID(document_id))
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Invalid document_id")
+
+    policy = duplicate_policy or get_settings().INGEST_DUPLICATE_POLICY
+    if policy not in DUPLICATE_POLICIES:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Invalid duplicate_policy. Valid: {DUPLICATE_POLICIES}",
+        )
+
     ingestion_id = uuid4()
-    file_bytes = file.file.read()
     filename = file.filename or "unknown"
     content_type = file.content_type or "application/octet-stream"
 
-    with SessionLocal() as session:
-        StatusManager(session).create_request(ingestion_id=ingestion_id, source_type="file", metadata=parsed_metadata)
+    # The upload is spooled to disk and processed by the worker pool
+    # (python -m src.core.worker); the API never holds it in memory.
+    payload_path, content_sha256 = spool_upload(file, ingestion_id)
 
-    threading.Thread(
-        target=background_ingest_file,
-        kwargs={"ingestion_id": ingestion_id, "file_bytes": file_bytes, "filename": filename, "content_type": content_type, "metadata": parsed_metadata},
-        daemon=True,
-    ).start()
+    # An update must always run, even when its bytes match an earlier upload
+    if policy == "reingest" or "update_document_id" in parsed_metadata:
+        return enqueue_upload(
+            ingestion_id, parsed_metadata, filename, content_type,
+            payload_path, content_sha256,
+        )
 
-    return IngestResponse(ingestion_id=ingestion_id, status="accepted")
+    try:
+        with content_lock(content_sha256) as session:
+            original = find_duplicate(session, content_sha256)
+            if original is None:
+                return enqueue_upload(
+                    ingestion_id, parsed_metadata, filename, content_type,
+                    payload_path, content_sha256, session=session,
+                )
+
+            # Read before any commit expires the instance
+            original_id, original_status = original.ingestion_id, original.status
+            payload_path.unlink(missing_ok=True)
+            logger.info(f"♻️ Duplicate upload of {original_id} ({policy})")
+            if policy == "skip":
+                return IngestResponse(
+                    ingestion_id=original_id,
+                    status=original_status,
+                    duplicate_of=original_id,
+                )
+            link_duplicate(
+                session,
+                ingestion_id=ingestion_id,
+                original_id=original_id,
+                metadata=parsed_metadata,
+                content_sha256=content_sha256,
+            )
+            return IngestResponse(
+                ingestion_id=ingestion_id,
+                status="completed",
+                duplicate_of=original_id,
+            )
+    except Exception:
+        payload_path.unlink(missing_ok=True)
+        raise
 
 
 @router.get("/ingest/{ingestion_id}", response_model=IngestResponse)
@@ -171,4 +249,19 @@ def ingest_status(ingestion_id: str) -> IngestResponse:
         if request is None:
             raise HTTPException(status_code=404, detail="Ingestion ID not found")
 
+        # Linked duplicates report the progress of the ingestion they point at
+        duplicate_of = (request.ingestion_metadata or {}).get("duplicate_of")
+        if duplicate_of:
+            original = (
+                session.query(IngestionRequest)
+                .filter_by(ingestion_id=UUID(duplicate_of))
+                .first()
+            )
+            if original is not None:
+                return IngestResponse(
+                    ingestion_id=request.ingestion_id,
+                    status=original.status,
+                    duplicate_of=original.ingestion_id,
+                )
+
         return IngestResponse(ingestion_id=request.ingestion_id, status=request.status)
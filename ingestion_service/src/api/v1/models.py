@@ -48,6 +48,14 @@ class IngestResponse(BaseModel):
         examples=["accepted", "running", "completed"],
     )
 
+    duplicate_of: Optional[UUID] = Field(
+        default=None,
+        description=(
+            "Existing ingestion with byte-identical content, "
+            "if this upload was deduplicated"
+        ),
+    )
+
 
 class ErrorResponse(BaseModel):
     """
@@ -1,6 +1,8 @@
 # ingestion_service/src/api/v1/summary.py
 from fastapi import APIRouter, HTTPException
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
+from sqlalchemy import column, select
+from typing import Dict, List
 from uuid import UUID
 
 from src.core.database_session import get_sessionmaker
@@ -16,13 +18,17 @@ class SummaryPayload(BaseModel):
     ingestion_id: str
     summary: str
 
+
+class SummariesBatchGetRequest(BaseModel):
+    document_ids: List[str] = Field(..., max_length=1000)
+
 # -----------------------------
 # POST /summary
 # -----------------------------
 @router.post("/summary")
 def save_summary(payload: SummaryPayload):
     try:
-        uid = UUID(payload.ingestion_id)
+        UUID(payload.ingestion_id)
     except ValueError:
         raise HTTPException(status_code=400, detail="Invalid ingestion_id")
 
@@ -38,3 +44,38 @@ def save_summary(payload: SummaryPayload):
         session.commit()
 
     return {"status": "summary_saved"}
+
+
+# -----------------------------
+# POST /summaries:batchGet
+# -----------------------------
+@router.post("/summaries:batchGet")
+def batch_get_summaries(payload: SummariesBatchGetRequest) -> Dict[str, Dict[str, str]]:
+    """
+    Return the summaries of many documents with a single IN (...) query.
+
+    Documents that don't exist or have an empty summary are absent from
+    the result. Any id that is not a UUID rejects the request with 400.
+    """
+    document_ids: Dict[str, None] = {}
+    for document_id in payload.document_ids:
+        try:
+            document_ids[str(UUID(document_id))] = None  # stored in canonical form
+        except ValueError:
+            raise HTTPException(
+                status_code=400, detail=f"Invalid document_id: {document_id}"
+            )
+    if not document_ids:
+        return {"summaries": {}}
+
+    with SessionLocal() as session:
+        rows = session.execute(
+            select(DocumentNode.document_id, DocumentNode.summary)
+            .where(column("document_id").in_(list(document_ids)))
+        ).all()
+
+    return {
+        "summaries": {
+            str(document_id): summary for document_id, summary in rows if summary
+        }
+    }
@@ -0,0 +1,366 @@
+# ingestion_service/src/core/async_pipeline.py
+"""
+Overlapped ingestion pipeline for many documents in flight.
+
+    extract (process pool) → DocumentNode → windows
+        ─► embed workers ─► persist workers
+     (bounded queue)   (bounded queue)
+
+Each stage has its own concurrency limit:
+- extract:  `extract_processes` worker processes (PDF parse, graph build,
+            chunk assembly / OCR, text chunking — all CPU-bound);
+- embed:    `embed_concurrency` windows embedded at once (threads, the
+            embedder clients are blocking);
+- persist:  `persist_concurrency` concurrent async POSTs to the vector store.
+
+The queues between stages are bounded, so a slow stage back-pressures the
+ones before it, while windows of different documents interleave and keep
+the CPU, the embedding server and Postgres busy at the same time.
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+import multiprocessing as mp
+import threading
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Optional
+from uuid import UUID, uuid4
+
+import httpx
+
+from shared.chunks import Chunk
+from shared.embedders.base import BaseEmbedder
+from src.core.crud.crud_document_node import create_document_node
+from src.core.database_session import get_sessionmaker
+from src.core.http_vectorstore import HttpVectorStore
+from src.core.pipeline import (
+    IngestionCancelled,
+    IngestionPipeline,
+    chunk_text,
+    discard_previous_attempt,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def prepare_chunks(
+    file_bytes: bytes,
+    filename: str,
+    content_type: str,
+    ocr_provider: Optional[str],
+    provider: str,
+) -> tuple[str, list[Chunk]]:
+    """
+    CPU stage: upload bytes → (doc_type, chunks).
+
+    Top-level (picklable) so it can run in a ProcessPoolExecutor; imports are
+    local to keep worker start-up light.
+    """
+    from src.core.config import get_settings
+    from src.core.ingest_runner import (
+        assemble_pdf_chunks,
+        extract_text_from_bytes,
+    )
+
+    if filename.endswith(".pdf") or content_type == "application/pdf":
+        return "pdf", assemble_pdf_chunks(file_bytes, filename, ocr_provider)
+
+    text = extract_text_from_bytes(
+        file_bytes=file_bytes,
+        filename=filename,
+        content_type=content_type,
+        ocr_provider=ocr_provider,
+    )
+    if not text.strip():
+        raise RuntimeError("No extractable text found in uploaded file")
+    return "file", chunk_text(
+        text,
+        source_type="file",
+        provider=provider,
+        tokenizer=get_settings().CHUNK_TOKENIZER,
+    )
+
+
+def create_document(ingestion_id: str, doc_type: str, chunks: list[Chunk]) -> str:
+    """Create + commit the DocumentNode before any vectors reference it (MS6)."""
+    if doc_type == "pdf":
+        title = chunks[0].metadata.get("filename", "untitled") if chunks else "untitled"
+    else:
+        title = f"{doc_type}_document_{ingestion_id[:8]}"
+
+    sessionmaker = get_sessionmaker()
+    with sessionmaker() as session:
+        document_id = uuid4()
+        create_document_node(
+            session,
+            document_id=document_id,
+            title=title,
+            summary="Document summary pending MS7",
+            source=f"file_document_{ingestion_id}",  # MS7: summary.py lookup
+            ingestion_id=UUID(ingestion_id),
+            doc_type="file",
+        )
+        session.commit()
+    return str(document_id)
+
+
+@dataclass
+class _DocumentRun:
+    ingestion_id: str
+    document_id: str
+    cancel: Optional[threading.Event] = None
+    error: Optional[BaseException] = None
+
+    def failure(self) -> Optional[BaseException]:
+        """The run's error; IngestionCancelled once `cancel` is set."""
+        if self.error is None and self.cancel is not None and self.cancel.is_set():
+            self.error = IngestionCancelled(f"Ingestion {self.ingestion_id} cancelled")
+        return self.error
+
+
+@dataclass
+class _Window:
+    run: _DocumentRun
+    chunks: list[Chunk]
+    offset: int
+    done: asyncio.Future
+    embeddings: list[Any] = field(default_factory=list)
+
+
+class AsyncIngestionPipeline:
+    def __init__(
+        self,
+        *,
+        embedder: BaseEmbedder,
+        vector_store: HttpVectorStore,
+        window_size: int = 256,
+        extract_processes: int = 2,
+        embed_concurrency: int = 2,
+        persist_concurrency: int = 4,
+        max_pending_windows: int = 4,
+        extract_executor: Optional[Executor] = None,
+        http_client: Optional[httpx.AsyncClient] = None,
+    ) -> None:
+        if window_size < 1:
+            raise ValueError("window_size must be >= 1")
+        limits = (
+            extract_processes, embed_concurrency, persist_concurrency,
+            max_pending_windows,
+        )
+        if min(limits) < 1:
+            raise ValueError("stage concurrency limits must be >= 1")
+
+        self._embedder = embedder
+        self._vector_store = vector_store
+        self._window_size = window_size
+        self._extract_processes = extract_processes
+        self._embed_concurrency = embed_concurrency
+        self._persist_concurrency = persist_concurrency
+        self._max_pending_windows = max_pending_windows
+        self._extract_executor = extract_executor
+        self._owns_executor = extract_executor is None
+        self._http_client = http_client
+        self._owns_client = http_client is None
+
+        self._embed_queue: Optional[asyncio.Queue] = None
+        self._persist_queue: Optional[asyncio.Queue] = None
+        self._workers: list[asyncio.Task] = []
+
+    # ---------------------------------------------------------
+    # Lifecycle
+    # ---------------------------------------------------------
+    async def start(self) -> None:
+        if self._workers:
+            return
+        if self._extract_executor is None:
+            # spawn: the parent runs threads (heartbeats, embedder pool)
+            self._extract_executor = ProcessPoolExecutor(
+                max_workers=self._extract_processes,
+                mp_context=mp.get_context("spawn"),
+            )
+        if self._http_client is None:
+            self._http_client = httpx.AsyncClient(
+                timeout=90,
+                limits=httpx.Limits(max_connections=self._persist_concurrency),
+            )
+        # Workers get the queues / client directly; the attributes stay
+        # Optional only to mark whether the pipeline is started.
+        http_client = self._http_client
+        embed_queue: asyncio.Queue = asyncio.Queue(maxsize=self._max_pending_windows)
+        persist_queue: asyncio.Queue = asyncio.Queue(maxsize=self._max_pending_windows)
+        self._embed_queue, self._persist_queue = embed_queue, persist_queue
+        self._workers = [
+            asyncio.create_task(
+                self._embed_worker(embed_queue, persist_queue), name=f"embed-{i}"
+            )
+            for i in range(self._embed_concurrency)
+        ] + [
+            asyncio.create_task(
+                self._persist_worker(persist_queue, http_client), name=f"persist-{i}"
+            )
+            for i in range(self._persist_concurrency)
+        ]
+
+    async def close(self) -> None:
+        for task in self._workers:
+            task.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+        if self._owns_client and self._http_client is not None:
+            await self._http_client.aclose()
+            self._http_client = None
+        if self._owns_executor and self._extract_executor is not None:
+            self._extract_executor.shutdown(wait=True)
+            self._extract_executor = None
+
+    async def __aenter__(self) -> "AsyncIngestionPipeline":
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    # ---------------------------------------------------------
+    # Public
+    # ---------------------------------------------------------
+    async def ingest(
+        self,
+        *,
+        ingestion_id: str,
+        file_bytes: bytes,
+        filename: str,
+        content_type: str,
+        ocr_provider: Optional[str] = None,
+        provider: str = "mock",
+        retry: bool = False,
+        cancel: Optional[threading.Event] = None,
+    ) -> str:
+        """
+        Ingest one upload; safe to await for many documents concurrently.
+        Returns document_id.
+
+        retry=True first discards the vectors and DocumentNode of an earlier
+        failed attempt of the same ingestion_id. Once `cancel` is set, the
+        document's remaining windows are neither embedded nor persisted and
+        ingest() raises IngestionCancelled.
+        """
+        embed_queue = self._embed_queue
+        if not self._workers or embed_queue is None:
+            raise RuntimeError("AsyncIngestionPipeline is not started")
+        loop = asyncio.get_running_loop()
+        if retry:
+            await asyncio.to_thread(
+                discard_previous_attempt, self._vector_store, ingestion_id
+            )
+
+        doc_type, chunks = await loop.run_in_executor(
+            self._extract_executor, prepare_chunks,
+            file_bytes, filename, content_type, ocr_provider, provider,
+        )
+        document_id = await asyncio.to_thread(
+            create_document, ingestion_id, doc_type, chunks
+        )
+        logger.debug(
+            f"📦 async ingest {ingestion_id}: {len(chunks)} chunks "
+            f"→ document {document_id}"
+        )
+
+        run = _DocumentRun(
+            ingestion_id=ingestion_id, document_id=document_id, cancel=cancel
+        )
+        windows: list[_Window] = []
+        offset = 0
+        for window_chunks in IngestionPipeline._windows(chunks, self._window_size):
+            if run.failure() is not None:
+                break  # an earlier window failed; stop feeding this document
+            window = _Window(
+                run=run, chunks=window_chunks, offset=offset,
+                done=loop.create_future(),
+            )
+            windows.append(window)
+            await embed_queue.put(window)
+            offset += len(window_chunks)
+
+        # Wait for every window (not just the first failure): none left dangling
+        await asyncio.gather(*(w.done for w in windows), return_exceptions=True)
+        if run.error is not None:
+            raise run.error
+        logger.info(f"✅ async ingest {ingestion_id}: persisted {offset} chunks")
+        return document_id
+
+    # ---------------------------------------------------------
+    # Stage workers
+    # ---------------------------------------------------------
+    async def _embed_worker(
+        self, embed_queue: asyncio.Queue, persist_queue: asyncio.Queue
+    ) -> None:
+        while True:
+            window: _Window = await embed_queue.get()
+            try:
+                if self._skip(window):
+                    continue
+                try:
+                    window.embeddings = await asyncio.to_thread(
+                        self._embedder.embed, window.chunks
+                    )
+                    if len(window.embeddings) != len(window.chunks):
+                        raise RuntimeError(
+                            f"Embedder returned {len(window.embeddings)} vectors "
+                            f"for {len(window.chunks)} chunks"
+                        )
+                except Exception as exc:
+                    self._fail(window, exc)
+                    continue
+                await persist_queue.put(window)
+            finally:
+                embed_queue.task_done()
+
+    async def _persist_worker(
+        self, persist_queue: asyncio.Queue, http_client: httpx.AsyncClient
+    ) -> None:
+        while True:
+            window: _Window = await persist_queue.get()
+            try:
+                if self._skip(window):
+                    continue
+                run = window.run
+                records = self._vector_store.build_records(
+                    window.chunks, window.embeddings,
+                    run.ingestion_id, run.document_id, window.offset,
+                )
+                try:
+                    resp = await http_client.post(
+                        f"{self._vector_store.base_url}/v1/vectors/batch",
+                        json={"records": records},
+                    )
+                    resp.raise_for_status()
+                except Exception as exc:
+                    self._fail(window, exc)
+                    continue
+                if not window.done.done():
+                    window.done.set_result(len(records))
+            finally:
+                persist_queue.task_done()
+
+    @staticmethod
+    def _skip(window: _Window) -> bool:
+        """Drop windows of a document that already failed or was cancelled."""
+        error = window.run.failure()
+        if error is None:
+            return False
+        if not window.done.done():
+            window.done.set_exception(error)
+        return True
+
+    @staticmethod
+    def _fail(window: _Window, exc: BaseException) -> None:
+        logger.error(
+            f"❌ async ingest {window.run.ingestion_id} "
+            f"window @{window.offset} failed: {exc}"
+        )
+        if window.run.error is None:
+            window.run.error = exc
+        if not window.done.done():
+            window.done.set_exception(exc)
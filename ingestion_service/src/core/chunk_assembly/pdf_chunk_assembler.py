@@ -1,11 +1,15 @@
 # src/ingestion_service/core/chunk_assembly/pdf_chunk_assembler.py
 from __future__ import annotations
 
-from typing import Dict, List, Set
+from itertools import tee
+from typing import Dict, Iterable, Iterator, List, Set
 
-from shared.chunks import Chunk
-from src.core.document_graph.models import DocumentGraph
+from shared.chunks import Chunk, iter_content_chunk_ids, shared_metadata
+from src.core.document_graph.models import DocumentGraph, GraphNode
 from shared.chunkers.selector import ChunkerFactory
+from shared.chunkers.tokenizer import DEFAULT_TOKENIZER, get_tokenizer
+
+BLOCK_SEPARATOR = "\n\n"
 
 
 class PDFChunkAssembler:
@@ -15,13 +19,41 @@ class PDFChunkAssembler:
     Rules:
     - Native text OR OCR text are chunked
     - Chunking is delegated to ChunkerFactory
-    - Chunk IDs are deterministic
+    - Chunk IDs are content hashes (stable across page shifts, so an
+      edited re-upload only re-embeds the chunks whose text changed)
     - Image → text associations are preserved in metadata
+
+    With merge_blocks=True, consecutive text blocks (same or adjacent page,
+    reading order) are packed into windows of up to target_tokens and each
+    window becomes one chunk, instead of one or more chunks per PyMuPDF
+    block. Blocks longer than target_tokens are chunked on their own as
+    before. page_numbers / artifact_ids / associated_image_ids list every
+    merged block.
+
+    `tokenizer` is passed to ChunkerFactory (token budgets) and sizes the
+    merged windows, so both paths budget in the same tokens and every chunk
+    carries a token_count.
+
+    iter_assemble() yields the same chunks lazily, block by block, for
+    callers that stream them into embedding windows.
     """
 
+    def __init__(
+        self,
+        merge_blocks: bool = False,
+        target_tokens: int = 256,
+        tokenizer: str = DEFAULT_TOKENIZER,
+    ):
+        if target_tokens < 1:
+            raise ValueError("target_tokens must be >= 1")
+        self.merge_blocks = merge_blocks
+        self.target_tokens = target_tokens
+        self.tokenizer = tokenizer
+
     def assemble(self, graph: DocumentGraph) -> List[Chunk]:
-        chunks: List[Chunk] = []
+        return list(self.iter_assemble(graph))
 
+    def iter_assemble(self, graph: DocumentGraph) -> Iterator[Chunk]:
         # ---------------------------------------------------------
         # Map image → text edges for associated_image_ids
         # ---------------------------------------------------------
@@ -30,49 +62,135 @@ class PDFChunkAssembler:
             if edge.relation == "image_to_text":
                 images_by_text.setdefault(edge.to_id, set()).add(edge.from_id)
 
+        if self.merge_blocks:
+            chunks = self._assemble_merged(graph, images_by_text)
+        else:
+            chunks = self._assemble_per_block(graph.nodes.values(), images_by_text)
+
+        # Ids are assigned document-wide so text repeated across pages
+        # (headers, footers) still gets unique ids; one chunk is buffered
+        # between the id generator and the output
+        chunks, id_source = tee(chunks)
+        chunk_ids = iter_content_chunk_ids(c.content for c in id_source)
+        for chunk, chunk_id in zip(chunks, chunk_ids):
+            chunk.chunk_id = chunk_id
+            yield chunk
+
+    @staticmethod
+    def _content(node: GraphNode) -> str:
+        """Prefer native text if present, otherwise OCR text ("" if neither)."""
+        return node.artifact.text or node.artifact.ocr_text or ""
+
+    def _assemble_per_block(
+        self, nodes: Iterable[GraphNode], images_by_text: Dict[str, Set[str]]
+    ) -> Iterator[Chunk]:
         # ---------------------------------------------------------
         # Create chunks from text or OCR text
         # ---------------------------------------------------------
-        for node in graph.nodes.values():
+        for node in nodes:
             artifact = node.artifact
 
             # Decide which text to use:
             # - Prefer native text if present
             # - Otherwise use OCR text (if any)
-            content_to_chunk: str | None = None
-            if artifact.text:
-                content_to_chunk = artifact.text
-            elif artifact.ocr_text:
-                content_to_chunk = artifact.ocr_text
+            content_to_chunk = self._content(node)
 
             if not content_to_chunk:
                 continue
 
             # Choose chunker dynamically
-            chunker, chunker_params = ChunkerFactory.choose_strategy(content_to_chunk)
+            chunker, chunker_params = ChunkerFactory.choose_strategy(
+                content_to_chunk, tokenizer=self.tokenizer
+            )
             chunk_strategy = getattr(chunker, "chunk_strategy", "unknown")
             chunker_name = getattr(chunker, "name", chunker.__class__.__name__)
 
-            produced_chunks = chunker.chunk(content_to_chunk, **chunker_params)
-
-            for idx, produced_chunk in enumerate(produced_chunks):
-                produced_chunk.chunk_id = f"{node.artifact_id}:chunk:{idx}"
-
-                associated_image_ids = list(images_by_text.get(node.artifact_id, []))
-                produced_chunk.metadata.update(
-                    {
-                        "source_file": artifact.source_file,
-                        "page_numbers": [artifact.page_number],
-                        "artifact_ids": [node.artifact_id],
-                        "associated_image_ids": associated_image_ids,
-                        "chunk_strategy": chunk_strategy,
-                        "chunker_name": chunker_name,
-                        "chunker_params": dict(chunker_params),
-                        # Optional: expose OCR text if this chunk came from OCR
-                        "ocr_text": artifact.ocr_text if artifact.ocr_text else None,
-                    }
-                )
-
-                chunks.append(produced_chunk)
-
-        return chunks
+            produced_chunks = chunker.iter_chunks(content_to_chunk, **chunker_params)
+
+            # Identical for every chunk of this block: one shared, read-only dict
+            metadata = shared_metadata(
+                {
+                    "source_file": artifact.source_file,
+                    "page_numbers": [artifact.page_number],
+                    "artifact_ids": [node.artifact_id],
+                    "associated_image_ids": list(
+                        images_by_text.get(node.artifact_id, [])
+                    ),
+                    "chunk_strategy": chunk_strategy,
+                    "chunker_name": chunker_name,
+                    "chunker_params": dict(chunker_params),
+                    # Optional: expose OCR text if this chunk came from OCR
+                    "ocr_text": artifact.ocr_text if artifact.ocr_text else None,
+                }
+            )
+            for produced_chunk in produced_chunks:
+                produced_chunk.metadata = metadata
+                yield produced_chunk
+
+    def _assemble_merged(
+        self, graph: DocumentGraph, images_by_text: Dict[str, Set[str]]
+    ) -> Iterator[Chunk]:
+        nodes = sorted(
+            (node for node in graph.nodes.values() if self._content(node)),
+            key=lambda n: (n.artifact.page_number, n.artifact.order_index),
+        )
+
+        tokenizer = get_tokenizer(self.tokenizer)
+        window: List[GraphNode] = []
+        window_tokens = 0
+
+        for node in nodes:
+            tokens = tokenizer.count(self._content(node))
+            if tokens > self.target_tokens:
+                # Oversized block: chunk it on its own, as in per-block mode
+                if window:
+                    yield self._window_chunk(window, images_by_text)
+                window, window_tokens = [], 0
+                yield from self._assemble_per_block([node], images_by_text)
+                continue
+
+            page_gap = (
+                node.artifact.page_number - window[-1].artifact.page_number
+                if window
+                else 0
+            )
+            if window and (
+                window_tokens + tokens > self.target_tokens or page_gap > 1
+            ):
+                yield self._window_chunk(window, images_by_text)
+                window, window_tokens = [], 0
+            window.append(node)
+            window_tokens += tokens
+
+        if window:
+            yield self._window_chunk(window, images_by_text)
+
+    def _window_chunk(
+        self, window: List[GraphNode], images_by_text: Dict[str, Set[str]]
+    ) -> Chunk:
+        artifact_ids = [node.artifact_id for node in window]
+        associated_image_ids: List[str] = []
+        for artifact_id in artifact_ids:
+            for image_id in sorted(images_by_text.get(artifact_id, ())):
+                if image_id not in associated_image_ids:
+                    associated_image_ids.append(image_id)
+        ocr_texts = [
+            node.artifact.ocr_text for node in window if node.artifact.ocr_text
+        ]
+        content = BLOCK_SEPARATOR.join(self._content(node) for node in window)
+
+        return Chunk(
+            chunk_id="",  # assigned document-wide in assemble()
+            content=content,
+            token_count=get_tokenizer(self.tokenizer).count(content),
+            metadata=shared_metadata({
+                "source_file": window[0].artifact.source_file,
+                "page_numbers": sorted({node.artifact.page_number for node in window}),
+                "artifact_ids": artifact_ids,
+                "associated_image_ids": associated_image_ids,
+                "chunk_strategy": "block_merge",
+                "chunker_name": self.__class__.__name__,
+                "chunker_params": {"target_tokens": self.target_tokens},
+                "ocr_text": BLOCK_SEPARATOR.join(ocr_texts) if ocr_texts else None,
+            }),
+        )
@@ -1,7 +1,7 @@
 # ingestion_service/src/core/chunkers/base.py
 from __future__ import annotations
 from abc import ABC, abstractmethod
-from typing import Any, List
+from typing import Any, Iterator, List
 
 from shared.chunks import Chunk
 
@@ -22,3 +22,10 @@ class BaseChunker(ABC):
         :return: list of Chunk objects
         """
         pass
+
+    def iter_chunks(self, content: Any, **params) -> Iterator[Chunk]:
+        """
+        chunk(), yielding chunks one at a time. Chunkers that can build
+        chunks lazily override this; the default materializes chunk().
+        """
+        return iter(self.chunk(content, **params))
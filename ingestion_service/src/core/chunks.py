@@ -4,9 +4,14 @@ from dataclasses import dataclass, field
 from typing import Any, Dict, Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class Chunk:
     chunk_id: str
     content: Any
     metadata: Dict[str, Any] = field(default_factory=dict)
     ocr_text: Optional[str] = None
+    # character offsets into the chunked source text, when known
+    char_start: Optional[int] = None
+    char_end: Optional[int] = None
+    # tokens in content, when chunked by a tokenizer (shared.chunkers.tokenizer)
+    token_count: Optional[int] = None
@@ -11,6 +11,53 @@ class Settings(BaseSettings):
     OLLAMA_BASE_URL: str = "http://host.docker.internal:11434"
     OLLAMA_EMBED_MODEL: str = "nomic-embed-text:v1.5"
     OLLAMA_BATCH_SIZE: int = 50  # default batch size for Ollama embedding
+    OLLAMA_MAX_CONCURRENCY: int = 4  # embedding batches in flight at once
+    OLLAMA_MAX_RETRIES: int = 3  # per-batch retries on transient errors
+
+    # Streaming pipeline: chunks per embed/persist window (0 = one shot)
+    INGEST_STREAM_WINDOW_SIZE: int = 256
+    INGEST_STREAM_MAX_PENDING_WINDOWS: int = 2
+
+    # Chunk sizes are token budgets for this tokenizer ("regex" or
+    # "hf:<path to tokenizer.json>", see shared.chunkers.tokenizer)
+    CHUNK_TOKENIZER: str = "regex"
+
+    # PDF extraction: worker processes per large PDF (1 = serial)
+    PDF_EXTRACT_WORKERS: int = 1
+    PDF_EXTRACT_MIN_PAGES_PER_WORKER: int = 32
+    # PDF chunk assembly: pack consecutive text blocks into chunks of up to
+    # TARGET_TOKENS (CHUNK_TOKENIZER tokens, like the 64/128/256 text budgets)
+    PDF_MERGE_BLOCKS: bool = True
+    PDF_MERGE_TARGET_TOKENS: int = 256
+    # Scanned PDFs: render + OCR pages with less than MIN_TEXT_CHARS of text
+    PDF_OCR_SCANNED_PAGES: bool = True
+    PDF_OCR_DPI: int = 300
+    PDF_OCR_MIN_TEXT_CHARS: int = 16
+    OCR_POOL_WORKERS: int = 0  # OCR processes; 0 = one per core
+    OCR_TIMEOUT_SECONDS: float = 120.0  # per image / page
+
+    # Embedding cache (shared.embedders.cache): in-process LRU + Postgres tier
+    EMBEDDING_CACHE_SIZE: int = 10_000  # LRU entries; 0 disables the memory tier
+    EMBEDDING_CACHE_PERSIST: bool = True  # store in DATABASE_URL's embedding_cache
+    EMBEDDING_CACHE_MAX_ROWS: int = 1_000_000
+
+    # Ingestion job queue (see src.core.job_queue / src.core.worker)
+    INGEST_SPOOL_DIR: str = "/var/lib/rag-foundry/spool"  # shared by API + workers
+    INGEST_WORKER_CONCURRENCY: int = 2
+    INGEST_MAX_ATTEMPTS: int = 3
+    INGEST_LEASE_SECONDS: int = 300
+    INGEST_RETRY_BACKOFF_SECONDS: float = 5.0
+    INGEST_RETRY_BACKOFF_MAX_SECONDS: float = 600.0
+    INGEST_POLL_INTERVAL_SECONDS: float = 1.0
+    # Overlapped asyncio pipeline (src.core.async_pipeline), per worker process
+    INGEST_ASYNC_PIPELINE: bool = False
+    INGEST_DOCS_IN_FLIGHT: int = 4
+    INGEST_EXTRACT_PROCESSES: int = 2
+    INGEST_EMBED_CONCURRENCY: int = 2
+    INGEST_PERSIST_CONCURRENCY: int = 4
+    # Byte-identical re-uploads: "skip" (return the existing ingestion),
+    # "link" (new completed ingestion pointing at it) or "reingest"
+    INGEST_DUPLICATE_POLICY: str = "skip"
 
     model_config = SettingsConfigDict(
         env_file=".env",
@@ -53,6 +53,28 @@ def get_document_node(
     )
 
 
+def reassign_document_node(
+    session: Session,
+    *,
+    document_id: UUID,
+    ingestion_id: UUID,
+    source: str,
+) -> Optional[DocumentNode]:
+    """
+    Point an existing DocumentNode at a newer ingestion (incremental update).
+
+    Returns None if the document does not exist.
+    """
+    node = get_document_node(session, document_id)
+    if node is None:
+        return None
+
+    node.ingestion_id = str(ingestion_id)
+    node.source = source
+    session.commit()
+    return node
+
+
 def list_document_nodes_by_ingestion(
     session: Session,
     ingestion_id: UUID,
@@ -66,6 +88,24 @@ def list_document_nodes_by_ingestion(
         .order_by(DocumentNode.document_id)
         .all()
     )
+
+
+def delete_document_nodes_by_ingestion(
+    session: Session,
+    ingestion_id: UUID,
+) -> int:
+    """
+    Delete every DocumentNode of an ingestion (with its relationships).
+
+    Returns the number of nodes deleted.
+    """
+    nodes = list_document_nodes_by_ingestion(session, ingestion_id)
+    for node in nodes:
+        session.delete(node)
+    session.commit()
+    return len(nodes)
+
+
 def update_document_node_summary(
     session, ingestion_id: UUID, summary: str
 ) -> bool:
@@ -13,20 +13,20 @@ RelationType = Literal[
 ]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class GraphNode:
     artifact_id: str
     artifact: ExtractedArtifact
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class GraphEdge:
     from_id: str
     to_id: str
     relation: RelationType
 
 
-@dataclass
+@dataclass(slots=True)
 class DocumentGraph:
     nodes: Dict[str, GraphNode]
     edges: List[GraphEdge]
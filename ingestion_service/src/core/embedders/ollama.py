@@ -5,6 +5,7 @@ from typing import List
 
 from shared.embedders.base import BaseEmbedder
 from shared.chunks import Chunk
+from shared.models.vector import Embedding, to_embedding
 
 logging.basicConfig(level=logging.DEBUG)
 
@@ -20,7 +21,7 @@ class OllamaEmbedder(BaseEmbedder):
         logging.debug("OllamaEmbedder self.base_url %s", self.base_url)
         logging.debug("OllamaEmbedder self.model %s", self.model)
 
-    def embed(self, chunks: List[Chunk]) -> List[List[float]]:
+    def embed(self, chunks: List[Chunk]) -> List[Embedding]:
         logging.debug(
             "OllamaEmbedder received %d items, types: %s",
             len(chunks),
@@ -41,10 +42,6 @@ class OllamaEmbedder(BaseEmbedder):
                 )
             result = response.json()
             logging.debug("OllamaEmbedder response.json: %s", result)
-            return (
-                result.get("embeddings", [result["embeddings"]])
-                if isinstance(texts, list)
-                else [result["embeddings"]]
-            )
+            return [to_embedding(vector) for vector in result["embeddings"]]
         except Exception as e:
             raise RuntimeError(f"Ollama embedder error: {e}") from e
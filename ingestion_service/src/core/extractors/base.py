@@ -3,7 +3,10 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import List, Literal, Optional, Tuple
+from typing import TYPE_CHECKING, List, Literal, Optional, Tuple
+
+if TYPE_CHECKING:
+    from src.core.extractors.images import ImageHandle
 
 # ---------------------------------------------------------------------------
 # Artifact model
@@ -12,7 +15,7 @@ from typing import List, Literal, Optional, Tuple
 ArtifactType = Literal["text", "image"]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ExtractedArtifact:
     """
     Internal representation of a document artifact extracted from a source file.
@@ -21,6 +24,7 @@ class ExtractedArtifact:
     - internal-only (not persisted, not exposed via API)
     - immutable (safe to pass between pipeline stages)
     - provenance-aware (page number, order index)
+    - slotted (no per-instance __dict__; large PDFs create many of these)
     """
 
     # artifact classification
@@ -34,6 +38,8 @@ class ExtractedArtifact:
     # content (one of these must be populated depending on type)
     text: Optional[str] = None
     image_bytes: Optional[bytes] = None
+    # lazy alternative to image_bytes; decoded on demand (see load_image)
+    image: Optional["ImageHandle"] = None
 
     # NEW: OCR text for images
     ocr_text: Optional[str] = None
@@ -41,6 +47,16 @@ class ExtractedArtifact:
     # layout metadata (optional, for future use)
     bbox: Optional[Tuple[float, float, float, float]] = None
 
+    @property
+    def has_image(self) -> bool:
+        return self.image_bytes is not None or self.image is not None
+
+    def load_image(self) -> Optional[bytes]:
+        """Image bytes, decoding the lazy handle if needed."""
+        if self.image_bytes is not None:
+            return self.image_bytes
+        return self.image.load() if self.image is not None else None
+
 
 # ---------------------------------------------------------------------------
 # Extractor interface
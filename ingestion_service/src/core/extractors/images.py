@@ -0,0 +1,141 @@
+# ingestion_service/src/core/extractors/images.py
+from __future__ import annotations
+
+import hashlib
+import threading
+from typing import TYPE_CHECKING, Dict, Iterable, Optional
+
+import fitz  # PyMuPDF
+
+if TYPE_CHECKING:
+    from src.core.extractors.base import ExtractedArtifact
+
+
+class ImageHandle:
+    """
+    Lazy reference to one embedded PDF image (by xref).
+
+    Bytes are decoded on first load() and shared by every artifact that
+    references the same xref, or a different xref with identical content.
+
+    Handles pickle as the bare xref (no PDF bytes), so results coming back
+    from a process pool are unbound until PDFExtractor rebinds them.
+    """
+
+    __slots__ = ("xref", "_source")
+
+    def __init__(self, xref: int, source: Optional["PDFImageSource"]) -> None:
+        self.xref = xref
+        self._source = source
+
+    def __getstate__(self) -> tuple:
+        return (self.xref, None)
+
+    def __setstate__(self, state: tuple) -> None:
+        self.xref, self._source = state
+
+    def load(self) -> Optional[bytes]:
+        return self._bound().load(self.xref)
+
+    @property
+    def content_hash(self) -> Optional[str]:
+        """SHA-256 of the image bytes (decodes the image if needed)."""
+        return self._bound().content_hash(self.xref)
+
+    def _bound(self) -> "PDFImageSource":
+        if self._source is None:
+            raise RuntimeError(f"ImageHandle(xref={self.xref}) is not bound to a PDF")
+        return self._source
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, ImageHandle) or self.xref != other.xref:
+            return False
+        if self._source is other._source:
+            return True
+        return (
+            self._source is not None
+            and other._source is not None
+            and self._source.file_bytes == other._source.file_bytes
+        )
+
+    def __hash__(self) -> int:
+        return hash(self.xref)
+
+    def __repr__(self) -> str:
+        return f"ImageHandle(xref={self.xref})"
+
+
+class PDFImageSource:
+    """
+    Per-document image decoder and dedup cache.
+
+    - One ImageHandle per xref (a logo on every page is one handle).
+    - Decoded bytes are stored once per distinct content hash, so different
+      xrefs carrying the same image share one bytes object.
+    - Thread-safe; the fitz document is opened on first load.
+    - close() (or release_images()) closes the document and drops the
+      decoded bytes once OCR / enrichment is done with them; a later
+      load() reopens and decodes again.
+    """
+
+    def __init__(self, file_bytes: bytes) -> None:
+        self.file_bytes = file_bytes
+        self._doc = None
+        self._lock = threading.Lock()
+        self._handles: Dict[int, ImageHandle] = {}
+        self._hash_by_xref: Dict[int, Optional[str]] = {}
+        self._bytes_by_hash: Dict[str, bytes] = {}
+        self.decodes = 0
+
+    def handle(self, xref: int) -> ImageHandle:
+        with self._lock:
+            handle = self._handles.get(xref)
+            if handle is None:
+                handle = self._handles[xref] = ImageHandle(xref, self)
+            return handle
+
+    def load(self, xref: int) -> Optional[bytes]:
+        with self._lock:
+            digest = self._decode(xref)
+            return self._bytes_by_hash.get(digest) if digest else None
+
+    def content_hash(self, xref: int) -> Optional[str]:
+        with self._lock:
+            return self._decode(xref)
+
+    def close(self) -> None:
+        """Close the fitz document and release the decode cache."""
+        with self._lock:
+            if self._doc is not None:
+                self._doc.close()
+                self._doc = None
+            self._hash_by_xref.clear()
+            self._bytes_by_hash.clear()
+
+    def _decode(self, xref: int) -> Optional[str]:
+        """Decode xref once; returns its content hash (None = no image data)."""
+        if xref in self._hash_by_xref:
+            return self._hash_by_xref[xref]
+
+        if self._doc is None:
+            self._doc = fitz.open(stream=self.file_bytes, filetype="pdf")
+        image_bytes = self._doc.extract_image(xref).get("image")
+        self.decodes += 1
+
+        digest: Optional[str] = None
+        if image_bytes:
+            digest = hashlib.sha256(image_bytes).hexdigest()
+            self._bytes_by_hash.setdefault(digest, image_bytes)
+        self._hash_by_xref[xref] = digest
+        return digest
+
+
+def release_images(artifacts: Iterable["ExtractedArtifact"]) -> None:
+    """close() every PDFImageSource behind the image handles of `artifacts`."""
+    sources = {}
+    for artifact in artifacts:
+        source = artifact.image._source if artifact.image is not None else None
+        if source is not None:
+            sources[id(source)] = source
+    for source in sources.values():
+        source.close()
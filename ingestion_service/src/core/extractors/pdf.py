@@ -1,12 +1,108 @@
 # ingestion_service/src/core/extractors/pdf.py
 from __future__ import annotations
-from typing import List, Tuple
+import multiprocessing as mp
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import replace
+from typing import Any, Dict, List, Tuple
 import fitz  # PyMuPDF
 
 from src.core.extractors.base import DocumentExtractor, ExtractedArtifact
+from src.core.extractors.images import PDFImageSource
+
+
+def _extract_page_range(
+    doc, images: PDFImageSource, source_name: str, start: int, stop: int
+) -> List[ExtractedArtifact]:
+    """
+    Extract pages [start, stop) of an open document.
+
+    Images are not decoded here: each artifact gets a lazy handle from
+    `images`, shared by every occurrence of the same xref.
+
+    order_index is numbered from 0 within the range; callers merging several
+    ranges renumber them (see PDFExtractor._merge).
+    """
+    artifacts: List[ExtractedArtifact] = []
+    order_index = 0
+
+    for page_idx in range(start, stop):
+        page = doc[page_idx]
+        page_number = page_idx + 1
+
+        # ---- TEXT BLOCKS ----
+        for block in page.get_text("blocks"):
+            x0, y0, x1, y1, text, *_ = block
+            if not text or not text.strip():
+                continue
+
+            # Ensure bbox values are floats
+            bbox: Tuple[float, float, float, float] = (
+                float(x0),
+                float(y0),
+                float(x1),
+                float(y1),
+            )
+
+            artifacts.append(
+                ExtractedArtifact(
+                    type="text",
+                    source_file=source_name,
+                    page_number=page_number,
+                    order_index=order_index,
+                    text=str(text).strip(),
+                    bbox=bbox,
+                )
+            )
+            order_index += 1
+
+        # ---- IMAGES ----
+        for img in page.get_images(full=True):
+            xref = img[0]
+            artifacts.append(
+                ExtractedArtifact(
+                    type="image",
+                    source_file=source_name,
+                    page_number=page_number,
+                    order_index=order_index,
+                    image=images.handle(xref),
+                )
+            )
+            order_index += 1
+
+    return artifacts
+
+
+def _extract_pages_worker(
+    file_bytes: bytes, source_name: str, start: int, stop: int
+) -> List[ExtractedArtifact]:
+    """Process-pool entry point: open the document once, extract one page range."""
+    with fitz.open(stream=file_bytes, filetype="pdf") as doc:
+        return _extract_page_range(
+            doc, PDFImageSource(file_bytes), source_name, start, stop
+        )
 
 
 class PDFExtractor(DocumentExtractor):
+    """
+    Extracts text blocks and images from a PDF.
+
+    With max_workers > 1, documents of at least 2 * min_pages_per_worker
+    pages are split into contiguous page ranges, one per worker process.
+    Ranges are merged back in page order and order_index is renumbered, so
+    the output is identical to the serial path.
+
+    Image artifacts carry lazy ImageHandles (see extractors.images): bytes
+    are decoded only when OCR or storage asks for them, once per xref.
+    """
+
+    def __init__(self, max_workers: int = 1, min_pages_per_worker: int = 32):
+        if max_workers < 1:
+            raise ValueError("max_workers must be >= 1")
+        if min_pages_per_worker < 1:
+            raise ValueError("min_pages_per_worker must be >= 1")
+        self.max_workers = max_workers
+        self.min_pages_per_worker = min_pages_per_worker
+
     def extract(self, file_bytes: bytes, source_name: str) -> List[ExtractedArtifact]:
         """
         Extracts text blocks and images from a PDF.
@@ -18,61 +114,59 @@ class PDFExtractor(DocumentExtractor):
         Returns:
             List of ExtractedArtifact objects.
         """
-        artifacts: List[ExtractedArtifact] = []
-        order_index = 0
-
         try:
             doc = fitz.open(stream=file_bytes, filetype="pdf")
         except Exception as exc:
             raise ValueError("Invalid or unreadable PDF") from exc
 
-        for page_idx in range(len(doc)):
-            page = doc[page_idx]
-            page_number = page_idx + 1
-
-            # ---- TEXT BLOCKS ----
-            for block in page.get_text("blocks"):
-                x0, y0, x1, y1, text, *_ = block
-                if not text or not text.strip():
-                    continue
-
-                # Ensure bbox values are floats
-                bbox: Tuple[float, float, float, float] = (
-                    float(x0),
-                    float(y0),
-                    float(x1),
-                    float(y1),
-                )
+        images = PDFImageSource(file_bytes)
+        with doc:
+            ranges = self._page_ranges(len(doc))
+            if len(ranges) <= 1:
+                return _extract_page_range(doc, images, source_name, 0, len(doc))
 
-                artifacts.append(
-                    ExtractedArtifact(
-                        type="text",
-                        source_file=source_name,
-                        page_number=page_number,
-                        order_index=order_index,
-                        text=str(text).strip(),
-                        bbox=bbox,
-                    )
-                )
-                order_index += 1
-
-            # ---- IMAGES ----
-            for img in page.get_images(full=True):
-                xref = img[0]
-                image_dict = doc.extract_image(xref)
-                image_bytes = image_dict.get("image")
-                if not image_bytes:
-                    continue
-
-                artifacts.append(
-                    ExtractedArtifact(
-                        type="image",
-                        source_file=source_name,
-                        page_number=page_number,
-                        order_index=order_index,
-                        image_bytes=image_bytes,
-                    )
-                )
-                order_index += 1
+        # spawn: callers (API, queue workers) run threads; don't fork them
+        with ProcessPoolExecutor(
+            max_workers=len(ranges), mp_context=mp.get_context("spawn")
+        ) as pool:
+            parts = list(pool.map(
+                _extract_pages_worker,
+                [file_bytes] * len(ranges),
+                [source_name] * len(ranges),
+                [start for start, _ in ranges],
+                [stop for _, stop in ranges],
+            ))
+        return self._merge(parts, images)
+
+    def _page_ranges(self, page_count: int) -> List[Tuple[int, int]]:
+        """Split [0, page_count) into at most max_workers contiguous ranges."""
+        workers = min(self.max_workers, page_count // self.min_pages_per_worker)
+        if workers <= 1:
+            return [(0, page_count)]
+        size, extra = divmod(page_count, workers)
+        ranges: List[Tuple[int, int]] = []
+        start = 0
+        for i in range(workers):
+            stop = start + size + (1 if i < extra else 0)
+            ranges.append((start, stop))
+            start = stop
+        return ranges
 
-        return artifacts
+    @staticmethod
+    def _merge(
+        parts: List[List[ExtractedArtifact]], images: PDFImageSource
+    ) -> List[ExtractedArtifact]:
+        """
+        Concatenate per-range results in page order with a global order_index.
+
+        Image handles come back from the workers unbound; rebind them to
+        `images` so the whole document shares one decode cache.
+        """
+        merged: List[ExtractedArtifact] = []
+        for part in parts:
+            for artifact in part:
+                changes: Dict[str, Any] = {"order_index": len(merged)}
+                if artifact.image is not None:
+                    changes["image"] = images.handle(artifact.image.xref)
+                merged.append(replace(artifact, **changes))
+        return merged
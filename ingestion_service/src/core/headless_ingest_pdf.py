@@ -1,12 +1,18 @@
 # src/ingestion_service/core/headless_ingest_pdf.py
 from __future__ import annotations
-from typing import List
+import logging
+from typing import List, Optional
 from src.core.extractors.pdf import PDFExtractor
 from src.core.document_graph.builder import DocumentGraphBuilder
 from src.core.chunk_assembly.pdf_chunk_assembler import PDFChunkAssembler
 from src.core.pipeline import IngestionPipeline
 from shared.chunks import Chunk
 from src.core.extractors.base import ExtractedArtifact
+from src.core.extractors.images import release_images
+from src.core.ocr.pool import OCRPool, get_ocr_pool
+from src.core.ocr.prefilter import OCRStats
+
+logger = logging.getLogger(__name__)
 
 
 class HeadlessPDFIngestor:
@@ -19,42 +25,47 @@ class HeadlessPDFIngestor:
     - Persists embeddings to vector store
     """
 
-    def __init__(self, pipeline: IngestionPipeline, ocr_provider: str = "default"):
+    def __init__(
+        self,
+        pipeline: IngestionPipeline,
+        ocr_provider: str = "default",
+        ocr_pool: Optional[OCRPool] = None,
+    ):
         self.pipeline = pipeline
         self.ocr_provider = ocr_provider
+        self.ocr_pool = ocr_pool
 
     def _run_ocr_and_expand_artifacts(
-        self, artifacts: List[ExtractedArtifact]
+        self, artifacts: List[ExtractedArtifact], stats: Optional[OCRStats] = None
     ) -> List[ExtractedArtifact]:
         """
         Given a list of artifacts, run OCR on image artifacts.
         If OCR produced text, create a new text artifact for OCR text,
         preserving order and provenance deterministically.
+
+        Images are OCR'd in parallel (and cached by content) by the OCR pool;
+        `stats` collects skipped / processed counts.
         """
         enriched: List[ExtractedArtifact] = []
+        ocr_pool = self.ocr_pool or get_ocr_pool(self.ocr_provider)
 
-        for artifact in artifacts:
+        enriched_artifacts = ocr_pool.enrich(artifacts, stats)
+        for artifact, image_with_ocr in zip(artifacts, enriched_artifacts):
             enriched.append(artifact)
 
-            if artifact.type == "image" and artifact.image_bytes:
-                # Run OCR on image
-                from src.core.ocr.utils import enrich_image_with_ocr
-
-                image_with_ocr = enrich_image_with_ocr(artifact, self.ocr_provider)
-
-                if image_with_ocr.ocr_text:
-                    # Create a synthetic text artifact representing the OCR text
-                    # Keep the same page but a slightly greater order_index
-                    ocr_artifact = ExtractedArtifact(
-                        type="text",
-                        source_file=image_with_ocr.source_file,
-                        page_number=image_with_ocr.page_number,
-                        order_index=artifact.order_index
-                        + 1,  # deterministic after image
-                        text=image_with_ocr.ocr_text,
-                        image_bytes=None,
-                    )
-                    enriched.append(ocr_artifact)
+            if image_with_ocr.ocr_text:
+                # Create a synthetic text artifact representing the OCR text
+                # Keep the same page but a slightly greater order_index
+                ocr_artifact = ExtractedArtifact(
+                    type="text",
+                    source_file=image_with_ocr.source_file,
+                    page_number=image_with_ocr.page_number,
+                    order_index=artifact.order_index
+                    + 1,  # deterministic after image
+                    text=image_with_ocr.ocr_text,
+                    image_bytes=None,
+                )
+                enriched.append(ocr_artifact)
 
         return enriched
 
@@ -66,7 +77,12 @@ class HeadlessPDFIngestor:
         artifacts = extractor.extract(file_bytes, source_name)
 
         # NEW: integrate OCR text as new text artifacts
-        artifacts = self._run_ocr_and_expand_artifacts(artifacts)
+        ocr_stats = OCRStats()
+        try:
+            artifacts = self._run_ocr_and_expand_artifacts(artifacts, ocr_stats)
+        finally:
+            release_images(artifacts)  # OCR was the last reader of image bytes
+        logger.info(f"🖼️ OCR for {ingestion_id}: {ocr_stats.as_dict()}")
 
         # 2️⃣ Build document graph
         graph_builder = DocumentGraphBuilder()
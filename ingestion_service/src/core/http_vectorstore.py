@@ -1,9 +1,10 @@
 # ingestion_service/src/core/http_vectorstore.py
 import requests
-from typing import List, Any
+from typing import Dict, List, Any, Optional, Tuple
 import logging
 
 from shared.chunks import Chunk
+from shared.models.vector import encode_embedding
 
 logger = logging.getLogger(__name__)
 
@@ -23,41 +24,130 @@ class HttpVectorStore:
         embeddings: List[Any], 
         ingestion_id: str,
         document_id: str = None,  # MS6-IS1: NEW - Link to DocumentNode
+        chunk_index_offset: int = 0,
     ) -> None:
         """
         Dual-write: legacy vectors + new vector_chunks (MS6).
+
+        chunk_index_offset is the document-wide index of chunks[0], for
+        callers that persist a document window by window.
         """
         logger.debug("HttpVectorStore persist")
-        records = []
-        for i, (chunk, embedding) in enumerate(zip(chunks, embeddings)):
-            metadata_dict = dict(chunk.metadata or {})
-            metadata_dict["chunk_text"] = chunk.content
-
-            # Create the record
-            record = {
-                "vector": embedding,
-                "metadata": {
-                    "ingestion_id": ingestion_id,
-                    "chunk_id": chunk.chunk_id,
-                    "chunk_index": i,
-                    "chunk_strategy": chunk.metadata.get("chunk_strategy", "unknown"),
-                    "chunk_text": chunk.content,
-                    "source_metadata": metadata_dict,
-                    "provider": chunk.metadata.get("provider", self.provider),
-                },
-            }
-            logger.debug("HttpVectorStore persist document_id check")
-            # MS6-IS2: Add document_id for new vector_chunks path
-            if document_id:
-                logger.debug("HttpVectorStore persist document_id exists")
-                record["metadata"]["document_id"] = str(document_id)
-            
-            records.append(record)
+        records = self.build_records(
+            chunks, embeddings, ingestion_id, document_id, chunk_index_offset
+        )
 
         # Dual-write to vector_store_service (handles both tables internally)
         self.add_vectors(records)
         logger.info(f"Persisted {len(records)} vectors for ingestion {ingestion_id}{' with document_id ' + document_id if document_id else ''}")
 
+    def build_records(
+        self,
+        chunks: List[Chunk],
+        embeddings: List[Any],
+        ingestion_id: str,
+        document_id: Optional[str] = None,
+        chunk_index_offset: int = 0,
+    ) -> List[Dict[str, Any]]:
+        """
+        /v1/vectors/batch records for `chunks`, numbered from
+        chunk_index_offset. Shared with AsyncIngestionPipeline, which posts
+        them itself.
+        """
+        return [
+            self._record(
+                chunk, embedding, chunk_index_offset + i, ingestion_id, document_id
+            )
+            for i, (chunk, embedding) in enumerate(zip(chunks, embeddings))
+        ]
+
+    def _record(
+        self,
+        chunk: Chunk,
+        embedding: Any,
+        chunk_index: int,
+        ingestion_id: str,
+        document_id: Optional[str],
+    ) -> Dict[str, Any]:
+        metadata_dict = dict(chunk.metadata or {})
+        metadata_dict["chunk_text"] = chunk.content
+        if chunk.char_start is not None:
+            metadata_dict["char_start"] = chunk.char_start
+            metadata_dict["char_end"] = chunk.char_end
+
+        # float32 bytes as base64 instead of a JSON list of floats
+        record = {
+            "vector_b64": encode_embedding(embedding),
+            "metadata": {
+                "ingestion_id": ingestion_id,
+                "chunk_id": chunk.chunk_id,
+                "chunk_index": chunk_index,
+                "chunk_strategy": chunk.metadata.get("chunk_strategy", "unknown"),
+                "chunk_text": chunk.content,
+                "source_metadata": metadata_dict,
+                "provider": chunk.metadata.get("provider", self.provider),
+            },
+        }
+        # MS6-IS2: Add document_id for new vector_chunks path
+        if document_id:
+            record["metadata"]["document_id"] = str(document_id)
+        if chunk.token_count is not None:
+            record["metadata"]["token_count"] = chunk.token_count
+        return record
+
+    def list_document_chunks(
+        self, document_id: str, page_size: int = 1000
+    ) -> List[Dict[str, Any]]:
+        """All stored chunks of a document, in chunk_index order."""
+        url = f"{self.base_url}/v1/vectors/by-document/{document_id}"
+        params: Dict[str, Any] = {"limit": page_size}
+        chunks: List[Dict[str, Any]] = []
+        while True:
+            resp = requests.get(url, params=params, timeout=90)
+            resp.raise_for_status()
+            body = resp.json()
+            chunks.extend(body.get("chunks", []))
+            if not body.get("next_cursor"):
+                return chunks
+            params["cursor"] = body["next_cursor"]
+
+    def sync_document(
+        self,
+        *,
+        document_id: str,
+        ingestion_id: str,
+        keep: List[Tuple[str, int, Optional[int], Optional[int]]],
+        changed: List[Tuple[int, Chunk]],
+        embeddings: List[Any],
+    ) -> Dict[str, Any]:
+        """
+        Send an incremental document update: `keep` = (chunk_id, chunk_index,
+        char_start, char_end) of unchanged stored chunks at their new
+        position, `changed` = (chunk_index, chunk) pairs with their
+        `embeddings`.
+        """
+        records = [
+            self._record(chunk, embedding, chunk_index, ingestion_id, document_id)
+            for (chunk_index, chunk), embedding in zip(changed, embeddings)
+        ]
+        url = f"{self.base_url}/v1/vectors/by-document/{document_id}/sync"
+        payload = {
+            "ingestion_id": ingestion_id,
+            "keep": [
+                {
+                    "chunk_id": cid,
+                    "chunk_index": idx,
+                    "char_start": start,
+                    "char_end": end,
+                }
+                for cid, idx, start, end in keep
+            ],
+            "records": records,
+        }
+        resp = requests.post(url, json=payload, timeout=90)
+        resp.raise_for_status()
+        return resp.json()
+
     def add_vectors(self, records: List[dict]):
         """Send a batch of vectors to vector_store_service."""
         url = f"{self.base_url}/v1/vectors/batch"
@@ -65,12 +155,26 @@ class HttpVectorStore:
         resp.raise_for_status()
         return resp.json()
 
-    def similarity_search(self, query_vector: List[float], k: int = 5):
-        """Search the vector store for top-k similar vectors."""
+    def similarity_search(
+        self,
+        query_vector: Any,
+        k: int = 5,
+        filters: Optional[Dict[str, Any]] = None,
+    ):
+        """
+        Search the vector store for top-k similar vectors.
+
+        :param filters: optional metadata filters applied server-side
+            (ingestion_id, document_ids, provider, chunk_strategy, source_metadata)
+        """
         url = f"{self.base_url}/v1/vectors/search"
-        resp = requests.post(
-            url, json={"query_vector": query_vector, "k": k},  timeout=90
-        )
+        payload: Dict[str, Any] = {
+            "query_vector_b64": encode_embedding(query_vector),
+            "k": k,
+        }
+        if filters:
+            payload["filters"] = filters
+        resp = requests.post(url, json=payload, timeout=90)
         resp.raise_for_status()
         return resp.json()
 
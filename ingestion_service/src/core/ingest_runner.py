@@ -0,0 +1,260 @@
+# ingestion_service/src/core/ingest_runner.py
+"""
+File ingestion work, shared by the API and the queue workers.
+
+`ingest_file_bytes` performs extraction → chunking → embedding → persist
+for one upload and raises on failure; status bookkeeping is left to the
+caller (see src.core.worker). Retries (attempt > 1) first discard what the
+failed attempt wrote, so they never duplicate vectors or DocumentNodes.
+"""
+import logging
+import threading
+from itertools import chain
+from typing import Iterator, Optional
+from uuid import UUID
+
+import httpx
+
+from src.core.pipeline import IngestionPipeline
+from src.core.http_vectorstore import HttpVectorStore
+from src.core.config import get_settings
+from shared.embedders.factory import get_embedder
+from src.core.ocr.ocr_factory import get_ocr_engine
+from src.core.extractors.pdf import PDFExtractor
+from src.core.document_graph.builder import DocumentGraphBuilder
+from src.core.document_graph.models import DocumentGraph
+from src.core.extractors.base import ExtractedArtifact
+from src.core.extractors.images import release_images
+from src.core.chunk_assembly.pdf_chunk_assembler import PDFChunkAssembler
+from src.core.ocr.pool import get_ocr_pool
+from src.core.ocr.prefilter import OCRStats
+from src.core.ocr.scanned_pages import ocr_scanned_pages
+from shared.chunks import Chunk
+
+logger = logging.getLogger(__name__)
+
+SUMMARY_URL = "http://llm-service:8000/v1/summarize/{ingestion_id}"
+
+
+class NoOpValidator:
+    def validate(self, text: str) -> None:
+        return None
+
+
+def build_embedder():
+    settings = get_settings()
+    return get_embedder(
+        provider=settings.EMBEDDING_PROVIDER,
+        ollama_base_url=settings.OLLAMA_BASE_URL,
+        ollama_model=settings.OLLAMA_EMBED_MODEL,
+        ollama_batch_size=settings.OLLAMA_BATCH_SIZE,
+        ollama_max_concurrency=settings.OLLAMA_MAX_CONCURRENCY,
+        ollama_max_retries=settings.OLLAMA_MAX_RETRIES,
+        embedding_cache_size=settings.EMBEDDING_CACHE_SIZE,
+        embedding_cache_dsn=(
+            settings.DATABASE_URL if settings.EMBEDDING_CACHE_PERSIST else None
+        ),
+        embedding_cache_max_rows=settings.EMBEDDING_CACHE_MAX_ROWS,
+    )
+
+
+def _build_pipeline(provider: str) -> IngestionPipeline:
+    settings = get_settings()
+    embedder = build_embedder()
+    vector_store = HttpVectorStore(
+        base_url=settings.VECTOR_STORE_SERVICE_URL, provider=provider
+    )
+    return IngestionPipeline(
+        validator=NoOpValidator(),
+        embedder=embedder,
+        vector_store=vector_store,
+        window_size=settings.INGEST_STREAM_WINDOW_SIZE,
+        max_pending_windows=settings.INGEST_STREAM_MAX_PENDING_WINDOWS,
+        tokenizer=settings.CHUNK_TOKENIZER,
+    )
+
+
+def build_pdf_extractor() -> PDFExtractor:
+    settings = get_settings()
+    return PDFExtractor(
+        max_workers=settings.PDF_EXTRACT_WORKERS,
+        min_pages_per_worker=settings.PDF_EXTRACT_MIN_PAGES_PER_WORKER,
+    )
+
+
+def assemble_pdf_chunks(
+    file_bytes: bytes, filename: str, ocr_provider: Optional[str]
+) -> list[Chunk]:
+    """extract → OCR of pages without a text layer → graph → chunks."""
+    return list(iter_pdf_chunks(file_bytes, filename, ocr_provider))
+
+
+def iter_pdf_chunks(
+    file_bytes: bytes, filename: str, ocr_provider: Optional[str]
+) -> Iterator[Chunk]:
+    """
+    assemble_pdf_chunks() with the chunks built lazily, for the streaming
+    pipeline. Extraction and OCR run up front, and a PDF without any
+    text still raises here rather than once the iterator is consumed.
+    """
+    settings = get_settings()
+    artifacts = build_pdf_extractor().extract(
+        file_bytes=file_bytes, source_name=filename
+    )
+    try:
+        graph = _pdf_graph(file_bytes, filename, artifacts, ocr_provider)
+    finally:
+        release_images(artifacts)  # no image bytes are needed past the graph
+
+    assembler = PDFChunkAssembler(
+        merge_blocks=settings.PDF_MERGE_BLOCKS,
+        target_tokens=settings.PDF_MERGE_TARGET_TOKENS,
+        tokenizer=settings.CHUNK_TOKENIZER,
+    )
+    chunks = assembler.iter_assemble(graph)
+    first = next(chunks, None)
+    if first is None:
+        raise RuntimeError("No extractable text found in uploaded PDF")
+    return chain([first], chunks)
+
+
+def _pdf_graph(
+    file_bytes: bytes,
+    filename: str,
+    artifacts: list[ExtractedArtifact],
+    ocr_provider: Optional[str],
+) -> DocumentGraph:
+    """OCR of pages without a text layer (when enabled) → document graph."""
+    settings = get_settings()
+    if settings.PDF_OCR_SCANNED_PAGES:
+        stats = OCRStats()
+        pool = get_ocr_pool(
+            ocr_provider or "tesseract",
+            max_workers=settings.OCR_POOL_WORKERS,
+            timeout=settings.OCR_TIMEOUT_SECONDS,
+        )
+        artifacts = ocr_scanned_pages(
+            file_bytes, filename, artifacts, pool,
+            dpi=settings.PDF_OCR_DPI,
+            min_text_chars=settings.PDF_OCR_MIN_TEXT_CHARS,
+            stats=stats,
+        )
+        if stats.processed or stats.skipped or stats.failed:
+            logger.info(f"🖼️ OCR for {filename}: {stats.as_dict()}")
+    return DocumentGraphBuilder().build(artifacts)
+
+
+def extract_text_from_bytes(
+    file_bytes: bytes,
+    filename: str,
+    content_type: str,
+    ocr_provider: Optional[str],
+) -> str:
+    # Images → OCR
+    image_suffixes = (".png", ".jpg", ".jpeg", ".tiff")
+    if content_type.startswith("image/") or filename.lower().endswith(image_suffixes):
+        logger.info(f"🖼️ OCR processing: {filename}")
+        ocr_engine = get_ocr_engine(ocr_provider or "tesseract")
+        return ocr_engine.extract_text(file_bytes) or ""
+
+    # Text files → Robust multi-encoding decoder
+    encodings = [
+        'utf-8', 'utf-8-sig', 'windows-1252', 'latin-1', 'cp1252', 'iso-8859-1'
+    ]
+
+    for encoding in encodings:
+        try:
+            text = file_bytes.decode(encoding)
+            logger.debug(f"✅ Decoded {filename} as {encoding}")
+            return text
+        except UnicodeDecodeError:
+            logger.debug(f"Failed {encoding} for {filename}, trying next...")
+            continue
+
+    # Final fallback: latin-1 ignores errors
+    logger.warning(f"⚠️ Using fallback decoder for {filename}")
+    return file_bytes.decode('latin-1', errors='ignore')
+
+
+def ingest_file_bytes(
+    *,
+    ingestion_id: UUID,
+    file_bytes: bytes,
+    filename: str,
+    content_type: str,
+    metadata: dict,
+    attempt: int = 1,
+    cancel: Optional[threading.Event] = None,
+) -> None:
+    """
+    Ingest one upload. `cancel` stops a fresh ingestion between windows
+    (see IngestionPipeline); updates are a single sync call and ignore it.
+    """
+    settings = get_settings()
+    provider = settings.EMBEDDING_PROVIDER
+    pipeline = _build_pipeline(provider)
+
+    is_pdf = filename.endswith(".pdf") or content_type == "application/pdf"
+    ocr_provider = metadata.get("ocr_provider")
+
+    # Incremental update of an existing document (see IngestionPipeline.update_document)
+    update_document_id = metadata.get("update_document_id")
+    if update_document_id:
+        if is_pdf:
+            chunks = assemble_pdf_chunks(file_bytes, filename, ocr_provider)
+            pipeline.update_document(
+                document_id=update_document_id,
+                ingestion_id=str(ingestion_id),
+                chunks=chunks,
+            )
+        else:
+            text = extract_text_from_bytes(
+                file_bytes=file_bytes,
+                filename=filename,
+                content_type=content_type,
+                ocr_provider=ocr_provider,
+            )
+            if not text.strip():
+                raise RuntimeError("No extractable text found in uploaded file")
+            pipeline.update_document(
+                document_id=update_document_id,
+                ingestion_id=str(ingestion_id),
+                text=text,
+                source_type="file",
+                provider=provider,
+            )
+        return
+
+    # Sync of an update is idempotent; a fresh ingestion is not
+    if attempt > 1:
+        pipeline.discard_previous_attempt(str(ingestion_id))
+
+    # PDF handling
+    if is_pdf:
+        chunks = iter_pdf_chunks(file_bytes, filename, ocr_provider)
+        pipeline.run_with_chunks(
+            chunks=chunks, ingestion_id=str(ingestion_id), cancel=cancel
+        )
+    else:
+        text = extract_text_from_bytes(
+            file_bytes=file_bytes,
+            filename=filename,
+            content_type=content_type,
+            ocr_provider=ocr_provider,
+        )
+        if not text.strip():
+            raise RuntimeError("No extractable text found in uploaded file")
+        pipeline.run(
+            text=text, ingestion_id=str(ingestion_id), source_type="file",
+            provider=provider, cancel=cancel,
+        )
+
+
+def dispatch_summary(ingestion_id: UUID) -> None:
+    """Fire-and-forget summary trigger."""
+    summary_url = SUMMARY_URL.format(ingestion_id=ingestion_id)
+    try:
+        httpx.post(summary_url, timeout=1000)
+        logger.info(f"✅ Summary task dispatched: {summary_url}")
+    except Exception as e:
+        logger.warning(f"⚠️ Summary dispatch failed: {e}")
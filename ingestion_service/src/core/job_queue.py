@@ -0,0 +1,269 @@
+# ingestion_service/src/core/job_queue.py
+"""
+Durable ingestion job queue on top of `ingestion_requests`.
+
+- The API spools the upload to INGEST_SPOOL_DIR and enqueues a row with
+  status "accepted".
+- Workers lease one row at a time with `FOR UPDATE SKIP LOCKED`, so any
+  number of worker processes (on any host sharing the spool directory)
+  can poll concurrently without blocking each other.
+- A lease carries an expiry that the worker renews while it runs; a row
+  whose lease expired (worker crashed / was killed) becomes leasable again.
+- Failures are retried with exponential backoff until max_attempts, then
+  the request is marked "failed". A NonRetryableError fails it at once.
+"""
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional
+from uuid import UUID
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from src.core.models import IngestionRequest
+
+logger = logging.getLogger(__name__)
+
+
+class NonRetryableError(Exception):
+    """An ingestion error that another attempt cannot fix (e.g. bad input)."""
+
+
+@dataclass(frozen=True)
+class IngestionJob:
+    ingestion_id: UUID
+    filename: str
+    content_type: str
+    payload_path: str
+    metadata: Dict[str, Any]
+    attempts: int
+    max_attempts: int
+
+
+LEASE_SQL = text("""
+    UPDATE ingestion_service.ingestion_requests
+    SET status = 'running',
+        attempts = attempts + 1,
+        worker_id = :worker_id,
+        lease_expires_at = NOW() + make_interval(secs => :lease_seconds),
+        started_at = COALESCE(started_at, NOW())
+    WHERE ingestion_id = (
+        SELECT ingestion_id
+        FROM ingestion_service.ingestion_requests
+        WHERE payload_path IS NOT NULL
+          AND attempts < max_attempts
+          AND (
+              (status = 'accepted' AND next_attempt_at <= NOW())
+              OR (status = 'running' AND lease_expires_at < NOW())
+          )
+        ORDER BY next_attempt_at, created_at
+        FOR UPDATE SKIP LOCKED
+        LIMIT 1
+    )
+    RETURNING ingestion_id, filename, content_type, payload_path,
+              ingestion_metadata, attempts, max_attempts
+""")
+
+# fail() / settle_job() status when the lease was taken over by another run
+LEASE_LOST = "lease_lost"
+
+RENEW_SQL = text("""
+    UPDATE ingestion_service.ingestion_requests
+    SET lease_expires_at = NOW() + make_interval(secs => :lease_seconds)
+    WHERE ingestion_id = :ingestion_id
+      AND worker_id = :worker_id
+      AND status = 'running'
+""")
+
+COMPLETE_SQL = text("""
+    UPDATE ingestion_service.ingestion_requests
+    SET status = 'completed',
+        finished_at = NOW(),
+        lease_expires_at = NULL
+    WHERE ingestion_id = :ingestion_id
+      AND worker_id = :worker_id
+""")
+
+RETRY_SQL = text("""
+    UPDATE ingestion_service.ingestion_requests
+    SET status = 'accepted',
+        next_attempt_at = NOW() + make_interval(secs => :delay_seconds),
+        lease_expires_at = NULL,
+        worker_id = NULL,
+        ingestion_metadata = CAST(
+            COALESCE(CAST(ingestion_metadata AS jsonb), '{}'::jsonb)
+            || jsonb_build_object('error', CAST(:error AS text))
+            AS json)
+    WHERE ingestion_id = :ingestion_id
+      AND worker_id = :worker_id
+""")
+
+FAIL_SQL = text("""
+    UPDATE ingestion_service.ingestion_requests
+    SET status = 'failed',
+        finished_at = NOW(),
+        lease_expires_at = NULL,
+        ingestion_metadata = CAST(
+            COALESCE(CAST(ingestion_metadata AS jsonb), '{}'::jsonb)
+            || jsonb_build_object('error', CAST(:error AS text))
+            AS json)
+    WHERE ingestion_id = :ingestion_id
+      AND worker_id = :worker_id
+""")
+
+# Leases that expired on their last allowed attempt are never re-leased;
+# close them out so they don't stay "running" forever.
+REAP_SQL = text("""
+    UPDATE ingestion_service.ingestion_requests
+    SET status = 'failed',
+        finished_at = NOW(),
+        lease_expires_at = NULL,
+        ingestion_metadata = CAST(
+            COALESCE(CAST(ingestion_metadata AS jsonb), '{}'::jsonb)
+            || jsonb_build_object('error', 'lease expired on final attempt')
+            AS json)
+    WHERE status = 'running'
+      AND lease_expires_at < NOW()
+      AND attempts >= max_attempts
+    RETURNING ingestion_id, payload_path
+""")
+
+
+class IngestionJobQueue:
+    def __init__(
+        self,
+        session_factory: Callable[[], Session],
+        *,
+        lease_seconds: int = 300,
+        backoff_seconds: float = 5.0,
+        backoff_max_seconds: float = 600.0,
+    ) -> None:
+        self._session_factory = session_factory
+        self.lease_seconds = lease_seconds
+        self.backoff_seconds = backoff_seconds
+        self.backoff_max_seconds = backoff_max_seconds
+
+    # ---------------------------------------------------------
+    # Producer
+    # ---------------------------------------------------------
+    def enqueue(
+        self,
+        *,
+        ingestion_id: UUID,
+        source_type: str,
+        metadata: Dict[str, Any],
+        filename: str,
+        content_type: str,
+        payload_path: str,
+        max_attempts: int = 3,
+        content_sha256: Optional[str] = None,
+        session: Optional[Session] = None,
+    ) -> None:
+        """
+        Insert the job row. With `session`, the insert is committed on that
+        session (e.g. the one holding the API's content lock) rather than a
+        new one from the pool.
+        """
+        request = IngestionRequest()
+        request.ingestion_id = ingestion_id
+        request.source_type = source_type
+        request.ingestion_metadata = metadata
+        request.status = "accepted"
+        request.filename = filename
+        request.content_type = content_type
+        request.payload_path = payload_path
+        request.max_attempts = max_attempts
+        request.content_sha256 = content_sha256
+
+        if session is not None:
+            session.add(request)
+            session.commit()
+            return
+        with self._session_factory() as session:
+            session.add(request)
+            session.commit()
+
+    # ---------------------------------------------------------
+    # Consumer
+    # ---------------------------------------------------------
+    def lease(self, worker_id: str) -> Optional[IngestionJob]:
+        """Lease the next runnable job, or return None if the queue is empty."""
+        with self._session_factory() as session:
+            row = session.execute(
+                LEASE_SQL,
+                {"worker_id": worker_id, "lease_seconds": self.lease_seconds},
+            ).first()
+            session.commit()
+
+        if row is None:
+            return None
+
+        (ingestion_id, filename, content_type, payload_path,
+         metadata, attempts, max_attempts) = row
+        return IngestionJob(
+            ingestion_id=ingestion_id,
+            filename=filename or "unknown",
+            content_type=content_type or "application/octet-stream",
+            payload_path=payload_path,
+            metadata=metadata or {},
+            attempts=attempts,
+            max_attempts=max_attempts,
+        )
+
+    def renew(self, job: IngestionJob, worker_id: str) -> bool:
+        """Extend the lease; False means the job was taken over by someone else."""
+        return self._update(RENEW_SQL, job, worker_id, lease_seconds=self.lease_seconds)
+
+    def complete(self, job: IngestionJob, worker_id: str) -> bool:
+        return self._update(COMPLETE_SQL, job, worker_id)
+
+    def fail(
+        self, job: IngestionJob, worker_id: str, error: str, retryable: bool = True
+    ) -> str:
+        """
+        Record a failed attempt.
+
+        Returns the resulting status: "accepted" when the job will be
+        retried after a backoff, "failed" once attempts are exhausted (or
+        at once when not `retryable`), or LEASE_LOST when `worker_id` no
+        longer holds the job (nothing recorded).
+        """
+        if retryable and job.attempts < job.max_attempts:
+            retried = self._update(
+                RETRY_SQL, job, worker_id,
+                delay_seconds=self.retry_delay(job.attempts), error=error,
+            )
+            return "accepted" if retried else LEASE_LOST
+
+        failed = self._update(FAIL_SQL, job, worker_id, error=error)
+        return "failed" if failed else LEASE_LOST
+
+    def reap_expired(self) -> list[tuple[UUID, Optional[str]]]:
+        """Fail jobs whose final attempt lost its lease; returns (id, payload_path)."""
+        with self._session_factory() as session:
+            rows = session.execute(REAP_SQL).all()
+            session.commit()
+        for ingestion_id, _ in rows:
+            logger.warning(f"⚠️ Ingestion {ingestion_id} lease expired on final attempt")
+        return [(row[0], row[1]) for row in rows]
+
+    def retry_delay(self, attempts: int) -> float:
+        """Exponential backoff: base * 2^(attempts-1), capped."""
+        delay = self.backoff_seconds * (2 ** max(attempts - 1, 0))
+        return min(delay, self.backoff_max_seconds)
+
+    # ---------------------------------------------------------
+    # Internal
+    # ---------------------------------------------------------
+    def _update(
+        self, statement, job: IngestionJob, worker_id: str, **params: Any
+    ) -> bool:
+        with self._session_factory() as session:
+            result = session.execute(
+                statement,
+                {"ingestion_id": job.ingestion_id, "worker_id": worker_id, **params},
+            )
+            session.commit()
+        return result.rowcount > 0
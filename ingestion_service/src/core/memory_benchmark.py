@@ -0,0 +1,236 @@
+# ingestion_service/src/core/memory_benchmark.py
+"""
+Memory benchmark for the ingestion data model on a large synthetic document:
+
+    python -m src.core.memory_benchmark [--pages 2000] [--blocks-per-page 40] \
+        [--images-per-page 2]
+
+Builds the ExtractedArtifacts of a large PDF, its DocumentGraph and its
+chunks (per-block assembly, the most object-heavy path) without PyMuPDF,
+OCR or a database, and reports with tracemalloc:
+
+- bytes per instance of each slotted model vs. the same fields as a
+  regular __dict__-backed dataclass;
+- bytes of chunk metadata as assembled (one dict per block, shared
+  chunker_params) vs. one private dict and chunker_params copy per chunk;
+- bytes per embedding as a float32 array vs. a list of Python floats.
+"""
+from __future__ import annotations
+
+import argparse
+import sys
+import tracemalloc
+from dataclasses import dataclass, fields, make_dataclass
+from typing import Any, Callable, Dict, List
+
+from shared.models.vector import VectorMetadata, VectorRecord, to_embedding
+from src.core.chunk_assembly.pdf_chunk_assembler import PDFChunkAssembler
+from src.core.document_graph.builder import DocumentGraphBuilder
+from src.core.extractors.base import ExtractedArtifact
+
+_SENTENCE = "The quick brown fox jumps over the lazy dog near the riverbank."
+
+
+@dataclass
+class ModelFootprint:
+    name: str
+    count: int
+    dict_bytes: float  # per instance, __dict__-backed equivalent
+    slotted_bytes: float  # per instance, as defined
+
+    @property
+    def saved_bytes(self) -> int:
+        return round((self.dict_bytes - self.slotted_bytes) * self.count)
+
+
+@dataclass
+class BenchmarkResult:
+    artifacts: int
+    nodes: int
+    edges: int
+    chunks: int
+    models: List[ModelFootprint]
+    metadata_dicts: int  # distinct metadata dicts held by the chunks
+    shared_metadata_bytes: int
+    private_metadata_bytes: int  # one dict + chunker_params copy per chunk
+    dimension: int
+    list_embedding_bytes: float  # per vector, list of Python floats
+    array_embedding_bytes: float  # per vector, float32 array
+
+
+def synthetic_artifacts(
+    pages: int,
+    blocks_per_page: int,
+    images_per_page: int,
+    source_name: str = "benchmark.pdf",
+) -> List[ExtractedArtifact]:
+    """Text blocks of a few sentences with images interleaved, page by page."""
+    artifacts: List[ExtractedArtifact] = []
+    for page_number in range(1, pages + 1):
+        order_index = 0
+        for block in range(blocks_per_page):
+            artifacts.append(ExtractedArtifact(
+                type="text",
+                source_file=source_name,
+                page_number=page_number,
+                order_index=order_index,
+                text=(
+                    f"Page {page_number} block {block}. "
+                    + _SENTENCE * (1 + block % 8)
+                ),
+                bbox=(0.0, float(block), 100.0, float(block + 1)),
+            ))
+            order_index += 1
+            if block < images_per_page:
+                artifacts.append(ExtractedArtifact(
+                    type="image",
+                    source_file=source_name,
+                    page_number=page_number,
+                    order_index=order_index,
+                ))
+                order_index += 1
+    return artifacts
+
+
+def _unslotted(cls: type) -> type:
+    """The fields of `cls` as a regular (__dict__-backed) dataclass."""
+    return make_dataclass(f"{cls.__name__}WithDict", [f.name for f in fields(cls)])
+
+
+def _bytes_per_instance(factory: Callable[[], Any], samples: int) -> float:
+    """Traced bytes per object built by `factory` (field values are shared)."""
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        objects = [factory() for _ in range(samples)]
+        allocated = tracemalloc.get_traced_memory()[0] - before
+    finally:
+        tracemalloc.stop()
+    return (allocated - sys.getsizeof(objects)) / samples
+
+
+def _footprint(instance: Any, count: int, samples: int) -> ModelFootprint:
+    cls = type(instance)
+    values: Dict[str, Any] = {f.name: getattr(instance, f.name) for f in fields(cls)}
+    baseline = _unslotted(cls)
+    return ModelFootprint(
+        name=cls.__name__,
+        count=count,
+        dict_bytes=_bytes_per_instance(lambda: baseline(**values), samples),
+        slotted_bytes=_bytes_per_instance(lambda: cls(**values), samples),
+    )
+
+
+def _traced_bytes(factory: Callable[[], Any]) -> int:
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        held = factory()
+        allocated = tracemalloc.get_traced_memory()[0] - before
+    finally:
+        tracemalloc.stop()
+    del held
+    return allocated
+
+
+def run_benchmark(
+    pages: int = 2000,
+    blocks_per_page: int = 40,
+    images_per_page: int = 2,
+    samples: int = 10_000,
+    dimension: int = 768,
+) -> BenchmarkResult:
+    artifacts = synthetic_artifacts(pages, blocks_per_page, images_per_page)
+    graph = DocumentGraphBuilder().build(artifacts)
+    chunks = PDFChunkAssembler(merge_blocks=False).assemble(graph)
+
+    chunk = chunks[0]
+    metadata = VectorMetadata(
+        ingestion_id="00000000-0000-0000-0000-000000000001",
+        chunk_id=chunk.chunk_id,
+        chunk_index=0,
+        chunk_strategy=chunk.metadata.get("chunk_strategy", "unknown"),
+        chunk_text=chunk.content,
+        source_metadata=chunk.metadata,
+        token_count=chunk.token_count,
+    )
+    models = [
+        _footprint(artifacts[0], len(artifacts), samples),
+        _footprint(next(iter(graph.nodes.values())), len(graph.nodes), samples),
+        _footprint(graph.edges[0], len(graph.edges), samples),
+        _footprint(chunk, len(chunks), samples),
+        _footprint(metadata, len(chunks), samples),
+        _footprint(VectorRecord(vector=[0.0], metadata=metadata), len(chunks), samples),
+    ]
+
+    # Embeddings as parsed from JSON: fresh floats, not one shared constant
+    parsed = [float(i) / dimension for i in range(dimension)]
+    embedding_samples = max(1, samples // 100)
+
+    distinct = {id(c.metadata): c.metadata for c in chunks}
+    params = {id(m["chunker_params"]): m["chunker_params"] for m in distinct.values()}
+    return BenchmarkResult(
+        artifacts=len(artifacts),
+        nodes=len(graph.nodes),
+        edges=len(graph.edges),
+        chunks=len(chunks),
+        models=models,
+        metadata_dicts=len(distinct),
+        shared_metadata_bytes=sum(
+            sys.getsizeof(d) for d in [*distinct.values(), *params.values()]
+        ),
+        private_metadata_bytes=_traced_bytes(lambda: [
+            {**c.metadata, "chunker_params": dict(c.metadata["chunker_params"])}
+            for c in chunks
+        ]),
+        dimension=dimension,
+        list_embedding_bytes=_bytes_per_instance(
+            lambda: [value * 1.0 for value in parsed], embedding_samples
+        ),
+        array_embedding_bytes=_bytes_per_instance(
+            lambda: to_embedding(parsed), embedding_samples
+        ),
+    )
+
+
+def _mib(value: float) -> str:
+    return f"{value / (1024 * 1024):.1f} MiB"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Memory benchmark for the ingestion data model"
+    )
+    parser.add_argument("--pages", type=int, default=2000)
+    parser.add_argument("--blocks-per-page", type=int, default=40)
+    parser.add_argument("--images-per-page", type=int, default=2)
+    args = parser.parse_args()
+
+    result = run_benchmark(args.pages, args.blocks_per_page, args.images_per_page)
+    print(
+        f"{result.artifacts} artifacts, {result.nodes} graph nodes, "
+        f"{result.edges} edges, {result.chunks} chunks"
+    )
+    print(
+        f"{'model':<20}{'count':>10}{'dict B/obj':>12}"
+        f"{'slots B/obj':>13}{'saved':>12}"
+    )
+    for model in result.models:
+        print(
+            f"{model.name:<20}{model.count:>10}{model.dict_bytes:>12.0f}"
+            f"{model.slotted_bytes:>13.0f}{_mib(model.saved_bytes):>12}"
+        )
+    print(
+        f"chunk metadata: {result.metadata_dicts} shared dicts "
+        f"({_mib(result.shared_metadata_bytes)}) vs {result.chunks} private dicts "
+        f"({_mib(result.private_metadata_bytes)})"
+    )
+    print(
+        f"embedding ({result.dimension} dims): "
+        f"{result.array_embedding_bytes:.0f} B as float32 array vs "
+        f"{result.list_embedding_bytes:.0f} B as list of floats"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,8 @@
 # ingestion_service/src/core/models.py (classic style - Pyright perfect)
 import uuid
-from sqlalchemy import Column, String, JSON, TIMESTAMP, MetaData  # ← Add MetaData here
+from sqlalchemy import (  # ← Add MetaData here
+    Column, String, JSON, TIMESTAMP, Integer, Text, MetaData
+)
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import declarative_base
 from sqlalchemy.sql import text
@@ -19,3 +21,16 @@ class IngestionRequest(Base):
     created_at = Column(TIMESTAMP, server_default=text("NOW()"), nullable=False)
     started_at = Column(TIMESTAMP, nullable=True)
     finished_at = Column(TIMESTAMP, nullable=True)
+
+    # Job queue (leased by src.core.worker)
+    filename = Column(Text, nullable=True)
+    content_type = Column(Text, nullable=True)
+    payload_path = Column(Text, nullable=True)
+    attempts = Column(Integer, nullable=False, server_default=text("0"))
+    max_attempts = Column(Integer, nullable=False, server_default=text("3"))
+    next_attempt_at = Column(TIMESTAMP, server_default=text("NOW()"), nullable=False)
+    lease_expires_at = Column(TIMESTAMP, nullable=True)
+    worker_id = Column(Text, nullable=True)
+
+    # SHA-256 of the uploaded bytes (duplicate-upload detection)
+    content_sha256 = Column(Text, nullable=True)
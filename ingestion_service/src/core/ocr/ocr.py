@@ -9,6 +9,11 @@ class OCRExtractor(ABC):
     name: str = "base"
 
     @abstractmethod
-    def extract_text(self, image_bytes: bytes) -> str:
-        """Return extracted text from image bytes. Empty string if nothing found."""
+    def extract_text(self, image_bytes: bytes, timeout: float = 0) -> str:
+        """
+        Return extracted text from image bytes. Empty string if nothing found.
+
+        Raises TimeoutError if recognition takes longer than `timeout`
+        seconds (0 = no limit).
+        """
         pass
@@ -0,0 +1,328 @@
+# ingestion_service/src/core/ocr/pool.py
+"""
+Parallel OCR execution on top of ocr_factory.
+
+OCRPool fans images out to a process pool (one worker per core by default;
+OCR engines are CPU-bound) and caches results by (provider, sha256 of the
+image bytes), so recurring images — logos, stamps, repeated scans — are
+OCR'd once per process. Each image is bounded by a per-image timeout
+enforced by the engine; timed-out or failed images yield None and are not
+cached.
+
+Before OCR, each image goes through the pre-filter (see ocr.prefilter) in
+the same worker process: icons and fills are skipped, oversized scans are
+downscaled. Pass an OCRStats to count skipped vs processed images.
+"""
+from __future__ import annotations
+
+import hashlib
+import logging
+import multiprocessing as mp
+import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import replace
+from functools import lru_cache
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from src.core.extractors.base import ExtractedArtifact
+from src.core.ocr.ocr_factory import get_ocr_engine
+from src.core.ocr.prefilter import (
+    FAILED,
+    PROCESS,
+    OCRPrefilterConfig,
+    OCRStats,
+    page_render_config,
+    prefilter_image,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def _ocr_image(
+    provider: str,
+    image_bytes: bytes,
+    timeout: float,
+    prefilter: OCRPrefilterConfig,
+) -> Tuple[str, str, bool, float]:
+    """
+    Process-pool entry point (module-level so it pickles).
+
+    Returns (decision, text, downscaled, ocr_seconds).
+    """
+    result = prefilter_image(image_bytes, prefilter)
+    if result.decision != PROCESS:
+        return result.decision, "", False, 0.0
+    started = time.perf_counter()
+    # PROCESS always carries the bytes to OCR; fall back to the original
+    image = result.image_bytes if result.image_bytes is not None else image_bytes
+    text = get_ocr_engine(provider).extract_text(image, timeout=timeout) or ""
+    return PROCESS, text, result.downscaled, time.perf_counter() - started
+
+
+def _ocr_pdf_pages(
+    provider: str,
+    file_bytes: bytes,
+    page_numbers: Sequence[int],
+    dpi: int,
+    timeout: float,
+    prefilter: OCRPrefilterConfig,
+) -> List[Tuple[int, str, Optional[str], bool, float]]:
+    """
+    Process-pool entry point: render 1-based `page_numbers` at `dpi` and OCR them.
+
+    Opens the document once per task. Returns (page_number, decision, text,
+    downscaled, ocr_seconds); text is None when rendering or OCR of that
+    page failed.
+    """
+    import fitz  # PyMuPDF
+
+    results: List[Tuple[int, str, Optional[str], bool, float]] = []
+    with fitz.open(stream=file_bytes, filetype="pdf") as doc:
+        for page_number in page_numbers:
+            try:
+                page = doc[page_number - 1]
+                pixmap = page.get_pixmap(dpi=dpi, colorspace=fitz.csGRAY)
+                pixmap.set_dpi(dpi, dpi)
+                image_bytes = pixmap.tobytes("png")
+                del pixmap
+                decision, text, downscaled, seconds = _ocr_image(
+                    provider, image_bytes, timeout, prefilter
+                )
+            except Exception as exc:
+                logger.warning("OCR failed for page %s: %s", page_number, exc)
+                results.append((page_number, FAILED, None, False, 0.0))
+                continue
+            results.append((page_number, decision, text, downscaled, seconds))
+    return results
+
+
+class OCRResultCache:
+    """Thread-safe LRU of OCR text keyed on (provider, image sha256)."""
+
+    def __init__(self, max_entries: int = 10_000) -> None:
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Tuple[str, str], str]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, provider: str, digest: str) -> Optional[str]:
+        with self._lock:
+            text = self._entries.get((provider, digest))
+            if text is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end((provider, digest))
+            self.hits += 1
+            return text
+
+    def put(self, provider: str, digest: str, text: str) -> None:
+        if self.max_entries <= 0:
+            return
+        with self._lock:
+            self._entries[(provider, digest)] = text
+            self._entries.move_to_end((provider, digest))
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+
+class OCRPool:
+    def __init__(
+        self,
+        provider: str = "tesseract",
+        *,
+        max_workers: int = 0,
+        timeout: float = 60.0,
+        cache: Optional[OCRResultCache] = None,
+        executor: Optional[Executor] = None,
+        prefilter: Optional[OCRPrefilterConfig] = None,
+    ) -> None:
+        """
+        :param max_workers: OCR processes; 0 = one per core
+        :param timeout: seconds allowed per image (0 = unlimited)
+        :param executor: override the process pool (tests, shared pools)
+        :param prefilter: pre-filter thresholds (None = defaults)
+        """
+        self.provider = provider
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.timeout = timeout
+        self.prefilter = prefilter or OCRPrefilterConfig()
+        self.cache = cache if cache is not None else OCRResultCache()
+        self._executor = executor
+        self._owns_executor = executor is None
+        self._lock = threading.Lock()
+
+    def _get_executor(self) -> Executor:
+        if self._executor is None:
+            with self._lock:
+                if self._executor is None:
+                    # spawn: callers run threads (heartbeats, embedder pools)
+                    self._executor = ProcessPoolExecutor(
+                        max_workers=self.max_workers, mp_context=mp.get_context("spawn")
+                    )
+        return self._executor
+
+    def extract_many(
+        self,
+        images: Sequence[bytes],
+        digests: Optional[Sequence[Optional[str]]] = None,
+        stats: Optional[OCRStats] = None,
+    ) -> List[Optional[str]]:
+        """
+        OCR text for each image, in input order (None = failed / timed out,
+        "" = skipped by the pre-filter or no text found).
+
+        `digests` may carry precomputed sha256 hex digests (e.g. from an
+        ImageHandle) to skip re-hashing. Identical images are OCR'd once.
+        """
+        stats = stats if stats is not None else OCRStats()
+        keys: List[str] = []
+        for i, image in enumerate(images):
+            digest = digests[i] if digests else None
+            keys.append(digest or hashlib.sha256(image).hexdigest())
+
+        results: Dict[str, Optional[str]] = {}
+        pending: Dict[str, bytes] = {}
+        for key, image in zip(keys, images):
+            if key in results or key in pending:
+                stats.cached += 1
+                continue
+            cached = self.cache.get(self.provider, key)
+            if cached is not None:
+                stats.cached += 1
+                results[key] = cached
+            else:
+                pending[key] = image
+
+        if pending:
+            executor = self._get_executor()
+            futures = {
+                key: executor.submit(
+                    _ocr_image, self.provider, image, self.timeout, self.prefilter
+                )
+                for key, image in pending.items()
+            }
+            for key, future in futures.items():
+                try:
+                    decision, text, downscaled, seconds = future.result()
+                except Exception as exc:
+                    logger.warning("OCR failed for image %s: %s", key[:12], exc)
+                    stats.record(FAILED)
+                    results[key] = None
+                    continue
+                stats.record(decision, downscaled, seconds)
+                # Skip decisions are deterministic for a given config: cache them too
+                self.cache.put(self.provider, key, text)
+                results[key] = text
+
+        return [results[key] for key in keys]
+
+    def enrich(
+        self,
+        artifacts: Sequence[ExtractedArtifact],
+        stats: Optional[OCRStats] = None,
+    ) -> List[ExtractedArtifact]:
+        """Parallel enrich_image_with_ocr(): image artifacts get ocr_text set."""
+        indexes: List[int] = []
+        images: List[bytes] = []
+        digests: List[Optional[str]] = []
+        for i, artifact in enumerate(artifacts):
+            if artifact.type != "image" or not artifact.has_image:
+                continue
+            try:
+                image_bytes = artifact.load_image()
+            except Exception as exc:
+                logger.warning(
+                    "Image decode failed for %s (page %s): %s",
+                    artifact.source_file, artifact.page_number, exc,
+                )
+                continue
+            if not image_bytes:
+                continue
+            indexes.append(i)
+            images.append(image_bytes)
+            handle = artifact.image
+            digests.append(handle.content_hash if handle is not None else None)
+
+        enriched = list(artifacts)
+        for i, text in zip(indexes, self.extract_many(images, digests, stats)):
+            enriched[i] = replace(enriched[i], ocr_text=text or None)
+        return enriched
+
+    def ocr_pdf_pages(
+        self,
+        file_bytes: bytes,
+        page_numbers: Sequence[int],
+        *,
+        dpi: int = 300,
+        stats: Optional[OCRStats] = None,
+    ) -> Dict[int, Optional[str]]:
+        """
+        Render and OCR whole PDF pages in parallel; {page_number: text}.
+
+        Pages are split into one contiguous group per worker (as PDFExtractor
+        splits page ranges), so the PDF bytes are sent to each worker once
+        and each task opens the document once. Rendered pages only go through
+        the pre-filter's blank-page check (see page_render_config); results
+        are not cached, scans rarely repeat.
+        """
+        stats = stats if stats is not None else OCRStats()
+        if not page_numbers:
+            return {}
+
+        executor = self._get_executor()
+        prefilter = page_render_config(self.prefilter)
+        futures = [
+            executor.submit(
+                _ocr_pdf_pages, self.provider, file_bytes, group, dpi,
+                self.timeout, prefilter,
+            )
+            for group in self._page_groups(page_numbers)
+        ]
+        texts: Dict[int, Optional[str]] = {}
+        for future in futures:
+            for page_number, decision, text, downscaled, seconds in future.result():
+                stats.record(decision, downscaled, seconds)
+                texts[page_number] = text
+        return texts
+
+    def _page_groups(self, page_numbers: Sequence[int]) -> List[List[int]]:
+        """Split page_numbers into at most max_workers contiguous, near-equal groups."""
+        groups = min(self.max_workers, len(page_numbers))
+        size, extra = divmod(len(page_numbers), groups)
+        result: List[List[int]] = []
+        start = 0
+        for i in range(groups):
+            stop = start + size + (1 if i < extra else 0)
+            result.append(list(page_numbers[start:stop]))
+            start = stop
+        return result
+
+    def close(self) -> None:
+        if self._owns_executor and self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+
+@lru_cache
+def get_ocr_pool(
+    provider: str = "tesseract",
+    max_workers: int = 0,
+    timeout: float = 60.0,
+    cache_size: int = 10_000,
+    prefilter: Optional[OCRPrefilterConfig] = None,
+) -> OCRPool:
+    """Process-wide pool: workers and the result cache are reused across documents."""
+    return OCRPool(
+        provider,
+        max_workers=max_workers,
+        timeout=timeout,
+        cache=OCRResultCache(cache_size),
+        prefilter=prefilter,
+    )
@@ -0,0 +1,202 @@
+# ingestion_service/src/core/ocr/prefilter.py
+"""
+Cheap checks run before OCR, so Tesseract only sees images likely to hold text.
+
+- size:       images under min_bytes / min_width / min_height / min_pixels
+              (icons, bullets, rules) are skipped;
+- text-likelihood: images with no ink (pixels that differ from the
+              background) are skipped; otherwise a small grayscale thumbnail
+              of the ink region is checked, and too little entropy (speckled
+              blank scans) or edge density (flat fills, gradients) skips the
+              image; max_entropy optionally skips photos. Measuring the ink
+              region, not the whole image, keeps a page with one line of text
+              from looking blank;
+- downscale:  scans above target_dpi (or max_side pixels when the image has
+              no DPI) are resized before OCR, which Tesseract does not need.
+"""
+from __future__ import annotations
+
+import io
+from dataclasses import dataclass, replace
+from typing import Optional
+
+from PIL import Image, ImageFilter
+
+SKIPPED_SMALL = "skipped_small"
+SKIPPED_LOW_TEXT = "skipped_low_text"
+PROCESS = "process"
+FAILED = "failed"
+
+_EDGE_THRESHOLD = 48  # FIND_EDGES response counted as an edge pixel
+_INK_THRESHOLD = 32  # gray-level distance from the background counted as ink
+_INK_SEARCH_SIDE = 1024  # resolution the ink region is located at
+_THUMBNAIL_SIDE = 256
+
+
+@dataclass(frozen=True)
+class OCRPrefilterConfig:
+    enabled: bool = True
+    min_bytes: int = 1024
+    min_width: int = 32
+    min_height: int = 16
+    min_pixels: int = 4096
+    min_entropy: float = 1.0  # of the ink region; text crops measure ~3+
+    max_entropy: float = 0.0  # 0 = don't skip high-entropy (photo-like) images
+    min_edge_density: float = 0.05  # text crops measure ~0.3+
+    target_dpi: int = 300
+    max_side: int = 3500
+
+
+@dataclass
+class PrefilterResult:
+    decision: str
+    image_bytes: Optional[bytes] = None  # what to OCR (possibly downscaled)
+    downscaled: bool = False
+
+
+def page_render_config(config: OCRPrefilterConfig) -> OCRPrefilterConfig:
+    """
+    The pre-filter for whole rendered PDF pages: only the blank-page check.
+
+    A page render is known to be a page, so size, entropy and edge checks
+    (tuned for embedded images) would only risk dropping sparse text.
+    """
+    return replace(
+        config,
+        min_bytes=0,
+        min_width=0,
+        min_height=0,
+        min_pixels=0,
+        min_entropy=0.0,
+        max_entropy=0.0,
+        min_edge_density=0.0,
+    )
+
+
+def _edge_density(gray: Image.Image) -> float:
+    edges = gray.filter(ImageFilter.FIND_EDGES)
+    histogram = edges.histogram()
+    total = sum(histogram) or 1
+    return sum(histogram[_EDGE_THRESHOLD:]) / total
+
+
+def _ink_region(gray: Image.Image) -> Optional[Image.Image]:
+    """
+    Crop of `gray` around every pixel that differs from the background (the
+    most common gray level), or None for a blank image.
+    """
+    search = gray.copy()
+    search.thumbnail((_INK_SEARCH_SIDE, _INK_SEARCH_SIDE))
+    histogram = search.histogram()
+    background = max(range(256), key=histogram.__getitem__)
+    ink = [255 if abs(v - background) > _INK_THRESHOLD else 0 for v in range(256)]
+    mask = search.point(ink)
+    box = mask.getbbox()
+    if box is None:
+        return None
+    scale_x = gray.width / search.width
+    scale_y = gray.height / search.height
+    return gray.crop((
+        int(box[0] * scale_x), int(box[1] * scale_y),
+        min(gray.width, round(box[2] * scale_x)),
+        min(gray.height, round(box[3] * scale_y)),
+    ))
+
+
+def _downscale(image: Image.Image, config: OCRPrefilterConfig) -> Optional[Image.Image]:
+    """Resized copy when the image exceeds target_dpi / max_side, else None."""
+    dpi = image.info.get("dpi")
+    scale = 1.0
+    if dpi and dpi[0] and dpi[0] > config.target_dpi:
+        scale = config.target_dpi / float(dpi[0])
+    elif max(image.size) > config.max_side:
+        scale = config.max_side / float(max(image.size))
+    if scale >= 1.0:
+        return None
+    size = (max(1, round(image.width * scale)), max(1, round(image.height * scale)))
+    resized = image.resize(size, Image.Resampling.LANCZOS)
+    if dpi and dpi[0]:
+        resized.info["dpi"] = (config.target_dpi, config.target_dpi)
+    return resized
+
+
+def prefilter_image(image_bytes: bytes, config: OCRPrefilterConfig) -> PrefilterResult:
+    """Decide whether `image_bytes` is worth OCR, and what to OCR."""
+    if not config.enabled:
+        return PrefilterResult(PROCESS, image_bytes)
+    if len(image_bytes) < config.min_bytes:
+        return PrefilterResult(SKIPPED_SMALL)
+
+    try:
+        image = Image.open(io.BytesIO(image_bytes))
+        image.load()
+    except Exception:
+        # Let the OCR engine decide what to do with undecodable data
+        return PrefilterResult(PROCESS, image_bytes)
+
+    width, height = image.size
+    if (
+        width < config.min_width
+        or height < config.min_height
+        or width * height < config.min_pixels
+    ):
+        return PrefilterResult(SKIPPED_SMALL)
+
+    thumbnail = _ink_region(image.convert("L"))
+    if thumbnail is None:
+        return PrefilterResult(SKIPPED_LOW_TEXT)
+    thumbnail.thumbnail((_THUMBNAIL_SIDE, _THUMBNAIL_SIDE))
+    entropy = thumbnail.entropy()
+    if entropy < config.min_entropy:
+        return PrefilterResult(SKIPPED_LOW_TEXT)
+    if config.max_entropy and entropy > config.max_entropy:
+        return PrefilterResult(SKIPPED_LOW_TEXT)
+    if _edge_density(thumbnail) < config.min_edge_density:
+        return PrefilterResult(SKIPPED_LOW_TEXT)
+
+    resized = _downscale(image, config)
+    if resized is None:
+        return PrefilterResult(PROCESS, image_bytes)
+    out = io.BytesIO()
+    save_options = {"dpi": resized.info["dpi"]} if "dpi" in resized.info else {}
+    resized.save(out, format="PNG", **save_options)
+    return PrefilterResult(PROCESS, out.getvalue(), downscaled=True)
+
+
+@dataclass
+class OCRStats:
+    """Per-ingestion OCR counters."""
+
+    processed: int = 0
+    cached: int = 0
+    skipped_small: int = 0
+    skipped_low_text: int = 0
+    downscaled: int = 0
+    failed: int = 0
+    ocr_seconds: float = 0.0
+
+    def record(
+        self, decision: str, downscaled: bool = False, seconds: float = 0.0
+    ) -> None:
+        """Count one image by its outcome (PROCESS, FAILED or a skip decision)."""
+        if decision == PROCESS:
+            self.processed += 1
+            self.downscaled += int(downscaled)
+            self.ocr_seconds += seconds
+        else:
+            setattr(self, decision, getattr(self, decision) + 1)
+
+    @property
+    def skipped(self) -> int:
+        return self.skipped_small + self.skipped_low_text
+
+    def as_dict(self) -> dict:
+        return {
+            "processed": self.processed,
+            "cached": self.cached,
+            "skipped_small": self.skipped_small,
+            "skipped_low_text": self.skipped_low_text,
+            "downscaled": self.downscaled,
+            "failed": self.failed,
+            "ocr_seconds": round(self.ocr_seconds, 3),
+        }
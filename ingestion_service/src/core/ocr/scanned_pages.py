@@ -0,0 +1,98 @@
+# ingestion_service/src/core/ocr/scanned_pages.py
+"""
+Page-level OCR for scanned / image-only PDFs.
+
+Pages whose text layer holds fewer than `min_text_chars` characters are
+rendered with PyMuPDF and OCR'd through an OCRPool (in parallel). Each page
+that yields text gets one synthetic text artifact carrying `ocr_text`,
+placed after the page's own artifacts, so DocumentGraphBuilder links the
+page's scan image to it and PDFChunkAssembler chunks it like native text.
+"""
+from __future__ import annotations
+
+import logging
+from collections import defaultdict
+from dataclasses import replace
+from typing import Dict, List, Optional, Sequence
+
+import fitz  # PyMuPDF
+
+from src.core.extractors.base import ExtractedArtifact
+from src.core.ocr.pool import OCRPool
+from src.core.ocr.prefilter import OCRStats
+
+logger = logging.getLogger(__name__)
+
+
+def find_textless_pages(
+    artifacts: Sequence[ExtractedArtifact], page_count: int, min_text_chars: int = 16
+) -> List[int]:
+    """1-based numbers of pages whose extracted text is shorter than min_text_chars."""
+    chars: Dict[int, int] = defaultdict(int)
+    for artifact in artifacts:
+        if artifact.type == "text" and artifact.text:
+            chars[artifact.page_number] += len(artifact.text)
+    return [page for page in range(1, page_count + 1) if chars[page] < min_text_chars]
+
+
+def merge_page_ocr(
+    artifacts: Sequence[ExtractedArtifact],
+    page_texts: Dict[int, Optional[str]],
+    source_name: str,
+) -> List[ExtractedArtifact]:
+    """
+    Insert one OCR text artifact per page (after that page's artifacts)
+    and renumber order_index document-wide.
+    """
+    ocr_artifacts = {
+        page: ExtractedArtifact(
+            type="text",
+            source_file=source_name,
+            page_number=page,
+            order_index=0,
+            ocr_text=text.strip(),
+        )
+        for page, text in page_texts.items()
+        if text and text.strip()
+    }
+    if not ocr_artifacts:
+        return list(artifacts)
+
+    by_page: Dict[int, List[ExtractedArtifact]] = defaultdict(list)
+    for artifact in artifacts:
+        by_page[artifact.page_number].append(artifact)
+
+    merged: List[ExtractedArtifact] = []
+    for page in sorted(set(by_page) | set(ocr_artifacts)):
+        page_artifacts = by_page.get(page, [])
+        if page in ocr_artifacts:
+            page_artifacts = page_artifacts + [ocr_artifacts[page]]
+        for artifact in page_artifacts:
+            merged.append(replace(artifact, order_index=len(merged)))
+    return merged
+
+
+def ocr_scanned_pages(
+    file_bytes: bytes,
+    source_name: str,
+    artifacts: List[ExtractedArtifact],
+    pool: OCRPool,
+    *,
+    dpi: int = 300,
+    min_text_chars: int = 16,
+    stats: Optional[OCRStats] = None,
+) -> List[ExtractedArtifact]:
+    """Return `artifacts` with OCR text added for every page lacking a text layer."""
+    with fitz.open(stream=file_bytes, filetype="pdf") as doc:
+        page_count = len(doc)
+
+    pages = find_textless_pages(artifacts, page_count, min_text_chars)
+    if not pages:
+        return artifacts
+
+    logger.info(
+        f"🖨️ {source_name}: OCR of {len(pages)}/{page_count} pages "
+        "without a text layer"
+    )
+    page_texts = pool.ocr_pdf_pages(file_bytes, pages, dpi=dpi, stats=stats)
+    return merge_page_ocr(artifacts, page_texts, source_name)
@@ -3,6 +3,7 @@
 from PIL import Image
 import pytesseract
 import io
+import math
 
 from src.core.ocr.ocr import OCRExtractor
 
@@ -10,10 +11,16 @@ from src.core.ocr.ocr import OCRExtractor
 class TesseractOCR(OCRExtractor):
     name = "tesseract"
 
-    def extract_text(self, image_bytes: bytes) -> str:
+    def extract_text(self, image_bytes: bytes, timeout: float = 0) -> str:
         try:
             image = Image.open(io.BytesIO(image_bytes))
-            text = pytesseract.image_to_string(image)
+            # pytesseract kills the tesseract process once timeout expires;
+            # it takes whole seconds (0 = no limit), so round fractions up
+            text = pytesseract.image_to_string(image, timeout=math.ceil(timeout))
             return text or ""
+        except RuntimeError as exc:
+            if "timeout" in str(exc).lower():
+                raise TimeoutError(f"Tesseract timed out after {timeout}s") from exc
+            return ""
         except Exception:
             return ""
@@ -1,5 +1,6 @@
 # ingestion_service/src/core/ocr/utils.py
 import logging
+from dataclasses import replace
 
 from src.core.extractors.base import ExtractedArtifact
 from src.core.ocr.ocr_factory import get_ocr_engine
@@ -17,13 +18,16 @@ def enrich_image_with_ocr(
 
     OCR failures are logged and swallowed; ingestion continues.
     """
-    if not artifact.image_bytes:
+    if not artifact.has_image:
         return artifact
 
     ocr_text: str | None = None
     try:
+        image_bytes = artifact.load_image()
+        if not image_bytes:
+            return artifact
         ocr_engine = get_ocr_engine(ocr_provider)
-        ocr_text = ocr_engine.extract_text(artifact.image_bytes) or None
+        ocr_text = ocr_engine.extract_text(image_bytes) or None
     except Exception as exc:
         logger.warning(
             "OCR failed for image artifact %s (page %s, order %s): %s",
@@ -34,13 +38,4 @@ def enrich_image_with_ocr(
         )
 
     # Return a new artifact with the same fields but OCR text added
-    return ExtractedArtifact(
-        type=artifact.type,
-        source_file=artifact.source_file,
-        page_number=artifact.page_number,
-        order_index=artifact.order_index,
-        text=artifact.text,
-        image_bytes=artifact.image_bytes,
-        ocr_text=ocr_text,
-        bbox=artifact.bbox,
-    )
+    return replace(artifact, ocr_text=ocr_text)
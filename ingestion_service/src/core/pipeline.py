@@ -1,21 +1,137 @@
 # ingestion_service/src/core/pipeline.py - MS6 COMPLETE (both run() + run_with_chunks)
 from __future__ import annotations
-from typing import Any, Optional
+from itertools import chain, islice
+from typing import Any, Iterable, Iterator, Optional
 import logging
+import queue
+import threading
 from uuid import uuid4, UUID
 
 
-from shared.chunks import Chunk
+from shared.chunks import Chunk, content_hash, shared_metadata
 from shared.chunkers.base import BaseChunker
 from shared.chunkers.selector import ChunkerFactory
 from src.core.database_session import get_sessionmaker
-from src.core.crud.crud_document_node import create_document_node
+from src.core.crud.crud_document_node import (
+    create_document_node,
+    delete_document_nodes_by_ingestion,
+    get_document_node,
+    reassign_document_node,
+)
+from src.core.job_queue import NonRetryableError
 
 
 logging.basicConfig(level=logging.DEBUG)
 logger = logging.getLogger(__name__)
 
 
+class DocumentNotFound(NonRetryableError, ValueError):
+    """update_document() was given a document_id that does not exist."""
+
+
+class IngestionCancelled(RuntimeError):
+    """The run's `cancel` event was set (e.g. its job lease was lost)."""
+
+
+def check_cancelled(cancel: Optional[threading.Event], ingestion_id: str) -> None:
+    """Raise IngestionCancelled once `cancel` is set; called between windows."""
+    if cancel is not None and cancel.is_set():
+        raise IngestionCancelled(f"Ingestion {ingestion_id} cancelled")
+
+
+def chunk_text(
+    text: str,
+    *,
+    source_type: str,
+    provider: str,
+    chunker: Optional[BaseChunker] = None,
+    tokenizer: Optional[str] = None,
+) -> list[Chunk]:
+    """
+    Chunk text using the given (or heuristically selected) chunker and add
+    provenance metadata to each chunk.
+
+    Module-level so it can run in a worker process (AsyncIngestionPipeline).
+    `tokenizer` names the tokenizer of the selected strategy's token budgets.
+    """
+    return list(iter_chunk_text(
+        text,
+        source_type=source_type,
+        provider=provider,
+        chunker=chunker,
+        tokenizer=tokenizer,
+    ))
+
+
+def iter_chunk_text(
+    text: str,
+    *,
+    source_type: str,
+    provider: str,
+    chunker: Optional[BaseChunker] = None,
+    tokenizer: Optional[str] = None,
+) -> Iterator[Chunk]:
+    """chunk_text(), building each chunk only when the consumer asks for it."""
+    logger.debug(
+        f"🔪 pipeline.py chunk_text() text_len={len(text)} source_type={source_type}"
+    )
+
+    if chunker is None:
+        selected_chunker, chunker_params = ChunkerFactory.choose_strategy(
+            text, tokenizer=tokenizer
+        )
+    else:
+        selected_chunker = chunker
+        chunker_params = {}
+
+    chunk_strategy = getattr(selected_chunker, "chunk_strategy", "unknown")
+
+    chunker_name = getattr(
+        selected_chunker, "name", selected_chunker.__class__.__name__
+    )
+    logger.debug(f"   → Selected chunker: {chunker_name}")
+    logger.debug(f"   → Strategy: {chunk_strategy}")
+
+    # Add provenance metadata to each chunk; it is identical for all of
+    # them, so they share one (read-only) dict
+    provenance = shared_metadata(
+        {
+            "chunk_strategy": chunk_strategy,
+            "chunker_name": getattr(
+                selected_chunker,
+                "name",
+                selected_chunker.__class__.__name__,
+            ),
+            "chunker_params": dict(chunker_params),
+            "source_type": source_type,
+            "provider": provider,
+        }
+    )
+    for i, chunk in enumerate(selected_chunker.iter_chunks(text, **chunker_params)):
+        chunk.metadata = (
+            {**chunk.metadata, **provenance} if chunk.metadata else provenance
+        )
+        logger.debug(f"   → Chunk {i}: {len(chunk.content)} chars")
+        yield chunk
+
+
+def discard_previous_attempt(vector_store, ingestion_id: str) -> None:
+    """
+    Undo what an earlier, failed attempt of this ingestion wrote, so a retry
+    starts clean: its vectors (streamed windows may have been persisted
+    before the failure) and its DocumentNode(s). Vectors go first, since
+    vector_chunks rows reference the node.
+    """
+    vector_store.delete_by_ingestion_id(ingestion_id)
+    sessionmaker = get_sessionmaker()
+    with sessionmaker() as session:
+        deleted = delete_document_nodes_by_ingestion(session, UUID(ingestion_id))
+    logger.info(
+        f"🧹 Retry of {ingestion_id}: discarded vectors and "
+        f"{deleted} DocumentNode(s)"
+    )
+
+
 class IngestionPipeline:
     """
     Orchestrates the ingestion pipeline: validate → chunk → embed → persist.
@@ -23,6 +139,22 @@ class IngestionPipeline:
     Two entry points:
     - run(): For text-based ingestion (extracts, chunks, embeds, persists)
     - run_with_chunks(): For pre-chunked content like PDFs (embeds, persists)
+    - update_document(): Re-ingest an existing document, embedding only
+      new / changed chunks
+
+    With window_size > 0, run()/run_with_chunks() stream: chunks flow in
+    windows of window_size through embed → persist, with at most
+    max_pending_windows embedded windows waiting for the persist thread.
+    run() chunks the text lazily into those windows, and run_with_chunks()
+    accepts any iterable (e.g. PDFChunkAssembler.iter_assemble()), so chunk
+    objects and embeddings stay bounded by the window size; the source text
+    itself is still held whole. Embedding of window N+1 overlaps
+    persistence of window N.
+
+    Both accept a `cancel` event, checked before every window is embedded
+    and persisted: once set, no further window is written and the run
+    raises IngestionCancelled. window_size=0 keeps the one-shot
+    embed-everything-then-persist behaviour.
     """
 
     def __init__(
@@ -32,11 +164,17 @@ class IngestionPipeline:
         chunker: Optional[BaseChunker] = None,
         embedder,
         vector_store,
+        window_size: int = 0,
+        max_pending_windows: int = 2,
+        tokenizer: Optional[str] = None,
     ) -> None:
         self._validator = validator
         self._chunker = chunker
+        self._tokenizer = tokenizer
         self._embedder = embedder
         self._vector_store = vector_store
+        self._window_size = window_size
+        self._max_pending_windows = max(1, max_pending_windows)
 
     def run(
         self,
@@ -45,6 +183,7 @@ class IngestionPipeline:
         ingestion_id: str,
         source_type: str,
         provider: str,
+        cancel: Optional[threading.Event] = None,
     ) -> None:
         """
         Full pipeline: validate → chunk → embed → persist + DocumentNode (MS6).
@@ -82,34 +221,47 @@ class IngestionPipeline:
 
         # Continue normal pipeline
         self._validate(text)
-        chunks = self._chunk(
-            text=text,
+        chunks = iter_chunk_text(
+            text,
             source_type=source_type,
             provider=provider,
+            chunker=self._chunker,
+            tokenizer=self._tokenizer,
         )
-        embeddings = self._embed(chunks)
-        logger.debug(f"📦 MS6 run() Persisting {len(chunks)} chunks with document_id={document_id}")
-        self._persist(chunks, embeddings, ingestion_id, str(document_id))
+        logger.debug(f"📦 MS6 run() Persisting chunks with document_id={document_id}")
+        total = self._embed_and_persist(chunks, ingestion_id, str(document_id), cancel)
+        logger.debug(f"✅ MS6 run() persisted {total} chunks")
 
     def run_with_chunks(
         self,
         *,
-        chunks: list[Chunk],
+        chunks: Iterable[Chunk],
         ingestion_id: str,
+        cancel: Optional[threading.Event] = None,
     ) -> None:
         """
         Pipeline for pre-chunked content: DocumentNode → embed → persist (MS6).
         Use this for PDFs or other content where chunking happened upstream.
+        `chunks` may be a lazy iterator; it is consumed once.
         """
-        logger.debug(f"🔄 pipeline.py run_with_chunks() - PDF PATH - {len(chunks)} pre-chunked items")
-        
+        logger.debug("🔄 pipeline.py run_with_chunks() - PDF PATH - pre-chunked items")
+
+        chunks = iter(chunks)
+        first = next(chunks, None)
+        if first is not None:
+            chunks = chain([first], chunks)
+
         # MS6: Create DocumentNode FIRST
         sessionmaker = get_sessionmaker()
         with sessionmaker() as session:
             document_id = uuid4()
             # 🔥 MS7 FIX: Use exact source format that summary.py expects
             source = f"file_document_{ingestion_id}"  # Full UUID to match summary.py
-            title = chunks[0].metadata.get("filename", "untitled") if chunks else "untitled"
+            title = (
+                first.metadata.get("filename", "untitled")
+                if first is not None
+                else "untitled"
+            )
             
             logger.debug(f"📝 MS6 run_with_chunks() Creating DocumentNode:")
             logger.debug(f"   ingestion_id: {ingestion_id}")
@@ -131,9 +283,89 @@ class IngestionPipeline:
             logger.debug(f"   → summary.py will look for source='{source}'")
 
         # Continue pipeline
-        embeddings = self._embed(chunks)
-        logger.debug(f"📦 MS6 run_with_chunks() Persisting {len(chunks)} chunks with document_id={document_id}")
-        self._persist(chunks, embeddings, ingestion_id, str(document_id))
+        logger.debug(
+            f"📦 MS6 run_with_chunks() Persisting chunks with document_id={document_id}"
+        )
+        total = self._embed_and_persist(chunks, ingestion_id, str(document_id), cancel)
+        logger.debug(f"✅ MS6 run_with_chunks() persisted {total} chunks")
+
+    def discard_previous_attempt(self, ingestion_id: str) -> None:
+        """See discard_previous_attempt(); call before re-running a retry."""
+        discard_previous_attempt(self._vector_store, ingestion_id)
+
+    def update_document(
+        self,
+        *,
+        document_id: str,
+        ingestion_id: str,
+        text: Optional[str] = None,
+        chunks: Optional[list[Chunk]] = None,
+        source_type: str = "file",
+        provider: str = "mock",
+    ) -> dict[str, int]:
+        """
+        Incremental re-ingestion of an existing DocumentNode.
+
+        Chunk ids are deterministic, so a stored chunk with the same id and
+        identical text is kept as-is (no embedding call); only new or changed
+        chunks are embedded, and stored chunks that disappeared are deleted.
+        Pass either `text` (chunked here) or pre-assembled `chunks`.
+
+        The DocumentNode is pointed at the new ingestion only once the
+        vector store sync succeeded, so a failed update leaves it as it was.
+        Raises DocumentNotFound (not retried by the worker) for unknown ids.
+        """
+        if (text is None) == (chunks is None):
+            raise ValueError("update_document needs exactly one of text or chunks")
+
+        sessionmaker = get_sessionmaker()
+        with sessionmaker() as session:
+            if get_document_node(session, UUID(document_id)) is None:
+                raise DocumentNotFound(f"Document {document_id} not found")
+
+        if text is not None:
+            self._validate(text)
+            chunks = self._chunk(text=text, source_type=source_type, provider=provider)
+
+        stored = {
+            c["chunk_id"]: content_hash(c["text"])
+            for c in self._vector_store.list_document_chunks(document_id)
+        }
+        keep: list[tuple[str, int, Optional[int], Optional[int]]] = []
+        changed: list[tuple[int, Chunk]] = []
+        for index, chunk in enumerate(chunks or []):
+            if stored.get(chunk.chunk_id) == content_hash(chunk.content):
+                # same text, possibly at new offsets: the store rewrites them
+                keep.append((chunk.chunk_id, index, chunk.char_start, chunk.char_end))
+            else:
+                changed.append((index, chunk))
+
+        embeddings = self._embed([chunk for _, chunk in changed]) if changed else []
+        result = self._vector_store.sync_document(
+            document_id=document_id,
+            ingestion_id=ingestion_id,
+            keep=keep,
+            changed=changed,
+            embeddings=embeddings,
+        )
+        with sessionmaker() as session:
+            node = reassign_document_node(
+                session,
+                document_id=UUID(document_id),
+                ingestion_id=UUID(ingestion_id),
+                source=f"file_document_{ingestion_id}",  # MS7: summary.py lookup
+            )
+        if node is None:
+            raise DocumentNotFound(f"Document {document_id} was deleted during update")
+        logger.info(
+            f"🔁 update_document {document_id}: {len(keep)} unchanged, "
+            f"{len(changed)} embedded, {len(stored) - len(keep)} replaced/removed"
+        )
+        return {
+            "kept": len(keep),
+            "embedded": len(changed),
+            "deleted": result.get("deleted", 0),
+        }
 
     def _validate(self, text: str) -> None:
         """Validate input text (currently no-op)."""
@@ -149,38 +381,96 @@ class IngestionPipeline:
         Chunk text using selected strategy.
         Adds provenance metadata to each chunk for provenance.
         """
-        logger.debug(f"🔪 pipeline.py _chunk() text_len={len(text)} source_type={source_type}")
-        
-        if self._chunker is None:
-            selected_chunker, chunker_params = ChunkerFactory.choose_strategy(text)
-        else:
-            selected_chunker = self._chunker
-            chunker_params = {}
-
-        chunks: list[Chunk] = selected_chunker.chunk(text, **chunker_params)
-        chunk_strategy = getattr(selected_chunker, "chunk_strategy", "unknown")
-
-        logger.debug(f"   → Selected chunker: {getattr(selected_chunker, 'name', selected_chunker.__class__.__name__)}")
-        logger.debug(f"   → Strategy: {chunk_strategy}, Chunks produced: {len(chunks)}")
-
-        # Add provenance metadata to each chunk
-        for i, chunk in enumerate(chunks):
-            chunk.metadata.update(
-                {
-                    "chunk_strategy": chunk_strategy,
-                    "chunker_name": getattr(
-                        selected_chunker,
-                        "name",
-                        selected_chunker.__class__.__name__,
-                    ),
-                    "chunker_params": dict(chunker_params),
-                    "source_type": source_type,
-                    "provider": provider,
-                }
-            )
-            logger.debug(f"   → Chunk {i}: {len(chunk.content)} chars")
+        return chunk_text(
+            text,
+            source_type=source_type,
+            provider=provider,
+            chunker=self._chunker,
+            tokenizer=self._tokenizer,
+        )
+
+    def _embed_and_persist(
+        self,
+        chunks: Iterable[Chunk],
+        ingestion_id: str,
+        document_id: str,
+        cancel: Optional[threading.Event] = None,
+    ) -> int:
+        """Embed + persist all chunks, streaming when window_size > 0."""
+        if self._window_size <= 0:
+            chunks = list(chunks)
+            check_cancelled(cancel, ingestion_id)
+            embeddings = self._embed(chunks)
+            check_cancelled(cancel, ingestion_id)
+            self._persist(chunks, embeddings, ingestion_id, document_id)
+            return len(chunks)
+        return self._stream(chunks, ingestion_id, document_id, cancel)
+
+    @staticmethod
+    def _windows(chunks: Iterable[Chunk], size: int) -> Iterator[list[Chunk]]:
+        iterator = iter(chunks)
+        while window := list(islice(iterator, size)):
+            yield window
+
+    def _stream(
+        self,
+        chunks: Iterable[Chunk],
+        ingestion_id: str,
+        document_id: str,
+        cancel: Optional[threading.Event] = None,
+    ) -> int:
+        """
+        embed (calling thread) → bounded queue → persist (worker thread).
+
+        The queue holds at most max_pending_windows embedded windows, so a
+        slow vector store back-pressures the embedder instead of buffering.
+        Windows still queued when `cancel` is set are dropped, not persisted.
+        """
+        pending: queue.Queue = queue.Queue(maxsize=self._max_pending_windows)
+        persist_error: list[BaseException] = []
+        done = object()
 
-        return chunks
+        def _persist_worker() -> None:
+            while True:
+                item = pending.get()
+                if item is done:
+                    return
+                if persist_error:
+                    continue  # drain so the producer never blocks forever
+                window, embeddings, offset = item
+                try:
+                    check_cancelled(cancel, ingestion_id)
+                    self._persist(
+                        window, embeddings, ingestion_id, document_id,
+                        chunk_index_offset=offset,
+                    )
+                except BaseException as exc:
+                    persist_error.append(exc)
+
+        writer = threading.Thread(
+            target=_persist_worker, name=f"persist-{ingestion_id[:8]}", daemon=True
+        )
+        writer.start()
+
+        total = 0
+        try:
+            for window in self._windows(chunks, self._window_size):
+                if persist_error:
+                    break
+                check_cancelled(cancel, ingestion_id)
+                embeddings = self._embed(window)
+                pending.put((window, embeddings, total))
+                total += len(window)
+        finally:
+            pending.put(done)
+            writer.join()
+
+        if persist_error:
+            raise persist_error[0]
+        logger.debug(
+            f"✅ _stream() persisted {total} chunks in windows of {self._window_size}"
+        )
+        return total
 
     def _embed(self, chunks: list[Chunk]) -> list[Any]:
         """
@@ -204,9 +494,12 @@ class IngestionPipeline:
         embeddings: list[Any],
         ingestion_id: str,
         document_id: str,  # MS6-IS1: Link chunks to DocumentNode
+        chunk_index_offset: int = 0,
     ) -> None:
         """
         Persist chunks and embeddings to vector store.
+
+        chunk_index_offset is the document-wide index of chunks[0] (streaming).
         """
         logger.debug(f"💾 pipeline.py _persist() {len(chunks)} chunks doc_id={document_id}")
         logger.debug(f"   → ingestion_id: {ingestion_id}")
@@ -215,5 +508,6 @@ class IngestionPipeline:
             embeddings=embeddings,
             ingestion_id=ingestion_id,
             document_id=document_id,  # MS6-IS1: Pass to vector store
+            chunk_index_offset=chunk_index_offset,
         )
         logger.debug(f"✅ _persist() COMPLETE for doc_id={document_id}")
@@ -0,0 +1,353 @@
+# ingestion_service/src/core/worker.py
+"""
+Ingestion worker pool.
+
+Runs outside the API process and drains the Postgres-backed job queue:
+
+    python -m src.core.worker [--concurrency N]
+
+Each worker process leases one job at a time (FOR UPDATE SKIP LOCKED),
+renews the lease from a heartbeat thread while the job runs, and records
+completion / retry / failure. Run as many pools on as many hosts as
+needed; they only have to share the database and INGEST_SPOOL_DIR.
+
+With INGEST_ASYNC_PIPELINE=true each worker process instead keeps up to
+INGEST_DOCS_IN_FLIGHT jobs running through one AsyncIngestionPipeline, so
+extraction of one document overlaps embedding and persisting of others.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import logging
+import multiprocessing as mp
+import os
+import signal
+import socket
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator, Optional
+from uuid import uuid4
+
+from src.core.config import get_settings
+from src.core.database_session import get_sessionmaker
+from src.core.async_pipeline import AsyncIngestionPipeline
+from src.core.http_vectorstore import HttpVectorStore
+from src.core.ingest_runner import build_embedder, dispatch_summary, ingest_file_bytes
+from src.core.job_queue import (
+    LEASE_LOST,
+    IngestionJob,
+    IngestionJobQueue,
+    NonRetryableError,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def build_queue() -> IngestionJobQueue:
+    settings = get_settings()
+    return IngestionJobQueue(
+        get_sessionmaker(),
+        lease_seconds=settings.INGEST_LEASE_SECONDS,
+        backoff_seconds=settings.INGEST_RETRY_BACKOFF_SECONDS,
+        backoff_max_seconds=settings.INGEST_RETRY_BACKOFF_MAX_SECONDS,
+    )
+
+
+def remove_payload(payload_path: str | None) -> None:
+    if payload_path:
+        Path(payload_path).unlink(missing_ok=True)
+
+
+@contextmanager
+def lease_heartbeat(
+    queue: IngestionJobQueue, job: IngestionJob, worker_id: str
+) -> Iterator[threading.Event]:
+    """
+    Renew the job's lease every lease_seconds / 3 until the block exits.
+
+    Yields a "lease lost" event, set once a renewal finds the job re-leased
+    or no renewal has succeeded for lease_seconds (another worker may own
+    the job by then). Pass it to the pipeline as `cancel`, so this run
+    stops writing before the new owner discards and rewrites the document.
+    """
+    stop = threading.Event()
+    lost = threading.Event()
+    interval = max(queue.lease_seconds / 3, 1.0)
+
+    def _beat() -> None:
+        renewed_at = time.monotonic()
+        while not stop.wait(interval):
+            try:
+                if not queue.renew(job, worker_id):
+                    logger.warning(f"⚠️ Lost lease on {job.ingestion_id}; cancel")
+                    lost.set()
+                    return
+                renewed_at = time.monotonic()
+            except Exception as exc:
+                logger.warning(
+                    f"⚠️ Lease renewal failed for {job.ingestion_id}: {exc}"
+                )
+                if time.monotonic() - renewed_at >= queue.lease_seconds:
+                    logger.warning(f"⚠️ Lease on {job.ingestion_id} expired")
+                    lost.set()
+                    return
+
+    thread = threading.Thread(
+        target=_beat, name=f"lease-{job.ingestion_id}", daemon=True
+    )
+    thread.start()
+    try:
+        yield lost
+    finally:
+        stop.set()
+        thread.join()
+
+
+def settle_job(
+    queue: IngestionJobQueue,
+    job: IngestionJob,
+    worker_id: str,
+    error: Optional[Exception],
+) -> str:
+    """
+    Record the outcome of a job run; returns the resulting status.
+
+    If the lease was lost meanwhile, the job belongs to another run: its
+    payload and summary are left alone and LEASE_LOST is returned.
+    """
+    if error is not None:
+        retryable = not isinstance(error, NonRetryableError)
+        status = queue.fail(job, worker_id, str(error), retryable=retryable)
+        logger.error(
+            f"❌ Ingestion failed: {job.ingestion_id} - {error} (status={status})"
+        )
+        if status == "failed":
+            remove_payload(job.payload_path)
+        return status
+
+    if not queue.complete(job, worker_id):
+        logger.warning(
+            f"⚠️ Lost lease on {job.ingestion_id} before completion; "
+            "leaving it to its new owner"
+        )
+        return LEASE_LOST
+    remove_payload(job.payload_path)
+    dispatch_summary(job.ingestion_id)
+    return "completed"
+
+
+def process_job(queue: IngestionJobQueue, job: IngestionJob, worker_id: str) -> str:
+    """Run one leased job; returns the resulting status."""
+    logger.info(
+        f"▶️ {worker_id} ingesting {job.ingestion_id} "
+        f"(attempt {job.attempts}/{job.max_attempts})"
+    )
+    try:
+        with lease_heartbeat(queue, job, worker_id) as lease_lost:
+            file_bytes = Path(job.payload_path).read_bytes()
+            ingest_file_bytes(
+                ingestion_id=job.ingestion_id,
+                file_bytes=file_bytes,
+                filename=job.filename,
+                content_type=job.content_type,
+                metadata=job.metadata,
+                attempt=job.attempts,
+                cancel=lease_lost,
+            )
+    except Exception as exc:
+        return settle_job(queue, job, worker_id, exc)
+    return settle_job(queue, job, worker_id, None)
+
+
+async def process_job_async(
+    queue: IngestionJobQueue,
+    job: IngestionJob,
+    worker_id: str,
+    pipeline: AsyncIngestionPipeline,
+) -> str:
+    """process_job() on the async pipeline; incremental updates use the sync path."""
+    logger.info(
+        f"▶️ {worker_id} ingesting {job.ingestion_id} "
+        f"(attempt {job.attempts}/{job.max_attempts}, async)"
+    )
+    try:
+        with lease_heartbeat(queue, job, worker_id) as lease_lost:
+            file_bytes = await asyncio.to_thread(Path(job.payload_path).read_bytes)
+            if job.metadata.get("update_document_id"):
+                await asyncio.to_thread(
+                    ingest_file_bytes,
+                    ingestion_id=job.ingestion_id,
+                    file_bytes=file_bytes,
+                    filename=job.filename,
+                    content_type=job.content_type,
+                    metadata=job.metadata,
+                    attempt=job.attempts,
+                    cancel=lease_lost,
+                )
+            else:
+                await pipeline.ingest(
+                    ingestion_id=str(job.ingestion_id),
+                    file_bytes=file_bytes,
+                    filename=job.filename,
+                    content_type=job.content_type,
+                    ocr_provider=job.metadata.get("ocr_provider"),
+                    provider=get_settings().EMBEDDING_PROVIDER,
+                    retry=job.attempts > 1,
+                    cancel=lease_lost,
+                )
+    except Exception as exc:
+        return await asyncio.to_thread(settle_job, queue, job, worker_id, exc)
+    return await asyncio.to_thread(settle_job, queue, job, worker_id, None)
+
+
+def run_worker(worker_id: str, stop_event, poll_interval: float) -> None:
+    """Lease-and-process loop for a single worker process."""
+    logging.basicConfig(level=logging.INFO)
+    signal.signal(signal.SIGINT, signal.SIG_IGN)  # the supervisor handles shutdown
+
+    queue = build_queue()
+    while not stop_event.is_set():
+        try:
+            job = queue.lease(worker_id)
+            if job is None:
+                for _, payload_path in queue.reap_expired():
+                    remove_payload(payload_path)
+                stop_event.wait(poll_interval)
+                continue
+            process_job(queue, job, worker_id)
+        except Exception as exc:
+            logger.exception(f"Worker {worker_id} loop error: {exc}")
+            stop_event.wait(poll_interval)
+
+
+def build_async_pipeline() -> AsyncIngestionPipeline:
+    settings = get_settings()
+    return AsyncIngestionPipeline(
+        embedder=build_embedder(),
+        vector_store=HttpVectorStore(
+            base_url=settings.VECTOR_STORE_SERVICE_URL,
+            provider=settings.EMBEDDING_PROVIDER,
+        ),
+        window_size=max(settings.INGEST_STREAM_WINDOW_SIZE, 1),
+        extract_processes=settings.INGEST_EXTRACT_PROCESSES,
+        embed_concurrency=settings.INGEST_EMBED_CONCURRENCY,
+        persist_concurrency=settings.INGEST_PERSIST_CONCURRENCY,
+        max_pending_windows=max(settings.INGEST_STREAM_MAX_PENDING_WINDOWS, 1),
+    )
+
+
+async def serve_async(
+    queue: IngestionJobQueue,
+    pipeline: AsyncIngestionPipeline,
+    worker_id: str,
+    stop_event,
+    poll_interval: float,
+    docs_in_flight: int,
+) -> None:
+    """
+    Keep up to docs_in_flight leased jobs running on one pipeline until stopped.
+
+    Each job is leased under its own token ("<worker_id>:<uuid>"), so renew /
+    complete / fail for one in-flight job can never match another job this
+    process leased, nor a re-lease of the same job after its lease expired.
+    """
+    in_flight: set[asyncio.Task] = set()
+    async with pipeline:
+        while not stop_event.is_set():
+            try:
+                while len(in_flight) < docs_in_flight:
+                    lease_token = f"{worker_id}:{uuid4()}"
+                    job = await asyncio.to_thread(queue.lease, lease_token)
+                    if job is None:
+                        break
+                    in_flight.add(asyncio.create_task(
+                        process_job_async(queue, job, lease_token, pipeline)
+                    ))
+                if not in_flight:
+                    for _, payload_path in await asyncio.to_thread(queue.reap_expired):
+                        remove_payload(payload_path)
+                    await asyncio.to_thread(stop_event.wait, poll_interval)
+                    continue
+                _, in_flight = await asyncio.wait(
+                    in_flight,
+                    timeout=poll_interval,
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+            except Exception as exc:
+                logger.exception(f"Worker {worker_id} loop error: {exc}")
+                await asyncio.to_thread(stop_event.wait, poll_interval)
+
+        # Finish in-flight jobs before the pipeline shuts down
+        if in_flight:
+            await asyncio.wait(in_flight)
+
+
+def run_async_worker(worker_id: str, stop_event, poll_interval: float) -> None:
+    """run_worker() for the overlapped asyncio pipeline."""
+    logging.basicConfig(level=logging.INFO)
+    signal.signal(signal.SIGINT, signal.SIG_IGN)  # the supervisor handles shutdown
+
+    settings = get_settings()
+    asyncio.run(serve_async(
+        build_queue(), build_async_pipeline(), worker_id,
+        stop_event, poll_interval, settings.INGEST_DOCS_IN_FLIGHT,
+    ))
+
+
+def main() -> None:
+    settings = get_settings()
+    parser = argparse.ArgumentParser(description="Run the ingestion worker pool")
+    parser.add_argument(
+        "--concurrency", type=int, default=settings.INGEST_WORKER_CONCURRENCY
+    )
+    parser.add_argument(
+        "--poll-interval",
+        type=float,
+        default=settings.INGEST_POLL_INTERVAL_SECONDS,
+    )
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    ctx = mp.get_context("spawn")
+    stop_event = ctx.Event()
+    prefix = f"{socket.gethostname()}-{os.getpid()}"
+    target = run_async_worker if settings.INGEST_ASYNC_PIPELINE else run_worker
+
+    def _spawn(slot: int):
+        proc = ctx.Process(
+            target=target,
+            args=(f"{prefix}-{slot}", stop_event, args.poll_interval),
+            name=f"ingest-worker-{slot}",
+        )
+        proc.start()
+        return proc
+
+    def _shutdown(signum, frame) -> None:
+        logger.info("Stopping ingestion workers (finishing in-flight jobs)...")
+        stop_event.set()
+
+    signal.signal(signal.SIGTERM, _shutdown)
+    signal.signal(signal.SIGINT, _shutdown)
+
+    procs = {slot: _spawn(slot) for slot in range(args.concurrency)}
+    logger.info(f"Started {args.concurrency} ingestion workers")
+
+    # Supervise: restart crashed workers; their leases expire and are retried.
+    while not stop_event.is_set():
+        for slot, proc in procs.items():
+            if not proc.is_alive() and not stop_event.is_set():
+                logger.warning(
+                    f"⚠️ Worker {proc.name} exited ({proc.exitcode}); restarting"
+                )
+                procs[slot] = _spawn(slot)
+        stop_event.wait(1.0)
+
+    for proc in procs.values():
+        proc.join()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+# ingestion_service/tests/api/test_ingest_dedup.py
+import io
+from unittest.mock import MagicMock, patch
+from uuid import uuid4
+
+import pytest
+from fastapi import UploadFile
+
+from src.api.v1 import ingest
+
+
+def _upload(tmp_path, document_id=None, duplicate_policy="skip", duplicate=True):
+    payload = tmp_path / "payload"
+    payload.write_bytes(b"same bytes")
+    with patch.object(ingest, "spool_upload", return_value=(payload, "sha")), \
+            patch.object(ingest, "content_lock") as lock, \
+            patch.object(ingest, "find_duplicate") as find, \
+            patch.object(ingest, "_get_job_queue") as job_queue:
+        original = None
+        if duplicate:
+            original = MagicMock(ingestion_id=uuid4(), status="completed")
+        find.return_value = original
+        response = ingest.ingest_file(
+            file=UploadFile(io.BytesIO(b"same bytes"), filename="a.txt"),
+            metadata=None,
+            duplicate_policy=duplicate_policy,
+            document_id=document_id,
+        )
+    return response, original, lock, find, job_queue.return_value
+
+
+def test_duplicate_upload_is_short_circuited_under_content_lock(tmp_path):
+    response, original, lock, find, job_queue = _upload(tmp_path)
+
+    assert original is not None
+    assert response.duplicate_of == original.ingestion_id
+    lock.assert_called_once_with("sha")
+    find.assert_called_once_with(lock.return_value.__enter__.return_value, "sha")
+    job_queue.enqueue.assert_not_called()
+
+
+def test_new_upload_is_enqueued_on_the_locked_session(tmp_path):
+    response, _, lock, _, job_queue = _upload(tmp_path, duplicate=False)
+
+    assert response.status == "accepted"
+    session = lock.return_value.__enter__.return_value
+    assert job_queue.enqueue.call_args.kwargs["session"] is session
+
+
+def test_document_update_skips_dedup(tmp_path):
+    document_id = str(uuid4())
+    response, _, lock, find, job_queue = _upload(tmp_path, document_id=document_id)
+
+    assert response.status == "accepted" and response.duplicate_of is None
+    lock.assert_not_called()
+    find.assert_not_called()
+    metadata = job_queue.enqueue.call_args.kwargs["metadata"]
+    assert metadata["update_document_id"] == document_id
+
+
+def test_payload_is_removed_when_dedup_lookup_fails(tmp_path):
+    payload = tmp_path / "payload"
+    payload.write_bytes(b"same bytes")
+    with patch.object(ingest, "spool_upload", return_value=(payload, "sha")), \
+            patch.object(ingest, "content_lock"), \
+            patch.object(ingest, "find_duplicate", side_effect=RuntimeError("db down")):
+        with pytest.raises(RuntimeError, match="db down"):
+            ingest.ingest_file(
+                file=UploadFile(io.BytesIO(b"same bytes"), filename="a.txt"),
+                metadata=None,
+                duplicate_policy="skip",
+                document_id=None,
+            )
+
+    assert not payload.exists()
+
+
+def test_spool_upload_removes_partial_file_on_read_error(tmp_path):
+    upload = MagicMock()
+    upload.file.read.side_effect = OSError("client went away")
+
+    with patch.object(ingest, "get_settings") as settings:
+        settings.return_value.INGEST_SPOOL_DIR = str(tmp_path)
+        with pytest.raises(OSError):
+            ingest.spool_upload(upload, uuid4())
+
+    assert list(tmp_path.iterdir()) == []
@@ -0,0 +1,84 @@
+# ingestion_service/tests/api/test_summary_batch.py
+from uuid import uuid4
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, insert
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from src.api.v1 import summary
+from src.core.models import metadata
+from src.core.models_v2.document_node import DocumentNode
+
+
+@pytest.fixture
+def client(monkeypatch):
+    # Models live in the "ingestion_service" schema; SQLite has only main.
+    # One shared connection: the endpoint runs in TestClient's threadpool.
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+        execution_options={"schema_translate_map": {"ingestion_service": None}},
+    )
+    tables = [t for t in metadata.sorted_tables if t.name == "document_nodes"]
+    metadata.create_all(engine, tables=tables)
+    session_factory = sessionmaker(bind=engine)
+    monkeypatch.setattr(summary, "SessionLocal", session_factory)
+
+    app = FastAPI()
+    app.include_router(summary.router, prefix="/v1")
+    with TestClient(app) as test_client:
+        test_client.session_factory = session_factory
+        yield test_client
+
+
+def _add_document(client, summary_text: str) -> str:
+    with client.session_factory() as session:
+        document_id = str(uuid4())
+        session.execute(insert(DocumentNode).values(
+            document_id=document_id, title="Doc", summary=summary_text,
+            source="unit-test", ingestion_id="ing", doc_type="txt",
+        ))
+        session.commit()
+        return document_id
+
+
+def test_batch_get_returns_non_empty_summaries_only(client):
+    with_summary = _add_document(client, "a summary")
+    empty = _add_document(client, "")
+    missing = str(uuid4())
+
+    resp = client.post(
+        "/v1/summaries:batchGet",
+        json={"document_ids": [with_summary, empty, missing, with_summary.upper()]},
+    )
+
+    assert resp.status_code == 200
+    assert resp.json() == {"summaries": {with_summary: "a summary"}}
+
+
+def test_batch_get_rejects_non_uuid_ids(client):
+    resp = client.post(
+        "/v1/summaries:batchGet",
+        json={"document_ids": [str(uuid4()), "not-a-uuid"]},
+    )
+
+    assert resp.status_code == 400
+    assert "not-a-uuid" in resp.json()["detail"]
+
+
+def test_batch_get_limits_batch_size(client):
+    resp = client.post(
+        "/v1/summaries:batchGet", json={"document_ids": [str(uuid4())] * 1001}
+    )
+
+    assert resp.status_code == 422
+
+
+def test_batch_get_empty(client):
+    resp = client.post("/v1/summaries:batchGet", json={"document_ids": []})
+
+    assert resp.json() == {"summaries": {}}
@@ -27,3 +27,10 @@ def test_choose_strategy_long_text():
     text = "a" * 20000
     chunker, params = ChunkerFactory.choose_strategy(text)
     assert chunker.chunk_strategy == "simple"
+
+def test_choose_strategy_uses_token_budgets():
+    chunker, params = ChunkerFactory.choose_strategy("short text", tokenizer="regex")
+    assert params["tokenizer"] == "regex"
+
+    chunks = chunker.chunk("short text. " * 100, **params)
+    assert all(c.token_count <= params["chunk_size"] for c in chunks)
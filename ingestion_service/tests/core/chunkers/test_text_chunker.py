@@ -71,3 +71,99 @@ def test_unknown_strategy_raises():
 
     with pytest.raises(ValueError):
         chunker.chunk("text")
+
+def test_chunk_ids_are_deterministic_content_hashes():
+    text = "Same sentence. Other sentence. Same sentence."
+    chunker = TextChunker(chunk_strategy="sentence")
+
+    first = chunker.chunk(text, chunk_size=15)
+    second = chunker.chunk(text, chunk_size=15)
+
+    assert [c.chunk_id for c in first] == [c.chunk_id for c in second]
+    # Repeated text still gets a unique id
+    assert len({c.chunk_id for c in first}) == len(first)
+    assert first[2].chunk_id == f"{first[0].chunk_id}-2"
+
+
+@pytest.mark.parametrize("strategy", ["simple", "sentence", "paragraph"])
+def test_chunks_carry_offsets_into_the_source_text(strategy):
+    text = "First sentence here. Second one!\n\nThird paragraph? Yes.\n\n\n\nLast."
+    chunker = TextChunker(chunk_strategy=strategy)
+
+    chunks = chunker.chunk(text, chunk_size=25, overlap=5)
+
+    assert chunks
+    assert all(text[c.char_start:c.char_end] == c.content for c in chunks)
+    spans = chunker.spans(text, chunk_size=25, overlap=5)
+    assert [(c.char_start, c.char_end) for c in chunks] == spans
+
+
+def test_simple_chunking_overlaps_windows():
+    chunker = TextChunker(chunk_size=10, overlap=4, chunk_strategy="simple")
+    assert chunker.spans("x" * 20) == [(0, 10), (6, 16), (12, 20), (18, 20)]
+
+
+def test_simple_chunking_rejects_overlap_not_smaller_than_size():
+    with pytest.raises(ValueError):
+        TextChunker(chunk_size=10, overlap=10, chunk_strategy="simple").chunk("x" * 20)
+
+
+def test_paragraph_spans_trim_whitespace_and_skip_empty_paragraphs():
+    text = "  Alpha  \n\n\n\n   \n\nBeta"
+    chunks = TextChunker(chunk_strategy="paragraph").chunk(text, chunk_size=5)
+
+    assert [c.content for c in chunks] == ["Alpha", "Beta"]
+
+
+def test_regex_tokenizer_offsets_and_count():
+    from shared.chunkers.tokenizer import get_tokenizer
+
+    tokenizer = get_tokenizer("regex")
+    text = "Tokenization, 12345!"
+
+    offsets = tokenizer.offsets(text)
+
+    pieces = [text[s:e] for s, e in offsets]
+    assert pieces == ["Tokeniza", "tion", ",", "123", "45", "!"]
+    assert tokenizer.count(text) == len(offsets)
+    assert get_tokenizer("regex") is tokenizer
+    with pytest.raises(ValueError):
+        get_tokenizer("does-not-exist")
+
+
+@pytest.mark.parametrize("strategy", ["simple", "sentence", "paragraph"])
+def test_token_budget_chunking_stays_within_budget(strategy):
+    from shared.chunkers.tokenizer import count_tokens
+
+    text = (
+        "One two three four. Five six seven eight nine ten eleven twelve thirteen.\n\n"
+        "Short. Another fairly short sentence here.\n\n" + "word " * 40
+    )
+    chunker = TextChunker(chunk_strategy=strategy, tokenizer="regex")
+
+    chunks = chunker.chunk(text, chunk_size=8, overlap=2)
+
+    assert chunks
+    counts = [c.token_count for c in chunks]
+    assert counts == [count_tokens(c.content) for c in chunks]
+    assert all(count is not None and 0 < count <= 8 for count in counts)
+    assert all(text[c.char_start:c.char_end] == c.content for c in chunks)
+
+
+def test_character_chunking_leaves_token_count_unset():
+    chunks = TextChunker(chunk_size=10, overlap=0).chunk("x" * 25)
+    assert all(c.token_count is None for c in chunks)
+
+
+def test_iter_chunks_matches_chunk_lazily():
+    text = "Same line. " * 3 + "Different line."
+    chunker = TextChunker(chunk_size=11, overlap=0, tokenizer="regex")
+
+    chunks = chunker.iter_chunks(text, chunk_size=3, overlap=0)
+    first = next(chunks)
+
+    expected = chunker.chunk(text, chunk_size=3, overlap=0)
+    assert [(c.chunk_id, c.content, c.token_count) for c in [first, *chunks]] == [
+        (c.chunk_id, c.content, c.token_count) for c in expected
+    ]
+    assert len({c.chunk_id for c in expected}) == len(expected)
@@ -0,0 +1,147 @@
+# ingestion_service/tests/core/test_async_pipeline.py
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+import pytest
+
+from shared.chunks import Chunk
+from src.core.async_pipeline import AsyncIngestionPipeline
+from src.core.pipeline import IngestionCancelled
+from src.core.http_vectorstore import HttpVectorStore
+
+
+def _chunks(n):
+    return [Chunk(chunk_id=f"c{i}", content="x" * (i + 1)) for i in range(n)]
+
+
+def _pipeline(http_client, embedder=None):
+    if embedder is None:
+        embedder = MagicMock()
+        embedder.embed.side_effect = lambda chunks: [
+            [float(len(c.content))] for c in chunks
+        ]
+    return AsyncIngestionPipeline(
+        embedder=embedder,
+        vector_store=HttpVectorStore(base_url="http://vs"),
+        window_size=2,
+        embed_concurrency=2,
+        persist_concurrency=2,
+        max_pending_windows=1,
+        extract_executor=ThreadPoolExecutor(max_workers=2),
+        http_client=http_client,
+    ), embedder
+
+
+async def _ingest_many(pipeline, n_docs):
+    async with pipeline:
+        return await asyncio.gather(*(
+            pipeline.ingest(
+                ingestion_id=str(uuid4()),
+                file_bytes=b"data",
+                filename="doc.txt",
+                content_type="text/plain",
+            )
+            for _ in range(n_docs)
+        ))
+
+
+@patch("src.core.async_pipeline.create_document", side_effect=lambda *_: str(uuid4()))
+@patch("src.core.async_pipeline.prepare_chunks", return_value=("file", _chunks(5)))
+def test_documents_in_flight_persist_every_window_with_global_indexes(
+    _prepare, _create
+):
+    http_client = MagicMock()
+    http_client.post = AsyncMock(return_value=MagicMock())
+    pipeline, embedder = _pipeline(http_client)
+
+    document_ids = asyncio.run(_ingest_many(pipeline, 3))
+
+    assert len(set(document_ids)) == 3
+    assert embedder.embed.call_count == 9  # 3 documents x windows of 2, 2, 1
+    records = [
+        r for c in http_client.post.call_args_list for r in c.kwargs["json"]["records"]
+    ]
+    for document_id in document_ids:
+        indexes = sorted(
+            r["metadata"]["chunk_index"]
+            for r in records
+            if r["metadata"]["document_id"] == document_id
+        )
+        assert indexes == [0, 1, 2, 3, 4]
+
+
+@patch("src.core.async_pipeline.create_document", side_effect=lambda *_: str(uuid4()))
+@patch("src.core.async_pipeline.prepare_chunks", return_value=("file", _chunks(5)))
+def test_failed_window_fails_only_its_document(_prepare, _create):
+    http_client = MagicMock()
+    http_client.post = AsyncMock(return_value=MagicMock())
+    embedder = MagicMock()
+    calls = {"n": 0}
+
+    def _embed(chunks):
+        calls["n"] += 1
+        if calls["n"] == 1:
+            raise RuntimeError("ollama down")
+        return [[1.0] for _ in chunks]
+
+    embedder.embed.side_effect = _embed
+    pipeline, _ = _pipeline(http_client, embedder)
+
+    async def _run():
+        async with pipeline:
+            first = await asyncio.gather(
+                pipeline.ingest(
+                    ingestion_id=str(uuid4()), file_bytes=b"a",
+                    filename="a.txt", content_type="text/plain",
+                ),
+                return_exceptions=True,
+            )
+            second = await pipeline.ingest(
+                ingestion_id=str(uuid4()), file_bytes=b"b",
+                filename="b.txt", content_type="text/plain",
+            )
+            return first[0], second
+
+    error, document_id = asyncio.run(_run())
+
+    assert isinstance(error, RuntimeError) and "ollama down" in str(error)
+    assert document_id
+
+
+def test_ingest_requires_started_pipeline():
+    pipeline, _ = _pipeline(MagicMock())
+    with pytest.raises(RuntimeError, match="not started"):
+        asyncio.run(pipeline.ingest(
+            ingestion_id=str(uuid4()), file_bytes=b"",
+            filename="a.txt", content_type="text/plain",
+        ))
+
+
+@patch("src.core.async_pipeline.create_document", side_effect=lambda *_: str(uuid4()))
+@patch("src.core.async_pipeline.prepare_chunks", return_value=("file", _chunks(10)))
+def test_cancelled_document_stops_persisting(_prepare, _create):
+    cancel = threading.Event()
+    http_client = MagicMock()
+    http_client.post = AsyncMock(
+        side_effect=lambda *a, **kw: cancel.set() or MagicMock()
+    )
+    pipeline, _ = _pipeline(http_client)
+
+    async def _run():
+        async with pipeline:
+            await pipeline.ingest(
+                ingestion_id=str(uuid4()),
+                file_bytes=b"data",
+                filename="doc.txt",
+                content_type="text/plain",
+                cancel=cancel,
+            )
+
+    with pytest.raises(IngestionCancelled):
+        asyncio.run(_run())
+
+    # Windows already in flight may finish; the rest of the document is dropped
+    assert http_client.post.call_count < 5
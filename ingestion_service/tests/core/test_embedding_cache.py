@@ -0,0 +1,68 @@
+# ingestion_service/tests/core/test_embedding_cache.py
+from array import array
+from unittest.mock import MagicMock
+
+from shared.chunks import Chunk
+from shared.embedders.cache import (
+    CachedEmbedder,
+    EmbeddingCache,
+    LRUEmbeddingCache,
+    text_hash,
+)
+from shared.embedders.mock import MockEmbedder
+
+
+def _chunk(text: str) -> Chunk:
+    return Chunk(chunk_id=text, content=text)
+
+
+def test_text_hash_normalizes_whitespace():
+    assert text_hash("hello   world\n") == text_hash("hello world")
+    assert text_hash("hello world") != text_hash("hello there")
+
+
+def test_lru_evicts_least_recently_used():
+    lru = LRUEmbeddingCache(max_entries=2)
+    lru.put_many("m", {"a": array("f", [1.0]), "b": array("f", [2.0])})
+    lru.get_many("m", ["a"])
+    lru.put_many("m", {"c": array("f", [3.0])})
+
+    assert set(lru.get_many("m", ["a", "b", "c"])) == {"a", "c"}
+    assert lru.evictions == 1
+
+
+def test_cached_embedder_only_embeds_misses():
+    inner = MockEmbedder()
+    inner.embed = MagicMock(side_effect=MockEmbedder().embed)
+    embedder = CachedEmbedder(inner, EmbeddingCache(LRUEmbeddingCache(100)))
+
+    first = embedder.embed([_chunk("header"), _chunk("body"), _chunk("header")])
+    second = embedder.embed([_chunk("body"), _chunk("footer")])
+
+    # "header" repeated in one call is embedded once; "body" is a hit later
+    assert [len(c.content) for c in inner.embed.call_args_list[0].args[0]] == [6, 4]
+    assert [c.content for c in inner.embed.call_args_list[1].args[0]] == ["footer"]
+    assert first[0] == first[2]
+    assert second[0] == first[1]
+
+    stats = embedder.cache.stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 3
+
+
+def test_persistent_tier_backfills_memory():
+    persistent = MagicMock()
+    persistent.evictions = 0
+    persistent.get_many.return_value = {text_hash("q"): [0.5]}
+    cache = EmbeddingCache(LRUEmbeddingCache(10), persistent)
+    inner = MagicMock(name="inner", spec=["embed", "name"])
+    inner.name = "mock"
+    embedder = CachedEmbedder(inner, cache)
+
+    assert embedder.embed([_chunk("q")]) == [[0.5]]
+    assert embedder.embed([_chunk("q")]) == [[0.5]]
+
+    inner.embed.assert_not_called()
+    persistent.get_many.assert_called_once()
+    assert cache.stats()["persistent_hits"] == 1
+    assert cache.stats()["memory_hits"] == 1
@@ -0,0 +1,55 @@
+# ingestion_service/tests/core/test_ingest_retry.py
+from unittest.mock import MagicMock, call, patch
+from uuid import UUID, uuid4
+
+from src.core import ingest_runner
+from src.core.pipeline import discard_previous_attempt
+
+
+@patch("src.core.pipeline.delete_document_nodes_by_ingestion")
+@patch("src.core.pipeline.get_sessionmaker")
+def test_discard_previous_attempt_deletes_vectors_then_nodes(
+    _sessionmaker, delete_nodes
+):
+    ingestion_id = str(uuid4())
+    order = MagicMock()
+    vector_store = order.vector_store
+    order.delete_nodes.return_value = 1
+    delete_nodes.side_effect = lambda session, iid: order.delete_nodes(iid)
+
+    discard_previous_attempt(vector_store, ingestion_id)
+
+    assert order.mock_calls == [
+        call.vector_store.delete_by_ingestion_id(ingestion_id),
+        call.delete_nodes(UUID(ingestion_id)),
+    ]
+
+
+def _ingest(pipeline, attempt, metadata=None):
+    with patch.object(ingest_runner, "_build_pipeline", return_value=pipeline):
+        ingest_runner.ingest_file_bytes(
+            ingestion_id=uuid4(),
+            file_bytes=b"some text",
+            filename="a.txt",
+            content_type="text/plain",
+            metadata=metadata or {},
+            attempt=attempt,
+        )
+
+
+def test_retry_discards_previous_attempt_before_running():
+    pipeline = MagicMock()
+
+    _ingest(pipeline, attempt=2)
+
+    assert [c[0] for c in pipeline.mock_calls] == ["discard_previous_attempt", "run"]
+
+
+def test_first_attempt_and_updates_do_not_discard():
+    pipeline = MagicMock()
+
+    _ingest(pipeline, attempt=1)
+    _ingest(pipeline, attempt=3, metadata={"update_document_id": str(uuid4())})
+
+    pipeline.discard_previous_attempt.assert_not_called()
+    assert pipeline.update_document.call_count == 1
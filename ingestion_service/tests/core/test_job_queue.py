@@ -0,0 +1,184 @@
+# ingestion_service/tests/core/test_job_queue.py
+import asyncio
+import threading
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+from uuid import uuid4
+
+from src.core.job_queue import (
+    LEASE_LOST,
+    IngestionJob,
+    IngestionJobQueue,
+    NonRetryableError,
+)
+from src.core import worker
+
+
+def _queue(rowcount: int = 1) -> tuple[IngestionJobQueue, MagicMock]:
+    session = MagicMock()
+    session.execute.return_value.rowcount = rowcount
+    factory = MagicMock()
+    factory.return_value.__enter__.return_value = session
+    queue = IngestionJobQueue(
+        factory, backoff_seconds=2.0, backoff_max_seconds=10.0
+    )
+    return queue, session
+
+
+def _job(tmp_path: Path, attempts: int = 1, max_attempts: int = 3) -> IngestionJob:
+    payload = tmp_path / "payload"
+    payload.write_bytes(b"hello world")
+    return IngestionJob(
+        ingestion_id=uuid4(),
+        filename="a.txt",
+        content_type="text/plain",
+        payload_path=str(payload),
+        metadata={},
+        attempts=attempts,
+        max_attempts=max_attempts,
+    )
+
+
+def test_retry_delay_is_exponential_and_capped():
+    queue, _ = _queue()
+    assert [queue.retry_delay(n) for n in (1, 2, 3, 4)] == [2.0, 4.0, 8.0, 10.0]
+
+
+def test_lease_returns_none_when_queue_empty():
+    queue, session = _queue()
+    session.execute.return_value.first.return_value = None
+    assert queue.lease("w-1") is None
+    assert "FOR UPDATE SKIP LOCKED" in str(session.execute.call_args.args[0])
+
+
+def test_fail_retries_until_attempts_exhausted(tmp_path):
+    queue, session = _queue()
+
+    assert queue.fail(_job(tmp_path, attempts=1), "w-1", "boom") == "accepted"
+    params = session.execute.call_args.args[1]
+    assert params["delay_seconds"] == 2.0
+
+    assert queue.fail(_job(tmp_path, attempts=3), "w-1", "boom") == "failed"
+    assert "status = 'failed'" in str(session.execute.call_args.args[0])
+
+
+def test_process_job_completes_and_removes_payload(tmp_path):
+    queue = MagicMock(lease_seconds=300)
+    job = _job(tmp_path)
+
+    with patch.object(worker, "ingest_file_bytes") as ingest, \
+            patch.object(worker, "dispatch_summary"):
+        assert worker.process_job(queue, job, "w-1") == "completed"
+
+    assert ingest.call_args.kwargs["file_bytes"] == b"hello world"
+    queue.complete.assert_called_once_with(job, "w-1")
+    assert not Path(job.payload_path).exists()
+
+
+def test_process_job_keeps_payload_for_retry(tmp_path):
+    queue = MagicMock(lease_seconds=300)
+    queue.fail.return_value = "accepted"
+    job = _job(tmp_path)
+
+    with patch.object(worker, "ingest_file_bytes", side_effect=RuntimeError("boom")):
+        assert worker.process_job(queue, job, "w-1") == "accepted"
+
+    queue.fail.assert_called_once_with(job, "w-1", "boom", retryable=True)
+    queue.complete.assert_not_called()
+    assert Path(job.payload_path).exists()
+
+
+def test_process_job_passes_attempt_number(tmp_path):
+    queue = MagicMock(lease_seconds=300)
+    job = _job(tmp_path, attempts=2)
+
+    with patch.object(worker, "ingest_file_bytes") as ingest, \
+            patch.object(worker, "dispatch_summary"):
+        worker.process_job(queue, job, "w-1")
+
+    assert ingest.call_args.kwargs["attempt"] == 2
+
+
+def test_fail_reports_lost_lease(tmp_path):
+    queue, _ = _queue(rowcount=0)
+
+    assert queue.fail(_job(tmp_path, attempts=1), "w-1", "boom") == LEASE_LOST
+    assert queue.fail(_job(tmp_path, attempts=3), "w-1", "boom") == LEASE_LOST
+
+
+def test_settle_job_leaves_payload_when_lease_lost(tmp_path):
+    queue = MagicMock(lease_seconds=300)
+    queue.complete.return_value = False
+    queue.fail.return_value = LEASE_LOST
+    job = _job(tmp_path, attempts=3)
+
+    with patch.object(worker, "dispatch_summary") as dispatch:
+        assert worker.settle_job(queue, job, "w-1", None) == LEASE_LOST
+        assert worker.settle_job(queue, job, "w-1", RuntimeError("boom")) == LEASE_LOST
+
+    dispatch.assert_not_called()
+    assert Path(job.payload_path).exists()
+
+
+def test_serve_async_leases_each_job_under_its_own_token(tmp_path):
+    jobs = [_job(tmp_path), _job(tmp_path)]
+    queue = MagicMock(lease_seconds=300)
+    queue.lease.side_effect = jobs + [None] * 10
+    queue.reap_expired.return_value = []
+    stop_event = threading.Event()
+    processed = []
+
+    async def fake_process(queue, job, lease_token, pipeline):
+        processed.append((job, lease_token))
+        if len(processed) == len(jobs):
+            stop_event.set()
+        return "completed"
+
+    with patch.object(worker, "process_job_async", side_effect=fake_process):
+        asyncio.run(worker.serve_async(
+            queue, MagicMock(), "w-1", stop_event, 0.01, docs_in_flight=4
+        ))
+
+    tokens = [token for _, token in processed]
+    assert [job for job, _ in processed] == jobs
+    assert len(set(tokens)) == 2
+    assert all(token.startswith("w-1:") for token in tokens)
+    assert [call.args[0] for call in queue.lease.call_args_list[:2]] == tokens
+
+
+def test_lease_heartbeat_signals_lost_lease(tmp_path):
+    queue = MagicMock(lease_seconds=0.3)
+    queue.renew.return_value = False
+    job = _job(tmp_path)
+
+    with worker.lease_heartbeat(queue, job, "w-1") as lease_lost:
+        assert lease_lost.wait(timeout=5)
+
+    queue.renew.assert_called_once_with(job, "w-1")
+
+
+def test_process_job_cancels_ingest_on_lost_lease(tmp_path):
+    queue = MagicMock(lease_seconds=300)
+    queue.fail.return_value = LEASE_LOST
+    job = _job(tmp_path)
+
+    with patch.object(worker, "ingest_file_bytes") as ingest:
+        worker.process_job(queue, job, "w-1")
+
+    cancel = ingest.call_args.kwargs["cancel"]
+    assert isinstance(cancel, threading.Event) and not cancel.is_set()
+
+
+def test_non_retryable_error_fails_job_at_once(tmp_path):
+    queue, session = _queue()
+    job = _job(tmp_path, attempts=1)
+
+    assert queue.fail(job, "w-1", "gone", retryable=False) == "failed"
+    assert "status = 'failed'" in str(session.execute.call_args.args[0])
+
+    queue = MagicMock(lease_seconds=300)
+    queue.fail.return_value = "failed"
+    gone = NonRetryableError("gone")
+    with patch.object(worker, "ingest_file_bytes", side_effect=gone):
+        assert worker.process_job(queue, job, "w-1") == "failed"
+    assert queue.fail.call_args.kwargs["retryable"] is False
@@ -0,0 +1,74 @@
+# ingestion_service/tests/core/test_memory_benchmark.py
+import pickle
+
+import pytest
+
+from shared.chunks import Chunk, shared_metadata
+from shared.models.vector import VectorMetadata
+from src.core.chunk_assembly.pdf_chunk_assembler import PDFChunkAssembler
+from src.core.document_graph.builder import DocumentGraphBuilder
+from src.core.memory_benchmark import run_benchmark, synthetic_artifacts
+from src.core.pipeline import chunk_text
+
+
+def test_models_have_no_instance_dict():
+    artifacts = synthetic_artifacts(pages=1, blocks_per_page=2, images_per_page=1)
+    graph = DocumentGraphBuilder().build(artifacts)
+    chunk = Chunk(chunk_id="c", content="text")
+    metadata = VectorMetadata(
+        ingestion_id="i", chunk_id="c", chunk_index=0, chunk_strategy="s",
+        chunk_text="t",
+    )
+
+    node = next(iter(graph.nodes.values()))
+    for obj in (artifacts[0], node, graph.edges[0], graph, chunk, metadata):
+        assert not hasattr(obj, "__dict__"), type(obj).__name__
+    with pytest.raises(AttributeError):
+        setattr(chunk, "embedding", [0.0])
+
+
+def test_slotted_artifacts_round_trip_through_pickle():
+    artifacts = synthetic_artifacts(pages=1, blocks_per_page=2, images_per_page=1)
+    assert pickle.loads(pickle.dumps(artifacts)) == artifacts
+
+
+def test_shared_metadata_interns_strings_and_shares_params():
+    params = {"chunk_size": 64}
+    first = shared_metadata(
+        {"chunker_name": "text_" + "chunker", "chunker_params": dict(params)}
+    )
+    second = shared_metadata(
+        {"chunker_name": "text_chunker", "chunker_params": dict(params)}
+    )
+
+    assert first["chunker_name"] is second["chunker_name"]
+    assert first["chunker_params"] is second["chunker_params"]
+    assert shared_metadata({"x": [1]})["x"] == [1]
+
+
+def test_chunks_of_one_source_share_metadata():
+    chunks = chunk_text("One sentence here. " * 80, source_type="file", provider="mock")
+    assert len(chunks) > 1
+    assert all(c.metadata is chunks[0].metadata for c in chunks)
+    assert chunks[0].metadata["chunk_strategy"] == "sentence"
+
+    artifacts = synthetic_artifacts(pages=1, blocks_per_page=8, images_per_page=0)
+    pdf_chunks = PDFChunkAssembler().assemble(DocumentGraphBuilder().build(artifacts))
+    by_block = {}
+    for c in pdf_chunks:
+        by_block.setdefault(c.metadata["artifact_ids"][0], []).append(c)
+    assert any(len(group) > 1 for group in by_block.values())
+    assert all(
+        c.metadata is group[0].metadata
+        for group in by_block.values()
+        for c in group
+    )
+
+
+def test_benchmark_reports_savings():
+    result = run_benchmark(pages=5, blocks_per_page=8, images_per_page=1, samples=200)
+
+    assert result.chunks > result.metadata_dicts
+    assert result.shared_metadata_bytes < result.private_metadata_bytes
+    assert all(model.slotted_bytes < model.dict_bytes for model in result.models)
+    assert result.array_embedding_bytes * 4 < result.list_embedding_bytes
@@ -0,0 +1,92 @@
+# ingestion_service/tests/core/test_ocr_pool.py
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock, patch
+
+from src.core.extractors.base import ExtractedArtifact
+from src.core.ocr.ocr_factory import OCR_ENGINES
+from src.core.ocr.pool import OCRPool, OCRResultCache
+from src.core.ocr.prefilter import OCRPrefilterConfig, OCRStats
+
+
+def _engine(side_effect=None):
+    engine = MagicMock()
+    engine.extract_text.side_effect = side_effect or (
+        lambda image, timeout=0: f"text:{image.decode()}"
+    )
+    return engine
+
+
+def _pool(cache=None, prefilter=OCRPrefilterConfig(enabled=False)):
+    return OCRPool(
+        "fake",
+        timeout=5,
+        cache=cache,
+        prefilter=prefilter,
+        executor=ThreadPoolExecutor(max_workers=4),
+    )
+
+
+def test_extract_many_preserves_order_and_ocrs_duplicates_once():
+    engine = _engine()
+    with patch.dict(OCR_ENGINES, {"fake": engine}):
+        texts = _pool().extract_many([b"a", b"b", b"a", b"c"])
+
+    assert texts == ["text:a", "text:b", "text:a", "text:c"]
+    assert engine.extract_text.call_count == 3
+    assert engine.extract_text.call_args.kwargs["timeout"] == 5
+
+
+def test_results_are_cached_across_calls_by_content():
+    engine = _engine()
+    cache = OCRResultCache()
+    with patch.dict(OCR_ENGINES, {"fake": engine}):
+        pool = _pool(cache)
+        pool.extract_many([b"logo"])
+        assert pool.extract_many([b"logo", b"logo"]) == ["text:logo", "text:logo"]
+
+    assert engine.extract_text.call_count == 1
+    assert cache.hits == 1
+
+
+def test_timeouts_yield_none_and_are_not_cached():
+    def _ocr(image, timeout=0):
+        if image == b"slow":
+            raise TimeoutError("too slow")
+        return "ok"
+
+    engine = _engine(_ocr)
+    cache = OCRResultCache()
+    with patch.dict(OCR_ENGINES, {"fake": engine}):
+        assert _pool(cache).extract_many([b"slow", b"fast"]) == [None, "ok"]
+
+    assert len(cache) == 1
+
+
+def test_enrich_sets_ocr_text_on_image_artifacts_only():
+    artifacts = [
+        ExtractedArtifact(
+            type="text", source_file="f", page_number=1, order_index=0, text="t"
+        ),
+        ExtractedArtifact(
+            type="image", source_file="f", page_number=1, order_index=1,
+            image_bytes=b"x",
+        ),
+    ]
+    with patch.dict(OCR_ENGINES, {"fake": _engine()}):
+        enriched = _pool().enrich(artifacts)
+
+    assert enriched[0] is artifacts[0]
+    assert enriched[1].ocr_text == "text:x"
+
+
+def test_prefiltered_images_are_counted_and_never_reach_the_engine():
+    engine = _engine()
+    stats = OCRStats()
+    with patch.dict(OCR_ENGINES, {"fake": engine}):
+        pool = _pool(prefilter=OCRPrefilterConfig(min_bytes=10))
+        images = [b"icon", b"icon", b"not-an-image-but-big"]
+        texts = pool.extract_many(images, stats=stats)
+
+    assert texts == ["", "", "text:not-an-image-but-big"]
+    assert engine.extract_text.call_count == 1
+    assert (stats.skipped_small, stats.cached, stats.processed) == (1, 1, 1)
@@ -0,0 +1,93 @@
+# ingestion_service/tests/core/test_ocr_prefilter.py
+import io
+
+import pytest
+from PIL import Image, ImageDraw, ImageFont
+
+from src.core.ocr.prefilter import (
+    PROCESS,
+    SKIPPED_LOW_TEXT,
+    SKIPPED_SMALL,
+    OCRPrefilterConfig,
+    prefilter_image,
+)
+
+
+def _png(image: Image.Image, **save_options) -> bytes:
+    out = io.BytesIO()
+    image.save(out, format="PNG", **save_options)
+    return out.getvalue()
+
+
+def _text_like(width=600, height=200) -> Image.Image:
+    image = Image.new("L", (width, height), 255)
+    draw = ImageDraw.Draw(image)
+    for y in range(10, height - 10, 20):
+        draw.text(
+            (10, y), "The quick brown fox jumps over the lazy dog 0123456789", fill=0
+        )
+    return image
+
+
+CONFIG = OCRPrefilterConfig(min_bytes=0)
+
+
+def test_small_images_are_skipped():
+    small = _png(Image.new("L", (20, 20), 0))
+    assert prefilter_image(small, CONFIG).decision == SKIPPED_SMALL
+    tiny = OCRPrefilterConfig(min_bytes=100)
+    assert prefilter_image(b"x" * 10, tiny).decision == SKIPPED_SMALL
+
+
+def test_solid_fill_is_skipped_as_low_text():
+    solid = _png(Image.new("L", (400, 400), 128))
+    assert prefilter_image(solid, CONFIG).decision == SKIPPED_LOW_TEXT
+
+
+def _rendered_page(lines: int) -> Image.Image:
+    """Letter page at 300 dpi with `lines` lines of ~11pt text (46 px font)."""
+    image = Image.new("L", (2550, 3300), 255)
+    draw = ImageDraw.Draw(image)
+    font = ImageFont.load_default(size=46)
+    for i in range(lines):
+        draw.text(
+            (300, 300 + 60 * i),
+            "The quick brown fox jumps over the lazy dog, 123.",
+            fill=0,
+            font=font,
+        )
+    return image
+
+
+@pytest.mark.parametrize("lines", [1, 3, 10])
+def test_sparse_rendered_text_is_processed(lines):
+    data = _png(_rendered_page(lines), dpi=(300, 300))
+    assert prefilter_image(data, CONFIG).decision == PROCESS
+
+
+def test_blank_and_gradient_pages_are_skipped_as_low_text():
+    gradient = Image.linear_gradient("L").resize((1024, 1024))
+    blank = _png(Image.new("L", (2550, 3300), 255))
+    assert prefilter_image(blank, CONFIG).decision == SKIPPED_LOW_TEXT
+    assert prefilter_image(_png(gradient), CONFIG).decision == SKIPPED_LOW_TEXT
+
+
+def test_text_like_image_is_processed_unchanged():
+    data = _png(_text_like())
+    result = prefilter_image(data, CONFIG)
+    assert result.decision == PROCESS
+    assert result.image_bytes == data and not result.downscaled
+
+
+def test_high_dpi_scan_is_downscaled_to_target_dpi():
+    data = _png(_text_like(1200, 400), dpi=(600, 600))
+    result = prefilter_image(data, CONFIG)
+
+    assert result.decision == PROCESS and result.downscaled
+    assert result.image_bytes is not None
+    assert Image.open(io.BytesIO(result.image_bytes)).size == (600, 200)
+
+
+def test_disabled_prefilter_passes_everything_through():
+    result = prefilter_image(b"x", OCRPrefilterConfig(enabled=False))
+    assert result.decision == PROCESS and result.image_bytes == b"x"
@@ -0,0 +1,62 @@
+# ingestion_service/tests/core/test_ollama_embedder.py
+from array import array
+from unittest.mock import MagicMock, patch
+
+import pytest
+import requests
+
+from shared.chunks import Chunk
+from shared.embedders.ollama import OllamaEmbedder
+
+
+def _chunks(n: int) -> list[Chunk]:
+    return [Chunk(chunk_id=f"c{i}", content=f"text {i}") for i in range(n)]
+
+
+def _response(texts: list[str], status: int = 200) -> MagicMock:
+    response = MagicMock(status_code=status, text="err")
+    # Encode the text index into the vector so ordering can be asserted
+    response.json.return_value = {"embeddings": [[float(t.split()[1])] for t in texts]}
+    return response
+
+
+def _fake_post(url, json, timeout):
+    return _response(json["input"])
+
+
+def test_embed_splits_into_batches_and_keeps_order():
+    embedder = OllamaEmbedder("http://ollama", "m", batch_size=3, max_concurrency=4)
+    with patch.object(embedder._session, "post", side_effect=_fake_post) as post:
+        vectors = embedder.embed(_chunks(10))
+
+    assert post.call_count == 4
+    assert all(len(c.kwargs["json"]["input"]) <= 3 for c in post.call_args_list)
+    # Response vectors are packed into float32 arrays
+    assert vectors == [array("f", [float(i)]) for i in range(10)]
+
+
+@patch("shared.embedders.ollama.time.sleep")
+def test_embed_retries_transient_batch_failures(_sleep):
+    embedder = OllamaEmbedder("http://ollama", "m", batch_size=10, max_retries=2)
+    calls = []
+
+    def flaky(url, json, timeout):
+        calls.append(1)
+        if len(calls) == 1:
+            raise requests.ConnectionError("reset")
+        if len(calls) == 2:
+            return _response(json["input"], status=503)
+        return _fake_post(url, json, timeout)
+
+    with patch.object(embedder._session, "post", side_effect=flaky):
+        assert embedder.embed(_chunks(2)) == [array("f", [0.0]), array("f", [1.0])]
+    assert len(calls) == 3
+
+
+def test_embed_does_not_retry_client_errors():
+    embedder = OllamaEmbedder("http://ollama", "m", batch_size=10)
+    response = _response([], status=400)
+    with patch.object(embedder._session, "post", return_value=response) as post:
+        with pytest.raises(RuntimeError, match="status=400"):
+            embedder.embed(_chunks(2))
+    assert post.call_count == 1
@@ -0,0 +1,93 @@
+# ingestion_service/tests/core/test_pdf_chunk_assembler.py
+from src.core.chunk_assembly.pdf_chunk_assembler import PDFChunkAssembler
+from src.core.document_graph.builder import DocumentGraphBuilder
+from src.core.extractors.base import ExtractedArtifact
+
+
+def _text(page, order, text, **fields):
+    return ExtractedArtifact(
+        type="text", source_file="d.pdf", page_number=page, order_index=order,
+        text=text, **fields,
+    )
+
+
+def _graph(artifacts):
+    return DocumentGraphBuilder().build(artifacts)
+
+
+ARTIFACTS = [
+    _text(1, 0, "Heading"),
+    ExtractedArtifact(
+        type="image", source_file="d.pdf", page_number=1, order_index=1,
+        image_bytes=b"i",
+    ),
+    _text(1, 2, "Figure 1: caption."),
+    _text(2, 3, "Body line on page two."),
+    _text(4, 4, "Page four stands alone."),
+]
+
+
+def test_per_block_mode_is_the_default():
+    chunks = PDFChunkAssembler().assemble(_graph(ARTIFACTS))
+    assert len(chunks) == 4
+    assert all(len(c.metadata["artifact_ids"]) == 1 for c in chunks)
+
+
+def test_merge_mode_packs_adjacent_pages_and_keeps_provenance_lists():
+    assembler = PDFChunkAssembler(merge_blocks=True, target_tokens=50)
+    chunks = assembler.assemble(_graph(ARTIFACTS))
+
+    assert [c.content for c in chunks] == [
+        "Heading\n\nFigure 1: caption.\n\nBody line on page two.",
+        "Page four stands alone.",  # page 3 missing: not adjacent
+    ]
+    first = chunks[0].metadata
+    assert first["page_numbers"] == [1, 2]
+    assert first["artifact_ids"] == [
+        "d.pdf:1:0:text", "d.pdf:1:2:text", "d.pdf:2:3:text"
+    ]
+    assert first["associated_image_ids"] == ["d.pdf:1:1:image"]
+    assert first["chunk_strategy"] == "block_merge"
+    assert len({c.chunk_id for c in chunks}) == 2
+
+
+def test_merge_mode_respects_token_budget_and_chunks_oversized_blocks_alone():
+    # 4 regex tokens per line: "Line", "number", digit, "."
+    artifacts = [_text(1, i, f"Line number {i}.") for i in range(6)]
+    artifacts.append(_text(1, 6, "x" * 300))
+
+    assembler = PDFChunkAssembler(merge_blocks=True, target_tokens=10)
+    chunks = assembler.assemble(_graph(artifacts))
+
+    merged = [c for c in chunks if c.metadata["chunk_strategy"] == "block_merge"]
+    assert [c.token_count for c in merged] == [8, 8, 8]
+    assert sum(len(c.metadata["artifact_ids"]) for c in merged) == 6
+    oversized = [c for c in chunks if c.metadata["chunk_strategy"] != "block_merge"]
+    assert oversized
+    assert all(c.metadata["artifact_ids"] == ["d.pdf:1:6:text"] for c in oversized)
+
+
+def test_merge_mode_uses_ocr_text_when_there_is_no_native_text():
+    artifacts = [_text(1, 0, "Native."), _text(2, 1, None, ocr_text="Scanned.")]
+    chunks = PDFChunkAssembler(merge_blocks=True).assemble(_graph(artifacts))
+
+    assert chunks[0].content == "Native.\n\nScanned."
+    assert chunks[0].metadata["ocr_text"] == "Scanned."
+
+
+def test_iter_assemble_yields_the_assembled_chunks_lazily():
+    artifacts = [
+        _text(page, page, text)
+        for page in range(1, 4)
+        for text in ("Running header", f"Page {page}.")
+    ]
+    assembler = PDFChunkAssembler()
+
+    chunks = assembler.iter_assemble(_graph(artifacts))
+    first = next(chunks)
+    rest = list(chunks)
+
+    expected = assembler.assemble(_graph(artifacts))
+    assert [c.chunk_id for c in [first, *rest]] == [c.chunk_id for c in expected]
+    # repeated header ids stay unique
+    assert len({c.chunk_id for c in expected}) == len(expected)
@@ -0,0 +1,130 @@
+# ingestion_service/tests/core/test_pdf_extractor.py
+from unittest.mock import MagicMock, patch
+
+import fitz
+import pytest
+
+from src.core.extractors.images import release_images
+from src.core.extractors.pdf import PDFExtractor
+from src.core.headless_ingest_pdf import HeadlessPDFIngestor
+
+
+def _pdf(pages: int) -> bytes:
+    doc = fitz.open()
+    for i in range(pages):
+        page = doc.new_page()
+        page.insert_text((72, 72), f"Page {i + 1} heading")
+        page.insert_text((72, 400), f"Body text of page {i + 1}")
+    data = doc.tobytes()
+    doc.close()
+    return data
+
+
+def _pdf_with_logo(pages: int) -> bytes:
+    pix = fitz.Pixmap(fitz.csRGB, fitz.IRect(0, 0, 8, 8), False)
+    pix.set_rect(pix.irect, (200, 30, 30))
+    doc = fitz.open()
+    xref = 0
+    for i in range(pages):
+        page = doc.new_page()
+        page.insert_text((72, 72), f"Page {i + 1}")
+        rect = fitz.Rect(72, 100, 120, 148)
+        if xref:
+            page.insert_image(rect, xref=xref)
+        else:
+            xref = page.insert_image(rect, stream=pix.tobytes("png"))
+    data = doc.tobytes()
+    doc.close()
+    return data
+
+
+def test_page_ranges_are_contiguous_and_cover_document():
+    extractor = PDFExtractor(max_workers=3, min_pages_per_worker=2)
+    assert extractor._page_ranges(10) == [(0, 4), (4, 7), (7, 10)]
+    assert extractor._page_ranges(3) == [(0, 3)]  # too small to split
+
+
+def test_parallel_extraction_matches_serial_order():
+    data = _pdf(9)
+
+    serial = PDFExtractor().extract(data, "doc.pdf")
+    extractor = PDFExtractor(max_workers=3, min_pages_per_worker=2)
+    parallel = extractor.extract(data, "doc.pdf")
+
+    assert parallel == serial
+    assert [a.order_index for a in parallel] == list(range(len(parallel)))
+    assert [a.page_number for a in parallel] == sorted(a.page_number for a in parallel)
+
+
+def test_invalid_pdf_raises_value_error():
+    with pytest.raises(ValueError):
+        PDFExtractor(max_workers=2).extract(b"not a pdf", "bad.pdf")
+
+
+def test_repeated_image_is_one_lazy_handle_decoded_once():
+    artifacts = PDFExtractor().extract(_pdf_with_logo(4), "logo.pdf")
+    images = [a for a in artifacts if a.type == "image"]
+
+    assert len(images) == 4
+    assert all(a.image_bytes is None for a in images)  # nothing decoded yet
+    handle = images[0].image
+    assert handle is not None
+    assert all(a.image is handle for a in images)
+
+    loaded = [a.load_image() for a in images]
+    assert loaded[0] and all(b is loaded[0] for b in loaded)
+    assert handle._source is not None and handle._source.decodes == 1
+
+
+def test_parallel_extraction_rebinds_image_handles():
+    data = _pdf_with_logo(6)
+    extractor = PDFExtractor(max_workers=2, min_pages_per_worker=2)
+    artifacts = extractor.extract(data, "logo.pdf")
+    images = [a for a in artifacts if a.type == "image"]
+
+    assert len({id(a.image) for a in images}) == 1
+    serial = PDFExtractor().extract(data, "logo.pdf")
+    assert images[-1].load_image() == serial[1].load_image()
+
+
+def test_release_images_closes_document_and_drops_decoded_bytes():
+    artifacts = PDFExtractor().extract(_pdf_with_logo(3), "logo.pdf")
+    image = next(a for a in artifacts if a.type == "image")
+    loaded = image.load_image()
+    assert image.image is not None
+    source = image.image._source
+    assert source is not None
+
+    release_images(artifacts)
+
+    assert source._doc is None
+    assert not source._bytes_by_hash and not source._hash_by_xref
+    assert image.load_image() == loaded  # reopened and decoded again on demand
+    assert source.decodes == 2
+    source.close()
+
+
+def test_headless_ingest_releases_images_after_ocr():
+    def _enrich(artifacts, stats):
+        for artifact in artifacts:
+            artifact.load_image()  # what OCR reads
+        return artifacts
+
+    ocr_pool = MagicMock()
+    ocr_pool.enrich.side_effect = _enrich
+    pipeline = MagicMock()
+    pipeline._embed.side_effect = lambda chunks: [[0.0] for _ in chunks]
+    extracted = []
+    extract = PDFExtractor.extract
+
+    def _extract(self, *args):
+        extracted.extend(extract(self, *args))
+        return extracted
+
+    with patch.object(PDFExtractor, "extract", _extract):
+        ingestor = HeadlessPDFIngestor(pipeline, ocr_pool=ocr_pool)
+        ingestor.ingest_pdf(_pdf_with_logo(2), "logo.pdf", "ing-1")
+
+    source = next(a for a in extracted if a.type == "image").image._source
+    assert source.decodes >= 1
+    assert source._doc is None and not source._bytes_by_hash
@@ -0,0 +1,103 @@
+# ingestion_service/tests/core/test_pipeline_streaming.py
+import threading
+from unittest.mock import MagicMock, patch
+from uuid import uuid4
+
+import pytest
+
+from shared.chunks import Chunk
+from src.core.pipeline import IngestionCancelled, IngestionPipeline
+
+
+def _pipeline(vector_store, window_size=2):
+    embedder = MagicMock()
+    embedder.embed.side_effect = lambda chunks: [
+        [float(len(c.content))] for c in chunks
+    ]
+    return IngestionPipeline(
+        validator=MagicMock(),
+        embedder=embedder,
+        vector_store=vector_store,
+        window_size=window_size,
+        max_pending_windows=1,
+    ), embedder
+
+
+def _chunks(n):
+    return [Chunk(chunk_id=f"c{i}", content="x" * (i + 1)) for i in range(n)]
+
+
+@patch("src.core.pipeline.create_document_node")
+@patch("src.core.pipeline.get_sessionmaker")
+def test_run_with_chunks_streams_windows_with_global_indexes(_sessionmaker, _create):
+    vector_store = MagicMock()
+    pipeline, embedder = _pipeline(vector_store)
+
+    pipeline.run_with_chunks(chunks=_chunks(5), ingestion_id=str(uuid4()))
+
+    assert [len(c.args[0]) for c in embedder.embed.call_args_list] == [2, 2, 1]
+    persisted = vector_store.persist.call_args_list
+    assert [c.kwargs["chunk_index_offset"] for c in persisted] == [0, 2, 4]
+    persisted_ids = [ch.chunk_id for c in persisted for ch in c.kwargs["chunks"]]
+    assert persisted_ids == [f"c{i}" for i in range(5)]
+    assert persisted[2].kwargs["embeddings"] == [[5.0]]
+
+
+@patch("src.core.pipeline.create_document_node")
+@patch("src.core.pipeline.get_sessionmaker")
+def test_persist_failure_stops_stream_and_propagates(_sessionmaker, _create):
+    vector_store = MagicMock()
+    vector_store.persist.side_effect = RuntimeError("store down")
+    pipeline, embedder = _pipeline(vector_store)
+
+    with pytest.raises(RuntimeError, match="store down"):
+        pipeline.run_with_chunks(chunks=_chunks(20), ingestion_id=str(uuid4()))
+
+    # Backpressure: the embedder stops shortly after the first failed window
+    assert embedder.embed.call_count < 10
+
+
+@patch("src.core.pipeline.create_document_node")
+@patch("src.core.pipeline.get_sessionmaker")
+def test_run_chunks_text_lazily_into_windows(_sessionmaker, _create):
+    produced = []
+
+    def _lazy_chunks(text, **kwargs):
+        for chunk in _chunks(6):
+            produced.append(chunk)
+            yield chunk
+
+    pipeline, embedder = _pipeline(MagicMock())
+    produced_at_embed = []
+    embed = embedder.embed.side_effect
+    def _embed(chunks):
+        produced_at_embed.append(len(produced))
+        return embed(chunks)
+
+    embedder.embed.side_effect = _embed
+
+    with patch("src.core.pipeline.iter_chunk_text", side_effect=_lazy_chunks):
+        pipeline.run(
+            text="text", ingestion_id=str(uuid4()), source_type="file", provider="mock"
+        )
+
+    # Each window is chunked just before it is embedded, not the whole text up front
+    assert produced_at_embed == [2, 4, 6]
+
+
+@patch("src.core.pipeline.create_document_node")
+@patch("src.core.pipeline.get_sessionmaker")
+def test_cancel_stops_persisting_further_windows(_sessionmaker, _create):
+    vector_store = MagicMock()
+    cancel = threading.Event()
+    vector_store.persist.side_effect = lambda **kwargs: cancel.set()
+    pipeline, embedder = _pipeline(vector_store)
+
+    with pytest.raises(IngestionCancelled):
+        pipeline.run_with_chunks(
+            chunks=_chunks(10), ingestion_id=str(uuid4()), cancel=cancel
+        )
+
+    # The lease was lost while window 1 was persisted; nothing after it is written
+    assert vector_store.persist.call_count == 1
+    assert embedder.embed.call_count <= 3
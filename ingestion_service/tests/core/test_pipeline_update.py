@@ -0,0 +1,103 @@
+# ingestion_service/tests/core/test_pipeline_update.py
+from unittest.mock import MagicMock, patch
+from uuid import uuid4
+
+import pytest
+
+from shared.chunks import Chunk, content_chunk_ids
+from src.core.pipeline import DocumentNotFound, IngestionPipeline
+
+
+def _chunks(texts: list[str]) -> list[Chunk]:
+    chunks, offset = [], 0
+    for text, chunk_id in zip(texts, content_chunk_ids(texts)):
+        chunks.append(Chunk(
+            chunk_id=chunk_id, content=text,
+            char_start=offset, char_end=offset + len(text),
+        ))
+        offset += len(text) + 1
+    return chunks
+
+
+def _store_and_pipeline(stored: list[Chunk]):
+    vector_store = MagicMock()
+    vector_store.list_document_chunks.return_value = [
+        {"chunk_id": c.chunk_id, "text": c.content} for c in stored
+    ]
+    embedder = MagicMock()
+    embedder.embed.side_effect = lambda chunks: [[1.0] for _ in chunks]
+    pipeline = IngestionPipeline(
+        validator=MagicMock(), embedder=embedder, vector_store=vector_store
+    )
+    return pipeline, vector_store
+
+
+@patch("src.core.pipeline.get_document_node")
+@patch("src.core.pipeline.reassign_document_node")
+@patch("src.core.pipeline.get_sessionmaker")
+def test_update_document_embeds_only_changed_chunks(_sessionmaker, reassign, _get):
+    stored = _chunks(["intro", "body v1", "appendix"])
+    vector_store = MagicMock()
+    vector_store.list_document_chunks.return_value = [
+        {"chunk_id": c.chunk_id, "text": c.content} for c in stored
+    ]
+    vector_store.sync_document.return_value = {"deleted": 1}
+    embedder = MagicMock()
+    embedder.embed.side_effect = lambda chunks: [[1.0] for _ in chunks]
+    pipeline = IngestionPipeline(
+        validator=MagicMock(), embedder=embedder, vector_store=vector_store
+    )
+
+    new_chunks = _chunks(["intro", "body v2, longer", "appendix"])
+    result = pipeline.update_document(
+        document_id=str(uuid4()), ingestion_id=str(uuid4()), chunks=new_chunks
+    )
+
+    embedded = embedder.embed.call_args.args[0]
+    assert [c.content for c in embedded] == ["body v2, longer"]
+    sync_kwargs = vector_store.sync_document.call_args.kwargs
+    # the appendix kept its embedding but moved: its new offsets go along
+    assert sync_kwargs["keep"] == [
+        (new_chunks[0].chunk_id, 0, 0, 5), (new_chunks[2].chunk_id, 2, 22, 30)
+    ]
+    changed = [(i, c.content) for i, c in sync_kwargs["changed"]]
+    assert changed == [(1, "body v2, longer")]
+    assert result == {"kept": 2, "embedded": 1, "deleted": 1}
+
+
+@patch("src.core.pipeline.get_document_node")
+@patch("src.core.pipeline.reassign_document_node")
+@patch("src.core.pipeline.get_sessionmaker")
+def test_update_document_reassigns_only_after_sync(_sessionmaker, reassign, _get):
+    pipeline, vector_store = _store_and_pipeline(_chunks(["intro"]))
+    vector_store.sync_document.side_effect = RuntimeError("store down")
+
+    with pytest.raises(RuntimeError, match="store down"):
+        pipeline.update_document(
+            document_id=str(uuid4()), ingestion_id=str(uuid4()),
+            chunks=_chunks(["intro v2"]),
+        )
+    reassign.assert_not_called()
+
+    vector_store.sync_document.side_effect = None
+    vector_store.sync_document.return_value = {"deleted": 1}
+    pipeline.update_document(
+        document_id=str(uuid4()), ingestion_id=str(uuid4()),
+        chunks=_chunks(["intro v2"]),
+    )
+    reassign.assert_called_once()
+
+
+@patch("src.core.pipeline.get_document_node", return_value=None)
+@patch("src.core.pipeline.reassign_document_node")
+@patch("src.core.pipeline.get_sessionmaker")
+def test_update_of_unknown_document_is_not_retryable(_sessionmaker, reassign, _get):
+    pipeline, vector_store = _store_and_pipeline([])
+
+    with pytest.raises(DocumentNotFound):
+        pipeline.update_document(
+            document_id=str(uuid4()), ingestion_id=str(uuid4()), text="text"
+        )
+
+    vector_store.sync_document.assert_not_called()
+    reassign.assert_not_called()
@@ -0,0 +1,117 @@
+# ingestion_service/tests/core/test_scanned_pages.py
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Optional
+from unittest.mock import MagicMock, patch
+
+import fitz
+
+from src.core.extractors.base import ExtractedArtifact
+from src.core.extractors.pdf import PDFExtractor
+from src.core.ocr.ocr_factory import OCR_ENGINES
+from src.core.ocr.pool import OCRPool
+from src.core.ocr.prefilter import OCRPrefilterConfig, OCRStats
+from src.core.ocr.scanned_pages import (
+    find_textless_pages,
+    merge_page_ocr,
+    ocr_scanned_pages,
+)
+
+
+def _artifact(kind, page, order, **fields):
+    return ExtractedArtifact(
+        type=kind, source_file="s.pdf", page_number=page, order_index=order,
+        **fields,
+    )
+
+
+def test_find_textless_pages_uses_text_length_per_page():
+    artifacts = [
+        _artifact("text", 1, 0, text="A full paragraph of native text"),
+        _artifact("text", 2, 1, text="7"),  # page number only
+        _artifact("image", 3, 2, image_bytes=b"scan"),
+    ]
+    assert find_textless_pages(artifacts, page_count=4, min_text_chars=16) == [2, 3, 4]
+
+
+def test_merge_page_ocr_appends_after_page_artifacts_and_renumbers():
+    artifacts = [
+        _artifact("text", 1, 0, text="native"),
+        _artifact("image", 2, 1, image_bytes=b"scan"),
+        _artifact("text", 3, 2, text="native again"),
+    ]
+    page_texts: Dict[int, Optional[str]] = {
+        2: "scanned words", 4: "last page", 3: "  "
+    }
+    merged = merge_page_ocr(artifacts, page_texts, "s.pdf")
+
+    assert [(a.page_number, a.type) for a in merged] == [
+        (1, "text"), (2, "image"), (2, "text"), (3, "text"), (4, "text")
+    ]
+    assert [a.order_index for a in merged] == [0, 1, 2, 3, 4]
+    assert merged[2].ocr_text == "scanned words" and merged[2].text is None
+
+
+def test_ocr_scanned_pages_renders_only_pages_without_text_layer():
+    doc = fitz.open()
+    doc.new_page().insert_text((72, 72), "This page has a real text layer")
+    doc.new_page()  # "scanned": no text layer
+    data = doc.tobytes()
+    doc.close()
+
+    engine = MagicMock()
+    engine.extract_text.return_value = "recognised text"
+    pool = OCRPool(
+        "fake",
+        prefilter=OCRPrefilterConfig(enabled=False),
+        executor=ThreadPoolExecutor(max_workers=2),
+    )
+    stats = OCRStats()
+    artifacts = PDFExtractor().extract(data, "s.pdf")
+
+    with patch.dict(OCR_ENGINES, {"fake": engine}):
+        result = ocr_scanned_pages(data, "s.pdf", artifacts, pool, dpi=72, stats=stats)
+
+    assert engine.extract_text.call_count == 1
+    assert stats.processed == 1
+    assert result[-1].page_number == 2 and result[-1].ocr_text == "recognised text"
+
+
+def test_default_prefilter_keeps_sparse_scanned_pages_and_skips_blank_ones():
+    doc = fitz.open()
+    doc.new_page().draw_line((72, 72), (300, 72), width=2)  # a single "line" of ink
+    doc.new_page()  # blank
+    data = doc.tobytes()
+    doc.close()
+
+    engine = MagicMock()
+    engine.extract_text.return_value = "one line"
+    pool = OCRPool("fake", executor=ThreadPoolExecutor(max_workers=2))
+    stats = OCRStats()
+
+    with patch.dict(OCR_ENGINES, {"fake": engine}):
+        texts = pool.ocr_pdf_pages(data, [1, 2], dpi=150, stats=stats)
+
+    assert texts == {1: "one line", 2: ""}
+    assert stats.processed == 1 and stats.skipped_low_text == 1
+
+
+def test_ocr_pdf_pages_sends_one_group_per_worker_and_survives_render_errors():
+    doc = fitz.open()
+    for _ in range(5):
+        doc.new_page().draw_line((72, 72), (300, 72), width=2)
+    data = doc.tobytes()
+    doc.close()
+
+    engine = MagicMock()
+    engine.extract_text.return_value = "text"
+    executor = ThreadPoolExecutor(max_workers=2)
+    pool = OCRPool("fake", max_workers=2, executor=executor)
+    stats = OCRStats()
+
+    with patch.dict(OCR_ENGINES, {"fake": engine}), \
+            patch.object(executor, "submit", wraps=executor.submit) as submit:
+        texts = pool.ocr_pdf_pages(data, [1, 2, 3, 4, 5, 9], dpi=72, stats=stats)
+
+    assert [c.args[3] for c in submit.call_args_list] == [[1, 2, 3], [4, 5, 9]]
+    assert texts == {1: "text", 2: "text", 3: "text", 4: "text", 5: "text", 9: None}
+    assert stats.processed == 5 and stats.failed == 1
@@ -0,0 +1,62 @@
+# ingestion_service/tests/core/test_vector_encoding.py
+from array import array
+
+import pytest
+from pgvector import Vector
+
+from shared.chunks import Chunk
+from shared.embedders.mock import MockEmbedder
+from shared.models.vector import (
+    decode_embedding,
+    encode_embedding,
+    from_pgvector_binary,
+    pgvector_binary,
+    to_embedding,
+)
+from src.core.http_vectorstore import HttpVectorStore
+
+VALUES = [0.5, -1.25, 3.0, 1e-3]
+
+
+def test_to_embedding_accepts_lists_buffers_and_arrays():
+    embedding = to_embedding(VALUES)
+
+    assert embedding.typecode == "f"
+    assert to_embedding(embedding) is embedding
+    assert to_embedding(memoryview(array("d", VALUES))) == embedding
+    assert to_embedding(memoryview(embedding)) == embedding
+
+
+def test_to_embedding_casts_numpy_arrays():
+    np = pytest.importorskip("numpy")
+
+    assert to_embedding(np.array(VALUES)) == to_embedding(VALUES)
+    strided = np.array(VALUES, dtype=np.float32)[::2]
+    assert to_embedding(strided) == to_embedding(VALUES[::2])
+
+
+def test_base64_round_trip_is_little_endian_float32():
+    encoded = encode_embedding(VALUES)
+
+    assert decode_embedding(encoded) == to_embedding(VALUES)
+    assert decode_embedding(encode_embedding([])) == array("f")
+
+
+def test_pgvector_binary_matches_pgvector():
+    assert pgvector_binary(VALUES) == Vector(VALUES).to_binary()
+    assert from_pgvector_binary(Vector(VALUES).to_binary()) == to_embedding(VALUES)
+
+
+def test_http_vector_store_sends_base64_vectors():
+    chunk = Chunk(
+        chunk_id="c0", content="text", metadata={"chunk_strategy": "sentence"}
+    )
+    (embedding,) = MockEmbedder().embed([chunk])
+
+    (record,) = HttpVectorStore("http://vs").build_records(
+        [chunk], [embedding], "ing-1", chunk_index_offset=3
+    )
+
+    assert "vector" not in record
+    assert decode_embedding(record["vector_b64"]) == embedding
+    assert record["metadata"]["chunk_index"] == 3
@@ -2,7 +2,7 @@
 import logging
 import os
 from uuid import UUID
-from typing import List
+from typing import Any, Dict, List
 import httpx
 from fastapi import APIRouter, HTTPException, BackgroundTasks
 
@@ -23,26 +23,24 @@ logger.debug(f"summarize.py LLM_SERVICE_URL: {LLM_SERVICE_URL}")
 
 async def fetch_chunks(ingestion_id: str) -> List[str]:
     """Fetch all chunk_text for ingestion_id from vector-store-service."""
-    search_url = f"{VECTOR_STORE_URL}/v1/vectors/search"
-    
-    # Dummy query vector (we want ALL chunks for this ingestion_id)
-    dummy_vector = [0.0] * 768  # nomic-embed-text:v1.5 dimension
-    
-    payload = {"query_vector": dummy_vector, "k": 1000}
-    
+    list_url = f"{VECTOR_STORE_URL}/v1/vectors/by-ingestion/{ingestion_id}"
+
+    # Page through the chunk listing in chunk_index order (no similarity scan)
+    texts: List[str] = []
+    params: Dict[str, Any] = {"limit": 500}
     async with httpx.AsyncClient( timeout=90) as client:
-        resp = await client.post(search_url, json=payload)
-        resp.raise_for_status()
-        results = resp.json().get("results", [])
-        
-        # Filter by ingestion_id + extract texts
-        texts = [
-            r["text"] 
-            for r in results 
-            if r.get("metadata", {}).get("ingestion_id") == ingestion_id
-        ]
-        logger.info(f"✅ MS7: Fetched {len(texts)} chunks for {ingestion_id}")
-        return texts
+        while True:
+            resp = await client.get(list_url, params=params)
+            resp.raise_for_status()
+            body = resp.json()
+            texts.extend(c["text"] for c in body.get("chunks", []))
+            next_cursor = body.get("next_cursor")
+            if not next_cursor:
+                break
+            params["cursor"] = next_cursor
+
+    logger.info(f"✅ MS7: Fetched {len(texts)} chunks for {ingestion_id}")
+    return texts
 
 async def update_document_summary(ingestion_id: str, summary: str):
     """Update document_nodes.summary via ingestion-service DB."""
@@ -0,0 +1,71 @@
+"""Add approximate-nearest-neighbour index on vector_chunks.vector
+
+Revision ID: 20260301_ann
+Revises: 20260201_rels
+Create Date: 2026-03-01
+
+Build parameters are read from the environment (or `-x key=value`):
+
+- VECTOR_INDEX_TYPE: "hnsw" (default) or "ivfflat"
+- HNSW_M / HNSW_EF_CONSTRUCTION: HNSW graph parameters (16 / 64)
+- IVFFLAT_LISTS: number of IVFFlat lists (100)
+
+The operator class matches the `<->` (L2) operator used by
+PgVectorStore.similarity_search, otherwise the planner ignores the index.
+"""
+
+import os
+from typing import Sequence, Union
+
+from alembic import context, op
+
+revision: str = "20260301_ann"
+down_revision: Union[str, Sequence[str], None] = "20260201_rels"
+branch_labels = None
+depends_on = None
+
+INDEX_NAMES = {
+    "hnsw": "ix_vector_chunks_vector_hnsw",
+    "ivfflat": "ix_vector_chunks_vector_ivfflat",
+}
+
+
+def _option(name: str, default: str) -> str:
+    x_args = context.get_x_argument(as_dictionary=True)
+    return x_args.get(name.lower()) or os.environ.get(name) or default
+
+
+def upgrade() -> None:
+    index_type = _option("VECTOR_INDEX_TYPE", "hnsw").lower()
+    if index_type not in INDEX_NAMES:
+        raise ValueError(
+            f"Unsupported VECTOR_INDEX_TYPE '{index_type}'. Valid: {set(INDEX_NAMES)}"
+        )
+
+    if index_type == "hnsw":
+        m = int(_option("HNSW_M", "16"))
+        ef_construction = int(_option("HNSW_EF_CONSTRUCTION", "64"))
+        with_clause = f"m = {m}, ef_construction = {ef_construction}"
+    else:
+        lists = int(_option("IVFFLAT_LISTS", "100"))
+        with_clause = f"lists = {lists}"
+
+    # CONCURRENTLY cannot run inside a transaction block; building the index
+    # this way keeps vector_chunks writable while a large corpus is indexed.
+    with op.get_context().autocommit_block():
+        op.execute(
+            f"""
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS {INDEX_NAMES[index_type]}
+            ON ingestion_service.vector_chunks
+            USING {index_type} (vector vector_l2_ops)
+            WITH ({with_clause})
+            """
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for index_name in INDEX_NAMES.values():
+            op.execute(
+                f"DROP INDEX CONCURRENTLY IF EXISTS ingestion_service.{index_name}"
+            )
@@ -0,0 +1,35 @@
+"""Add (ingestion_id, chunk_id) lookup index on vector_chunks
+
+Revision ID: 20260302_chunkkey
+Revises: 20260301_ann
+Create Date: 2026-03-02
+
+Supports the legacy vectors → vector_chunks backfill (existence check per
+row) and deletes by ingestion_id once vector_chunks is the only table.
+"""
+
+from typing import Sequence, Union
+from alembic import op
+
+revision: str = "20260302_chunkkey"
+down_revision: Union[str, Sequence[str], None] = "20260301_ann"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute(
+            """
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_vector_chunks_ingestion_chunk
+            ON ingestion_service.vector_chunks (ingestion_id, chunk_id)
+            """
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute(
+            "DROP INDEX CONCURRENTLY IF EXISTS "
+            "ingestion_service.ix_vector_chunks_ingestion_chunk"
+        )
@@ -0,0 +1,43 @@
+"""Add metadata filter indexes on vector_chunks
+
+Revision ID: 20260303_filteridx
+Revises: 20260302_chunkkey
+Create Date: 2026-03-03
+
+Backs the WHERE clauses compiled from VectorSearchFilters:
+- document_id / provider / chunk_strategy: B-tree equality / ANY lookups
+- source_metadata: GIN (jsonb_path_ops) for @> containment
+ingestion_id is already served by ix_vector_chunks_ingestion_chunk.
+"""
+
+from typing import Sequence, Union
+from alembic import op
+
+revision: str = "20260303_filteridx"
+down_revision: Union[str, Sequence[str], None] = "20260302_chunkkey"
+branch_labels = None
+depends_on = None
+
+INDEXES = {
+    "ix_vector_chunks_document_id": "(document_id)",
+    "ix_vector_chunks_provider": "(provider)",
+    "ix_vector_chunks_chunk_strategy": "(chunk_strategy)",
+    "ix_vector_chunks_source_metadata": "USING gin (source_metadata jsonb_path_ops)",
+}
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        for index_name, definition in INDEXES.items():
+            op.execute(
+                f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {index_name} "
+                f"ON ingestion_service.vector_chunks {definition}"
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for index_name in INDEXES:
+            op.execute(
+                f"DROP INDEX CONCURRENTLY IF EXISTS ingestion_service.{index_name}"
+            )
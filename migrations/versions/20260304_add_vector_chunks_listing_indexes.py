@@ -0,0 +1,40 @@
+"""Add chunk-listing indexes on vector_chunks
+
+Revision ID: 20260304_listidx
+Revises: 20260303_filteridx
+Create Date: 2026-03-04
+
+GET /v1/vectors/by-ingestion/{id} and /by-document/{id} page through one
+document's chunks with `ORDER BY chunk_index, id` keyset pagination; these
+composite indexes make each page an index range scan.
+"""
+
+from typing import Sequence, Union
+from alembic import op
+
+revision: str = "20260304_listidx"
+down_revision: Union[str, Sequence[str], None] = "20260303_filteridx"
+branch_labels = None
+depends_on = None
+
+INDEXES = {
+    "ix_vector_chunks_ingestion_order": "(ingestion_id, chunk_index, id)",
+    "ix_vector_chunks_document_order": "(document_id, chunk_index, id)",
+}
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        for index_name, columns in INDEXES.items():
+            op.execute(
+                f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {index_name} "
+                f"ON ingestion_service.vector_chunks {columns}"
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for index_name in INDEXES:
+            op.execute(
+                f"DROP INDEX CONCURRENTLY IF EXISTS ingestion_service.{index_name}"
+            )
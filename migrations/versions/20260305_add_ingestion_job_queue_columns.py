@@ -0,0 +1,64 @@
+"""Turn ingestion_requests into a durable job queue
+
+Revision ID: 20260305_jobqueue
+Revises: 20260304_listidx
+Create Date: 2026-03-05
+
+Workers lease `accepted` rows with SELECT ... FOR UPDATE SKIP LOCKED.
+A lease that is not renewed before lease_expires_at is considered
+abandoned (worker crash) and the row becomes leasable again.
+"""
+
+from typing import Sequence, Union
+from alembic import op
+
+revision: str = "20260305_jobqueue"
+down_revision: Union[str, Sequence[str], None] = "20260304_listidx"
+branch_labels = None
+depends_on = None
+
+COLUMNS = {
+    "filename": "TEXT",
+    "content_type": "TEXT",
+    "payload_path": "TEXT",
+    "attempts": "INTEGER NOT NULL DEFAULT 0",
+    "max_attempts": "INTEGER NOT NULL DEFAULT 3",
+    "next_attempt_at": "TIMESTAMP NOT NULL DEFAULT NOW()",
+    "lease_expires_at": "TIMESTAMP",
+    "worker_id": "TEXT",
+}
+
+
+def upgrade() -> None:
+    for column, definition in COLUMNS.items():
+        op.execute(
+            f"ALTER TABLE ingestion_service.ingestion_requests "
+            f"ADD COLUMN IF NOT EXISTS {column} {definition}"
+        )
+
+    # Partial indexes keep the lease scan proportional to the queue depth,
+    # not to the size of the ingestion history.
+    op.execute(
+        """
+        CREATE INDEX IF NOT EXISTS ix_ingestion_requests_queued
+        ON ingestion_service.ingestion_requests (next_attempt_at, created_at)
+        WHERE status = 'accepted' AND payload_path IS NOT NULL
+        """
+    )
+    op.execute(
+        """
+        CREATE INDEX IF NOT EXISTS ix_ingestion_requests_leased
+        ON ingestion_service.ingestion_requests (lease_expires_at)
+        WHERE status = 'running'
+        """
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS ingestion_service.ix_ingestion_requests_leased")
+    op.execute("DROP INDEX IF EXISTS ingestion_service.ix_ingestion_requests_queued")
+    for column in reversed(list(COLUMNS)):
+        op.execute(
+            "ALTER TABLE ingestion_service.ingestion_requests "
+            f"DROP COLUMN IF EXISTS {column}"
+        )
@@ -0,0 +1,43 @@
+"""Add embedding_cache table
+
+Revision ID: 20260306_embcache
+Revises: 20260305_jobqueue
+Create Date: 2026-03-06
+
+Persistent tier of shared.embedders.cache: embeddings keyed on
+(model, sha256 of normalized text), shared by ingestion and query paths.
+"""
+
+from typing import Sequence, Union
+from alembic import op
+
+revision: str = "20260306_embcache"
+down_revision: Union[str, Sequence[str], None] = "20260305_jobqueue"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute(
+        """
+        CREATE TABLE IF NOT EXISTS ingestion_service.embedding_cache (
+            model TEXT NOT NULL,
+            text_hash TEXT NOT NULL,
+            embedding REAL[] NOT NULL,
+            created_at TIMESTAMP NOT NULL DEFAULT NOW(),
+            last_used_at TIMESTAMP NOT NULL DEFAULT NOW(),
+            PRIMARY KEY (model, text_hash)
+        )
+        """
+    )
+    # Eviction scans from the least recently used end
+    op.execute(
+        """
+        CREATE INDEX IF NOT EXISTS ix_embedding_cache_last_used_at
+        ON ingestion_service.embedding_cache (last_used_at)
+        """
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP TABLE IF EXISTS ingestion_service.embedding_cache")
@@ -0,0 +1,41 @@
+"""Add content fingerprint to ingestion_requests
+
+Revision ID: 20260307_contenthash
+Revises: 20260306_embcache
+Create Date: 2026-03-07
+
+SHA-256 of the uploaded bytes, looked up at upload time so byte-identical
+files can short-circuit the pipeline (INGEST_DUPLICATE_POLICY).
+"""
+
+from typing import Sequence, Union
+from alembic import op
+
+revision: str = "20260307_contenthash"
+down_revision: Union[str, Sequence[str], None] = "20260306_embcache"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute(
+        "ALTER TABLE ingestion_service.ingestion_requests "
+        "ADD COLUMN IF NOT EXISTS content_sha256 TEXT"
+    )
+    op.execute(
+        """
+        CREATE INDEX IF NOT EXISTS ix_ingestion_requests_content_sha256
+        ON ingestion_service.ingestion_requests (content_sha256, created_at)
+        WHERE content_sha256 IS NOT NULL
+        """
+    )
+
+
+def downgrade() -> None:
+    op.execute(
+        "DROP INDEX IF EXISTS ingestion_service.ix_ingestion_requests_content_sha256"
+    )
+    op.execute(
+        "ALTER TABLE ingestion_service.ingestion_requests "
+        "DROP COLUMN IF EXISTS content_sha256"
+    )
@@ -0,0 +1,31 @@
+"""Add per-chunk token counts to vector_chunks
+
+Revision ID: 20260308_tokencount
+Revises: 20260307_contenthash
+Create Date: 2026-03-08
+
+Token count of chunk_text, computed by the chunking tokenizer at ingestion
+and returned by search, so the orchestrator budgets its context window with
+stored integers. NULL for rows written before this column existed.
+"""
+
+from typing import Sequence, Union
+from alembic import op
+
+revision: str = "20260308_tokencount"
+down_revision: Union[str, Sequence[str], None] = "20260307_contenthash"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute(
+        "ALTER TABLE ingestion_service.vector_chunks "
+        "ADD COLUMN IF NOT EXISTS token_count INTEGER"
+    )
+
+
+def downgrade() -> None:
+    op.execute(
+        "ALTER TABLE ingestion_service.vector_chunks DROP COLUMN IF EXISTS token_count"
+    )
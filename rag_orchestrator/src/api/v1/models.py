@@ -15,6 +15,7 @@ class RAGQuery(BaseModel):
     top_k: int = 5
     provider: Optional[str] = None  # Optional: If specified, will be passed to the LLM
     model: Optional[str] = None  # Optional: If specified, will be passed to the LLM
+    document_ids: Optional[List[str]] = None  # Optional: restrict retrieval
 
 
 # Model for the response from the RAG process
@@ -44,7 +44,8 @@ async def rag_endpoint(rag_query: RAGQuery):
         query=rag_query.query,
         top_k=rag_query.top_k,
         provider=rag_query.provider,
-        model=rag_query.model
+        model=rag_query.model,
+        document_ids=rag_query.document_ids,
         )
         return result
 
@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 from functools import lru_cache
+from typing import Optional
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -14,6 +15,16 @@ class Settings(BaseSettings):
     OLLAMA_EMBED_MODEL: str = "nomic-embed-text:v1.5"
     OLLAMA_BATCH_SIZE: int = 50
 
+    # Embedding cache (shared.embedders.cache); point the DSN at the
+    # ingestion database to share cached embeddings with ingestion.
+    EMBEDDING_CACHE_SIZE: int = 10_000
+    EMBEDDING_CACHE_DATABASE_URL: Optional[str] = None
+    EMBEDDING_CACHE_MAX_ROWS: int = 1_000_000
+
+    # Tokenizer for chunks without a stored token_count; keep it equal to
+    # the ingestion CHUNK_TOKENIZER so both sides count the same way
+    CHUNK_TOKENIZER: str = "regex"
+
     # -------------------------------------------------
     # Service URLs (Docker service names)
     # -------------------------------------------------
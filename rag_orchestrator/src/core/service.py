@@ -8,10 +8,14 @@ from pydantic import BaseModel
 from src.core.config import get_settings
 from shared.embedders.query import embed_query
 from shared.embedders.factory import get_embedder
+from shared.models.vector import encode_embedding
 
 from shared.retrieval.retrieval_plan import RetrievalPlan
 from rag_orchestrator.src.retrieval.execute_plan import execute_retrieval_plan
-from rag_orchestrator.src.retrieval.agent_adapter import prepare_chunks_for_agent
+from rag_orchestrator.src.retrieval.agent_adapter import (
+    prepare_chunks_for_agent,
+    stored_token_count,
+)
 from rag_orchestrator.src.retrieval.types import RetrievedChunk
 
 logger = logging.getLogger(__name__)
@@ -24,6 +28,7 @@ class AgentChunk(Dict):
     chunk_id: str
     score: Optional[float]
     metadata: Dict[str, Any]
+    token_count: int
 
 
 # ------------------------------------------------------------------
@@ -53,6 +58,7 @@ async def run_rag(
     provider: str | None = None,
     model: str | None = None,
     chunk_filter_fn: Optional[Callable[[RetrievedChunk], bool]] = None,
+    document_ids: Optional[List[str]] = None,
 ) -> RAGResult:
 
     settings = get_settings()
@@ -65,6 +71,9 @@ async def run_rag(
         ollama_base_url=settings.OLLAMA_BASE_URL,
         ollama_model=settings.OLLAMA_EMBED_MODEL,
         ollama_batch_size=settings.OLLAMA_BATCH_SIZE,
+        embedding_cache_size=settings.EMBEDDING_CACHE_SIZE,
+        embedding_cache_dsn=settings.EMBEDDING_CACHE_DATABASE_URL,
+        embedding_cache_max_rows=settings.EMBEDDING_CACHE_MAX_ROWS,
     )
     query_embedding = embed_query(query, embedder)
 
@@ -72,7 +81,13 @@ async def run_rag(
     # Step 2: Global chunk search via HTTP
     # --------------------------------------------------------------
     search_url = f"{settings.VECTOR_STORE_URL}/v1/vectors/search"
-    payload = {"query_vector": query_embedding, "k": top_k}
+    payload: Dict[str, Any] = {
+        "query_vector_b64": encode_embedding(query_embedding),
+        "k": top_k,
+    }
+    if document_ids is not None:
+        # Scope the search to a document set (filtered in SQL, not here)
+        payload["filters"] = {"document_ids": document_ids}
 
     async with httpx.AsyncClient( timeout=120) as client:
         try:
@@ -108,6 +123,7 @@ async def run_rag(
             text=r["text"],
             score=r.get("score"),
             metadata=r.get("metadata", {}),
+            token_count=r.get("token_count"),
         )
         retrieved_chunks_by_document.setdefault(doc_id, []).append(chunk)
 
@@ -132,13 +148,15 @@ async def run_rag(
     )
 
     # --------------------------------------------------------------
-    # Step 6: Prepare chunks for agent
+    # Step 6: Prepare chunks for agent (token budget on stored counts)
     # --------------------------------------------------------------
     agent_chunks_raw = prepare_chunks_for_agent(
         retrieved_context,
         document_order=seed_document_ids,
         max_chunks_per_doc=max_chunks_per_doc,
         max_total_chunks=9999,
+        max_tokens=max_total_tokens,
+        chunk_token_count=stored_token_count(settings.CHUNK_TOKENIZER),
         filter_chunk=chunk_filter_fn,
         debug=True,
     )
@@ -146,19 +164,10 @@ async def run_rag(
     agent_chunks: List[AgentChunk] = [cast(AgentChunk, c) for c in agent_chunks_raw]
 
     # --------------------------------------------------------------
-    # Step 7: Token budget enforcement
+    # Step 7: Build context (already within max_total_tokens)
     # --------------------------------------------------------------
-    context_parts: List[str] = []
-    token_count = 0
-
-    for c in agent_chunks:
-        tokens = len(str(c["text"]).split())
-        if token_count + tokens > max_total_tokens:
-            break
-        context_parts.append(str(c["text"]))
-        token_count += tokens
-
-    context_str = "\n\n".join(context_parts)
+    context_str = "\n\n".join(str(c["text"]) for c in agent_chunks)
+    token_count = sum(int(c["token_count"]) for c in agent_chunks)
     logger.info("Final context tokens ~%d", token_count)
 
     # --------------------------------------------------------------
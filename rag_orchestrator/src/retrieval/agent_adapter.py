@@ -3,12 +3,30 @@
 import logging
 from typing import List, Dict, Optional, Callable
 
+from shared.chunkers.tokenizer import DEFAULT_TOKENIZER, count_tokens
+
 from .types import RetrievedContext, RetrievedChunk
 
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)  # Can be overridden externally
 
 
+def stored_token_count(
+    tokenizer: str = DEFAULT_TOKENIZER,
+) -> Callable[[RetrievedChunk], int]:
+    """
+    chunk_token_count that reads the count stored at ingestion, tokenizing
+    only chunks written before token counts were stored.
+    """
+
+    def _count(chunk: RetrievedChunk) -> int:
+        if chunk.token_count is not None:
+            return chunk.token_count
+        return count_tokens(chunk.text, tokenizer)
+
+    return _count
+
+
 def prepare_chunks_for_agent(
     retrieved: RetrievedContext,
     *,
@@ -29,8 +47,11 @@ def prepare_chunks_for_agent(
         document_order: Optional explicit document ordering (seeds first).
         max_chunks_per_doc: Max chunks to take per document.
         max_total_chunks: Max total chunks to return across all documents.
-        max_tokens: Optional global token budget.
-        chunk_token_count: Function to estimate tokens per chunk.
+        max_tokens: Optional global token budget. Chunks that don't fit in
+            what is left are skipped and later (smaller) chunks still tried,
+            so the budget is packed as tightly as possible.
+        chunk_token_count: Function to estimate tokens per chunk
+            (see stored_token_count).
         filter_chunk: Optional function to filter chunks.
         debug: Enable debug logging.
 
@@ -41,6 +62,7 @@ def prepare_chunks_for_agent(
             - 'chunk_id': unique chunk id
             - 'score': chunk score if present
             - 'metadata': chunk metadata dict
+            - 'token_count': tokens counted against max_tokens
     """
 
     if debug:
@@ -72,22 +94,24 @@ def prepare_chunks_for_agent(
                 logger.debug(f"Chunk {c.chunk_id} filtered out")
                 continue
 
+            # Token budget enforcement
+            chunk_tokens = chunk_token_count(c) if chunk_token_count else 0
+            if max_tokens is not None and total_tokens + chunk_tokens > max_tokens:
+                logger.debug(
+                    f"Chunk {c.chunk_id} ({chunk_tokens} tokens) exceeds the remaining "
+                    f"{max_tokens - total_tokens} of max_tokens={max_tokens}, skipping"
+                )
+                continue
+
             chunk_dict: Dict[str, object] = {
                 "text": c.text,
                 "document_id": c.document_id,
                 "chunk_id": c.chunk_id,
                 "score": getattr(c, "score", None),
                 "metadata": c.metadata,
+                "token_count": chunk_tokens,
             }
 
-            # Token budget enforcement
-            chunk_tokens = chunk_token_count(c) if chunk_token_count else 0
-            if max_tokens is not None and total_tokens + chunk_tokens > max_tokens:
-                logger.debug(
-                    f"Reached max_tokens={max_tokens} after {total_tokens} tokens, stopping"
-                )
-                return final_chunks  # stop adding more chunks
-
             final_chunks.append(chunk_dict)
             total_tokens += chunk_tokens
 
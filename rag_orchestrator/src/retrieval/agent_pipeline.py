@@ -59,7 +59,7 @@ class AgentPromptPipeline:
 
         return chunks
 
-    def build_prompt_text(
+    async def build_prompt_text(
         self,
         retrieved: RetrievedContext,
         document_order: Optional[List[str]] = None,
@@ -69,6 +69,7 @@ class AgentPromptPipeline:
         Flatten chunks into a single prompt string for the LLM,
         preserving provenance and deterministic order.
         Prepend document summaries (conceptual layer) before chunks (evidence layer).
+        Summaries for all documents are fetched in a single batched request.
         """
 
         # Step 0: Determine document order
@@ -76,7 +77,7 @@ class AgentPromptPipeline:
             document_order = sorted(retrieved.chunks_by_document.keys())
 
         # Step 1: Fetch summaries for these documents
-        summaries = fetch_summaries(document_order)
+        summaries = await fetch_summaries(document_order)
 
         prompt_parts: List[str] = []
 
@@ -1,8 +1,9 @@
 # rag_orchestrator/src/retrieval/summary_adapter.py
 
 import logging
-from typing import List, Dict, Optional
-import requests
+from typing import List, Dict
+from uuid import UUID
+import httpx
 
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
@@ -10,28 +11,53 @@ logger.setLevel(logging.INFO)
 # Base URL for the ingestion service where summaries live
 INGESTION_API_BASE_URL = "http://ingestion_service:8001"
 
+# Upper bound on ids per batchGet request (matches the ingestion_service limit)
+SUMMARY_BATCH_SIZE = 1000
 
-def fetch_summaries(document_ids: List[str]) -> Dict[str, str]:
+
+async def fetch_summaries(document_ids: List[str]) -> Dict[str, str]:
     """
     Given a list of document IDs, fetch their saved summaries from ingestion service.
 
+    Uses POST /v1/summaries:batchGet, so the cost is one round trip per
+    SUMMARY_BATCH_SIZE ids rather than one per document.
+
     Returns:
         Dict[document_id, summary_text]
         If a document has no summary, it will be absent from the dict.
+        Ids that are not UUIDs can't have one and are never sent (the
+        endpoint rejects a whole batch containing one).
     """
     summaries: Dict[str, str] = {}
-
-    for doc_id in document_ids:
-        try:
-            resp = requests.get(f"{INGESTION_API_BASE_URL}/v1/summary/{doc_id}", timeout=300)
-            if resp.status_code == 200:
-                data = resp.json()
-                summary_text = data.get("summary")
-                if summary_text:
-                    summaries[doc_id] = summary_text
-            else:
-                logger.debug(f"No summary for doc_id={doc_id} (status={resp.status_code})")
-        except Exception as exc:
-            logger.warning(f"Error fetching summary for doc_id={doc_id}: {exc}")
+    unique_ids = [
+        document_id for document_id in dict.fromkeys(document_ids)
+        if _is_uuid(document_id)
+    ]
+    if not unique_ids:
+        return summaries
+
+    url = f"{INGESTION_API_BASE_URL}/v1/summaries:batchGet"
+    async with httpx.AsyncClient(timeout=30) as client:
+        for start in range(0, len(unique_ids), SUMMARY_BATCH_SIZE):
+            batch = unique_ids[start:start + SUMMARY_BATCH_SIZE]
+            try:
+                resp = await client.post(url, json={"document_ids": batch})
+                if resp.status_code == 200:
+                    summaries.update(resp.json().get("summaries", {}))
+                else:
+                    logger.debug(f"Summary batchGet failed (status={resp.status_code})")
+            except Exception as exc:
+                logger.warning(
+                    f"Error fetching summaries for {len(batch)} documents: {exc}"
+                )
 
     return summaries
+
+
+def _is_uuid(value: str) -> bool:
+    try:
+        UUID(str(value))
+    except ValueError:
+        logger.debug(f"Skipping summary lookup for non-UUID document id {value!r}")
+        return False
+    return True
@@ -4,16 +4,17 @@ from dataclasses import dataclass
 from typing import Dict, List, Any, Optional
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RetrievedChunk:
     chunk_id: str
     document_id: str
     text: str
     score: Optional[float]  # can be None if not provided
     metadata: dict
+    token_count: Optional[int] = None  # stored at ingestion (vector_chunks.token_count)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RetrievedContext:
     """
     Result of executing a RetrievalPlan.
@@ -0,0 +1,67 @@
+# rag_orchestrator/tests/test_summary_adapter.py
+
+import asyncio
+import json
+from unittest.mock import patch
+from uuid import uuid4
+
+import httpx
+
+from rag_orchestrator.src.retrieval import summary_adapter
+
+
+def run_fetch(document_ids, handler):
+    """fetch_summaries() against an in-process transport.
+
+    Returns (result, request bodies).
+    """
+    requests = []
+    real_client = httpx.AsyncClient
+
+    def _handler(request):
+        requests.append(json.loads(request.content))
+        return handler(request)
+
+    def _client(**kwargs):
+        return real_client(transport=httpx.MockTransport(_handler), **kwargs)
+
+    with patch.object(summary_adapter.httpx, "AsyncClient", _client):
+        result = asyncio.run(summary_adapter.fetch_summaries(document_ids))
+    return result, requests
+
+
+def test_fetch_summaries_batches_unique_uuid_ids():
+    ids = [str(uuid4()) for _ in range(5)]
+
+    def handler(request):
+        body = json.loads(request.content)
+        summaries = {i: f"summary {i}" for i in body["document_ids"]}
+        return httpx.Response(200, json={"summaries": summaries})
+
+    with patch.object(summary_adapter, "SUMMARY_BATCH_SIZE", 2):
+        result, requests = run_fetch(ids + ids[:2] + ["not-a-uuid"], handler)
+
+    assert [r["document_ids"] for r in requests] == [ids[0:2], ids[2:4], ids[4:5]]
+    assert result == {i: f"summary {i}" for i in ids}
+
+
+def test_fetch_summaries_skips_failed_batches():
+    ids = [str(uuid4()) for _ in range(2)]
+
+    def handler(request):
+        if json.loads(request.content)["document_ids"] == [ids[0]]:
+            return httpx.Response(500)
+        return httpx.Response(200, json={"summaries": {ids[1]: "kept"}})
+
+    with patch.object(summary_adapter, "SUMMARY_BATCH_SIZE", 1):
+        result, requests = run_fetch(ids, handler)
+
+    assert len(requests) == 2
+    assert result == {ids[1]: "kept"}
+
+
+def test_fetch_summaries_without_ids_makes_no_request():
+    result, requests = run_fetch(["not-a-uuid"], lambda request: httpx.Response(500))
+
+    assert result == {}
+    assert requests == []
@@ -3,6 +3,7 @@
 from typing import Any, Dict
 from shared.chunkers.base import BaseChunker
 from shared.chunkers.text import TextChunker
+from shared.chunkers.tokenizer import DEFAULT_TOKENIZER
 
 
 class ChunkerFactory:
@@ -26,16 +27,29 @@ class ChunkerFactory:
         """
         Heuristic to choose a chunk strategy based on content type and length.
         Returns (chunker instance, chunk_strategy parameters)
+
+        Text is chunked to token budgets; context["tokenizer"] names the
+        tokenizer (default DEFAULT_TOKENIZER).
         """
         if isinstance(content, str):
+            tokenizer = context.get("tokenizer") or DEFAULT_TOKENIZER
             if len(content) < 2000:
-                return cls.get_chunker("sentence"), {"chunk_size": 200, "overlap": 20}
+                return cls.get_chunker("sentence"), {
+                    "chunk_size": 64,
+                    "overlap": 8,
+                    "tokenizer": tokenizer,
+                }
             elif len(content) < 10000:
-                return cls.get_chunker("paragraph"), {"chunk_size": 500, "overlap": 50}
+                return cls.get_chunker("paragraph"), {
+                    "chunk_size": 128,
+                    "overlap": 16,
+                    "tokenizer": tokenizer,
+                }
             else:
                 return cls.get_chunker("fixed_char"), {
-                    "chunk_size": 1000,
-                    "overlap": 100,
+                    "chunk_size": 256,
+                    "overlap": 32,
+                    "tokenizer": tokenizer,
                 }
 
         # Default for other modalities (audio, video, images)
@@ -0,0 +1,134 @@
+# shared/chunkers/spans.py
+"""
+Single-pass span engines behind TextChunker.
+
+Each function scans the text once and returns (start, end) character
+offsets into the original string; no intermediate strings are built, so
+the caller only materializes the chunks it keeps (text[start:end]).
+
+Sizes are in characters, or in tokens when the token offsets of the text
+are passed as `tokens` (see shared.chunkers.tokenizer); token counts of a
+span are then a bisect over the token start offsets.
+"""
+from __future__ import annotations
+
+import re
+from bisect import bisect_left
+from typing import Callable, Iterator, List, Optional, Sequence, Tuple
+
+Span = Tuple[int, int]
+
+_SENTENCE_BOUNDARY = re.compile(r"(?<=[.!?])\s+")
+_PARAGRAPH_BOUNDARY = re.compile(r"\n\n")
+_STRIPPED = re.compile(r"\S(?:.*\S)?", re.DOTALL)
+
+
+def simple_spans(text: str, chunk_size: int, overlap: int) -> List[Span]:
+    """Fixed-size windows advancing by chunk_size - overlap."""
+    step = chunk_size - overlap
+    if chunk_size < 1 or step < 1:
+        raise ValueError("chunk_size must be >= 1 and greater than overlap")
+    length = len(text)
+    return [
+        (start, min(start + chunk_size, length))
+        for start in range(0, length, step)
+    ]
+
+
+def _char_count(start: int, end: int) -> int:
+    return end - start
+
+
+def token_counter(tokens: Sequence[Span]) -> Callable[[int, int], int]:
+    """count(start, end) = number of tokens starting within [start, end)."""
+    starts = [start for start, _ in tokens]
+    return lambda start, end: bisect_left(starts, end) - bisect_left(starts, start)
+
+
+def token_window_spans(
+    tokens: Sequence[Span],
+    max_tokens: int,
+    overlap: int,
+    first: int = 0,
+    last: Optional[int] = None,
+) -> List[Span]:
+    """
+    Windows of max_tokens tokens over tokens[first:last], advancing by
+    max_tokens - overlap; each span runs from its first token's start to its
+    last token's end.
+    """
+    step = max_tokens - overlap
+    if max_tokens < 1 or step < 1:
+        raise ValueError("chunk_size must be >= 1 and greater than overlap")
+    last = len(tokens) if last is None else last
+    return [
+        (tokens[i][0], tokens[min(i + max_tokens, last) - 1][1])
+        for i in range(first, last, step)
+    ]
+
+
+def _segments(text: str, boundary: re.Pattern) -> Iterator[Span]:
+    """Spans between boundary matches (the boundaries themselves excluded)."""
+    start = 0
+    for match in boundary.finditer(text):
+        yield start, match.start()
+        start = match.end()
+    yield start, len(text)
+
+
+def _pack(
+    segments: Iterator[Span], chunk_size: int, tokens: Optional[Sequence[Span]] = None
+) -> List[Span]:
+    """
+    Greedily merge consecutive non-empty segments while the merged span
+    (including the original separators) stays within chunk_size.
+
+    In characters, a segment longer than chunk_size becomes a span of its
+    own. In tokens, such a segment is cut into token windows instead, so no
+    span exceeds the budget.
+    """
+    size = _char_count if tokens is None else token_counter(tokens)
+    starts = [start for start, _ in tokens] if tokens is not None else []
+
+    spans: List[Span] = []
+    current_start = current_end = -1
+    for start, end in segments:
+        if start == end:
+            continue
+        if tokens is not None and size(start, end) > chunk_size:
+            if current_start >= 0:
+                spans.append((current_start, current_end))
+                current_start = current_end = -1
+            first, last = bisect_left(starts, start), bisect_left(starts, end)
+            spans.extend(token_window_spans(tokens, chunk_size, 0, first, last))
+        elif current_start < 0:
+            current_start, current_end = start, end
+        elif size(current_start, end) > chunk_size:
+            spans.append((current_start, current_end))
+            current_start, current_end = start, end
+        else:
+            current_end = end
+    if current_start >= 0:
+        spans.append((current_start, current_end))
+    return spans
+
+
+def sentence_spans(
+    text: str, chunk_size: int, tokens: Optional[Sequence[Span]] = None
+) -> List[Span]:
+    """Sentences (split after . ! ? + whitespace) packed up to chunk_size."""
+    return _pack(_segments(text, _SENTENCE_BOUNDARY), chunk_size, tokens)
+
+
+def paragraph_spans(
+    text: str, chunk_size: int, tokens: Optional[Sequence[Span]] = None
+) -> List[Span]:
+    """Paragraphs (split on blank lines, whitespace-trimmed) packed up to chunk_size."""
+
+    def _trimmed() -> Iterator[Span]:
+        for start, end in _segments(text, _PARAGRAPH_BOUNDARY):
+            match = _STRIPPED.search(text, start, end)
+            if match:
+                yield match.start(), match.end()
+
+    return _pack(_trimmed(), chunk_size, tokens)
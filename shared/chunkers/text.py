@@ -1,104 +1,130 @@
 # src/ingestion_service/core/chunkers/text.py
 
 from __future__ import annotations
-import uuid
-from typing import List
+from itertools import tee
+from typing import Callable, Iterator, List, Optional, Sequence
 
-from shared.chunks import Chunk
+from shared.chunks import Chunk, iter_content_chunk_ids
 from shared.chunkers.base import BaseChunker
+from shared.chunkers.spans import (
+    Span,
+    paragraph_spans,
+    sentence_spans,
+    simple_spans,
+    token_counter,
+    token_window_spans,
+)
+from shared.chunkers.tokenizer import get_tokenizer
 
 
 class TextChunker(BaseChunker):
-    """Text chunker supporting multiple strategies."""
+    """
+    Text chunker supporting multiple strategies.
+
+    Strategies compute (start, end) spans into the input in one pass (see
+    shared.chunkers.spans); chunk() slices each span once and records the
+    offsets on the Chunk as char_start / char_end. iter_chunks() does the
+    slicing lazily, so only the spans are held for the whole text.
+
+    With a tokenizer (e.g. "regex", see shared.chunkers.tokenizer),
+    chunk_size and overlap are token budgets: the text is tokenized once,
+    spans are cut at token boundaries and each Chunk gets its token_count.
+    """
 
     name: str = "text_chunker"
 
     def __init__(
-        self, chunk_size: int = 500, overlap: int = 50, chunk_strategy: str = "simple"
+        self,
+        chunk_size: int = 500,
+        overlap: int = 50,
+        chunk_strategy: str = "simple",
+        tokenizer: Optional[str] = None,
     ):
         self.chunk_size = chunk_size
         self.overlap = overlap
         self.chunk_strategy = chunk_strategy
+        self.tokenizer = tokenizer
 
     def chunk(self, content: str, **params) -> List[Chunk]:
+        return list(self.iter_chunks(content, **params))
+
+    def iter_chunks(self, content: str, **params) -> Iterator[Chunk]:
+        tokens = self._tokens(content, params)
+        spans = self._spans(content, tokens, params)
+        count = token_counter(tokens) if tokens is not None else None
+        yield from self._to_chunks(content, spans, count)
+
+    def spans(self, content: str, **params) -> List[Span]:
+        """(start, end) offsets of each chunk, without materializing any text."""
+        return self._spans(content, self._tokens(content, params), params)
+
+    def _tokens(self, content: str, params: dict) -> Optional[List[Span]]:
+        tokenizer = params.get("tokenizer", self.tokenizer)
+        return get_tokenizer(tokenizer).offsets(content) if tokenizer else None
+
+    def _spans(
+        self, content: str, tokens: Optional[Sequence[Span]], params: dict
+    ) -> List[Span]:
         chunk_size = params.get("chunk_size", self.chunk_size)
         overlap = params.get("overlap", self.overlap)
         chunk_strategy = params.get("chunk_strategy", self.chunk_strategy)
 
         if chunk_strategy == "simple":
-            return self._chunk_simple(content, chunk_size, overlap)
+            return self._chunk_simple(content, chunk_size, overlap, tokens)
         elif chunk_strategy == "sentence":
-            return self._chunk_by_sentence(content, chunk_size, overlap)
+            return self._chunk_by_sentence(content, chunk_size, overlap, tokens)
         elif chunk_strategy == "paragraph":
-            return self._chunk_by_paragraph(content, chunk_size, overlap)
+            return self._chunk_by_paragraph(content, chunk_size, overlap, tokens)
         else:
             raise ValueError(f"Unknown text chunk strategy: {chunk_strategy}")
 
-    def _chunk_simple(self, text: str, chunk_size: int, overlap: int) -> List[Chunk]:
-        chunks: List[Chunk] = []
-        start = 0
-        text_length = len(text)
-
-        while start < text_length:
-            end = min(start + chunk_size, text_length)
-            chunk_text = text[start:end]
-            chunks.append(
-                Chunk(content=chunk_text, chunk_id=str(uuid.uuid4()), metadata={})
-            )
-            start += chunk_size - overlap
-
-        return chunks
+    def _chunk_simple(
+        self,
+        text: str,
+        chunk_size: int,
+        overlap: int,
+        tokens: Optional[Sequence[Span]] = None,
+    ) -> List[Span]:
+        if tokens is not None:
+            return token_window_spans(tokens, chunk_size, overlap)
+        return simple_spans(text, chunk_size, overlap)
 
     def _chunk_by_sentence(
-        self, text: str, chunk_size: int, overlap: int
-    ) -> List[Chunk]:
-        import re
-
-        sentences = re.split(r"(?<=[.!?])\s+", text)
-        chunks: List[Chunk] = []
-        buffer = ""
-
-        for sentence in sentences:
-            if len(buffer) + len(sentence) > chunk_size:
-                if buffer:
-                    chunks.append(
-                        Chunk(content=buffer, chunk_id=str(uuid.uuid4()), metadata={})
-                    )
-                buffer = sentence
-            else:
-                buffer += (" " if buffer else "") + sentence
-
-        if buffer:
-            chunks.append(
-                Chunk(content=buffer, chunk_id=str(uuid.uuid4()), metadata={})
-            )
-
-        return chunks
+        self,
+        text: str,
+        chunk_size: int,
+        overlap: int,
+        tokens: Optional[Sequence[Span]] = None,
+    ) -> List[Span]:
+        return sentence_spans(text, chunk_size, tokens)
 
     def _chunk_by_paragraph(
-        self, text: str, chunk_size: int, overlap: int
-    ) -> List[Chunk]:
-        paragraphs = text.split("\n\n")
-        chunks: List[Chunk] = []
-        buffer = ""
-
-        for para in paragraphs:
-            para = para.strip()
-            if not para:
-                continue
-
-            if len(buffer) + len(para) > chunk_size:
-                if buffer:
-                    chunks.append(
-                        Chunk(content=buffer, chunk_id=str(uuid.uuid4()), metadata={})
-                    )
-                buffer = para
-            else:
-                buffer += ("\n\n" if buffer else "") + para
-
-        if buffer:
-            chunks.append(
-                Chunk(content=buffer, chunk_id=str(uuid.uuid4()), metadata={})
+        self,
+        text: str,
+        chunk_size: int,
+        overlap: int,
+        tokens: Optional[Sequence[Span]] = None,
+    ) -> List[Span]:
+        return paragraph_spans(text, chunk_size, tokens)
+
+    @staticmethod
+    def _to_chunks(
+        text: str,
+        spans: List[Span],
+        count: Optional[Callable[[int, int], int]] = None,
+    ) -> Iterator[Chunk]:
+        """
+        Slice each span once, as chunks are consumed; ids are deterministic,
+        content-derived. `count` gives each chunk's token_count from its span.
+        """
+        pieces, id_source = tee(text[start:end] for start, end in spans)
+        chunk_ids = iter_content_chunk_ids(id_source)
+        for piece, chunk_id, (start, end) in zip(pieces, chunk_ids, spans):
+            yield Chunk(
+                content=piece,
+                chunk_id=chunk_id,
+                metadata={},
+                char_start=start,
+                char_end=end,
+                token_count=count(start, end) if count is not None else None,
             )
-
-        return chunks
@@ -0,0 +1,85 @@
+# shared/chunkers/tokenizer.py
+"""
+Local tokenizers used to size chunks and context windows in tokens.
+
+A tokenizer maps text to the (start, end) character offsets of its tokens,
+so chunkers can cut spans at token boundaries and count tokens between any
+two offsets with a bisect (see shared.chunkers.spans). Nothing here touches
+the network:
+
+- "regex" (default): dependency-free approximation of a BPE vocabulary —
+  letter runs of up to 8 characters, digit groups of up to 3, and every
+  other non-space character as one token;
+- "hf:<path>": a HuggingFace `tokenizer.json` read from a local file with
+  the optional `tokenizers` package (e.g. the embedding model's own vocab).
+
+get_tokenizer() caches one instance per spec, so a vocabulary is loaded
+once per process.
+"""
+from __future__ import annotations
+
+import re
+from abc import ABC, abstractmethod
+from functools import lru_cache
+from typing import List
+
+from shared.chunkers.spans import Span
+
+DEFAULT_TOKENIZER = "regex"
+
+_REGEX_TOKEN = re.compile(r"[^\W\d_]{1,8}|\d{1,3}|\S")
+
+
+class Tokenizer(ABC):
+    """Text → token offsets."""
+
+    name: str = "base"
+
+    @abstractmethod
+    def offsets(self, text: str) -> List[Span]:
+        """(start, end) character offsets of each token, in order."""
+
+    def count(self, text: str) -> int:
+        return len(self.offsets(text))
+
+
+class RegexTokenizer(Tokenizer):
+    name = "regex"
+
+    def offsets(self, text: str) -> List[Span]:
+        return [match.span() for match in _REGEX_TOKEN.finditer(text)]
+
+    def count(self, text: str) -> int:
+        return sum(1 for _ in _REGEX_TOKEN.finditer(text))
+
+
+class HuggingFaceTokenizer(Tokenizer):
+    """A `tokenizers` vocabulary loaded from a local tokenizer.json."""
+
+    def __init__(self, path: str) -> None:
+        try:
+            from tokenizers import Tokenizer as _HFTokenizer  # type: ignore
+        except ImportError as exc:
+            raise RuntimeError(
+                "The 'tokenizers' package is required for 'hf:' tokenizers"
+            ) from exc
+        self.name = f"hf:{path}"
+        self._tokenizer = _HFTokenizer.from_file(path)
+
+    def offsets(self, text: str) -> List[Span]:
+        encoding = self._tokenizer.encode(text, add_special_tokens=False)
+        return [(start, end) for start, end in encoding.offsets if end > start]
+
+
+@lru_cache
+def get_tokenizer(spec: str = DEFAULT_TOKENIZER) -> Tokenizer:
+    """Process-wide tokenizer for `spec` ("regex" or "hf:<path to tokenizer.json>")."""
+    if spec == "regex":
+        return RegexTokenizer()
+    if spec.startswith("hf:"):
+        return HuggingFaceTokenizer(spec[len("hf:"):])
+    raise ValueError(f"Unknown tokenizer '{spec}'. Valid: 'regex', 'hf:<path>'")
+
+
+def count_tokens(text: str, spec: str = DEFAULT_TOKENIZER) -> int:
+    return get_tokenizer(spec).count(text)
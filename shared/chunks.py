@@ -1,12 +1,78 @@
 # src/ingestion_service/core/chunks.py
 from __future__ import annotations
+import hashlib
+import sys
 from dataclasses import dataclass, field
-from typing import Any, Dict, Optional
+from functools import lru_cache
+from typing import Any, Dict, Iterable, Iterator, List, Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class Chunk:
     chunk_id: str
     content: Any
+    # may be shared by the chunks of one source (see shared_metadata):
+    # replace it rather than mutating it in place
     metadata: Dict[str, Any] = field(default_factory=dict)
     ocr_text: Optional[str] = None
+    # character offsets into the chunked source text, when known
+    char_start: Optional[int] = None
+    char_end: Optional[int] = None
+    # tokens in content, when chunked by a tokenizer (shared.chunkers.tokenizer)
+    token_count: Optional[int] = None
+
+
+def content_hash(text: str) -> str:
+    """SHA-256 hex digest of chunk text."""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def content_chunk_ids(texts: Iterable[str]) -> List[str]:
+    """
+    Deterministic chunk ids derived from chunk text.
+
+    The same text always gets the same id, so re-chunking an edited
+    document reproduces the ids of unchanged chunks. Repeated texts within
+    one document get an occurrence suffix ("<hash>-2", "<hash>-3", ...)
+    to keep ids unique.
+    """
+    return list(iter_content_chunk_ids(texts))
+
+
+def iter_content_chunk_ids(texts: Iterable[str]) -> Iterator[str]:
+    """content_chunk_ids(), yielding each id as its text is consumed."""
+    seen: Dict[str, int] = {}
+    for text in texts:
+        digest = content_hash(text)[:32]
+        seen[digest] = seen.get(digest, 0) + 1
+        yield digest if seen[digest] == 1 else f"{digest}-{seen[digest]}"
+
+
+_INTERN_MAX_CHARS = 256  # don't intern chunk / OCR text
+
+
+@lru_cache(maxsize=1024)
+def _shared_dict(items: tuple) -> Dict[str, Any]:
+    return dict(items)
+
+
+def shared_metadata(metadata: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Compact a metadata dict meant to be shared by many chunks.
+
+    Short str values (chunker_name, chunk_strategy, source_file, ...) are
+    interned, and flat dicts of hashable values (chunker_params) are
+    replaced by one cached instance per distinct content. Returns a new
+    dict; callers must treat it, and its nested dicts, as read-only.
+    """
+    compact: Dict[str, Any] = {}
+    for key, value in metadata.items():
+        if isinstance(value, str) and len(value) <= _INTERN_MAX_CHARS:
+            value = sys.intern(value)
+        elif isinstance(value, dict):
+            try:
+                value = _shared_dict(tuple(sorted(value.items())))
+            except TypeError:  # unhashable / unorderable values: keep as is
+                pass
+        compact[sys.intern(key)] = value
+    return compact
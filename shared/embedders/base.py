@@ -3,6 +3,7 @@ from abc import ABC, abstractmethod
 from typing import List
 
 from shared.chunks import Chunk
+from shared.models.vector import Embedding
 
 
 class BaseEmbedder(ABC):
@@ -11,11 +12,11 @@ class BaseEmbedder(ABC):
     name: str = "base"
 
     @abstractmethod
-    def embed(self, chunks: List[Chunk]) -> List[List[float]]:
+    def embed(self, chunks: List[Chunk]) -> List[Embedding]:
         """
         Generate embeddings for chunks.
 
         :param chunks: List of Chunk objects
-        :return: List of embedding vectors
+        :return: List of float32 embedding vectors (see shared.models.vector)
         """
         raise NotImplementedError
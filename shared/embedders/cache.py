@@ -0,0 +1,284 @@
+# shared/embedders/cache.py
+"""
+Content-addressed embedding cache.
+
+Entries are keyed on (model, sha256(normalized text)), so identical text
+(re-uploads, repeated headers/footers, repeated questions) is embedded once.
+
+Two tiers:
+- LRUEmbeddingCache: in-process, bounded by entry count.
+- PostgresEmbeddingCache: shared by every process/service pointing at the
+  same database, bounded by row count (least recently used rows evicted).
+
+CachedEmbedder wraps any BaseEmbedder and only sends cache misses to the
+model.
+"""
+from __future__ import annotations
+
+import hashlib
+import logging
+import re
+import threading
+import unicodedata
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from shared.chunks import Chunk
+from shared.embedders.base import BaseEmbedder
+from shared.models.vector import Embedding, to_embedding
+
+logger = logging.getLogger(__name__)
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_text(text: str) -> str:
+    """NFC-normalize and collapse whitespace runs."""
+    return _WHITESPACE.sub(" ", unicodedata.normalize("NFC", text)).strip()
+
+
+def text_hash(text: str) -> str:
+    return hashlib.sha256(normalize_text(text).encode("utf-8")).hexdigest()
+
+
+@dataclass
+class EmbeddingCacheStats:
+    hits: int = 0
+    misses: int = 0
+    memory_hits: int = 0
+    persistent_hits: int = 0
+    evictions: int = 0
+
+
+class LRUEmbeddingCache:
+    """Thread-safe in-process LRU keyed on (model, text_hash)."""
+
+    def __init__(self, max_entries: int = 10_000) -> None:
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Tuple[str, str], Embedding]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_many(self, model: str, hashes: Iterable[str]) -> Dict[str, Embedding]:
+        found: Dict[str, Embedding] = {}
+        with self._lock:
+            for h in hashes:
+                vector = self._entries.get((model, h))
+                if vector is not None:
+                    self._entries.move_to_end((model, h))
+                    found[h] = vector
+        return found
+
+    def put_many(self, model: str, items: Dict[str, Embedding]) -> None:
+        if self.max_entries <= 0:
+            return
+        with self._lock:
+            for h, vector in items.items():
+                self._entries[(model, h)] = vector
+                self._entries.move_to_end((model, h))
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+class PostgresEmbeddingCache:
+    """
+    Persistent tier stored in ingestion_service.embedding_cache.
+
+    Rows carry last_used_at; once more than max_rows are stored, the least
+    recently used rows are deleted (checked every `evict_every` inserts).
+    """
+
+    SCHEMA = "ingestion_service"
+
+    def __init__(
+        self,
+        dsn: str,
+        *,
+        max_rows: int = 1_000_000,
+        evict_every: int = 1_000,
+        pool_max_size: int = 4,
+    ) -> None:
+        self.dsn = dsn
+        self.max_rows = max_rows
+        self.evict_every = evict_every
+        self.pool_max_size = pool_max_size
+        self.evictions = 0
+        self._inserted_since_evict = 0
+        self._pool = None
+        self._lock = threading.Lock()
+
+    def _get_pool(self):
+        if self._pool is None:
+            with self._lock:
+                if self._pool is None:
+                    from psycopg_pool import ConnectionPool
+
+                    self._pool = ConnectionPool(
+                        self.dsn,
+                        min_size=1,
+                        max_size=self.pool_max_size,
+                        name="embedding-cache",
+                        open=True,
+                    )
+        return self._pool
+
+    def get_many(self, model: str, hashes: Sequence[str]) -> Dict[str, Embedding]:
+        if not hashes:
+            return {}
+        with self._get_pool().connection() as conn:
+            rows = conn.execute(
+                f"""
+                UPDATE {self.SCHEMA}.embedding_cache
+                SET last_used_at = NOW()
+                WHERE model = %s AND text_hash = ANY(%s)
+                RETURNING text_hash, embedding
+                """,
+                (model, list(hashes)),
+            ).fetchall()
+        return {h: to_embedding(embedding) for h, embedding in rows}
+
+    def put_many(self, model: str, items: Dict[str, Embedding]) -> None:
+        if not items:
+            return
+        with self._get_pool().connection() as conn:
+            with conn.cursor() as cur:
+                cur.executemany(
+                    f"""
+                    INSERT INTO {self.SCHEMA}.embedding_cache
+                        (model, text_hash, embedding)
+                    VALUES (%s, %s, %s)
+                    ON CONFLICT (model, text_hash) DO NOTHING
+                    """,
+                    [(model, h, list(vector)) for h, vector in items.items()],
+                )
+            self._inserted_since_evict += len(items)
+            if self._inserted_since_evict >= self.evict_every:
+                self._inserted_since_evict = 0
+                self._evict(conn)
+
+    def _evict(self, conn) -> None:
+        cur = conn.execute(
+            f"""
+            DELETE FROM {self.SCHEMA}.embedding_cache
+            WHERE (model, text_hash) IN (
+                SELECT model, text_hash FROM {self.SCHEMA}.embedding_cache
+                ORDER BY last_used_at DESC
+                OFFSET %s
+            )
+            """,
+            (self.max_rows,),
+        )
+        if cur.rowcount > 0:
+            self.evictions += cur.rowcount
+            logger.info("Embedding cache evicted %d rows", cur.rowcount)
+
+    def close(self) -> None:
+        if self._pool is not None:
+            self._pool.close()
+            self._pool = None
+
+
+class EmbeddingCache:
+    """Memory tier in front of an optional persistent tier, with counters."""
+
+    def __init__(
+        self,
+        memory: LRUEmbeddingCache,
+        persistent: Optional[PostgresEmbeddingCache] = None,
+    ) -> None:
+        self.memory = memory
+        self.persistent = persistent
+        self._stats = EmbeddingCacheStats()
+        self._lock = threading.Lock()
+
+    def get_many(self, model: str, hashes: Sequence[str]) -> Dict[str, Embedding]:
+        found = self.memory.get_many(model, hashes)
+        memory_hits = len(found)
+
+        missing = [h for h in hashes if h not in found]
+        persistent_hits = 0
+        if missing and self.persistent is not None:
+            try:
+                from_db = self.persistent.get_many(model, missing)
+            except Exception as exc:
+                logger.warning("Embedding cache lookup failed: %s", exc)
+                from_db = {}
+            persistent_hits = len(from_db)
+            if from_db:
+                self.memory.put_many(model, from_db)
+                found.update(from_db)
+
+        with self._lock:
+            self._stats.memory_hits += memory_hits
+            self._stats.persistent_hits += persistent_hits
+            self._stats.hits += memory_hits + persistent_hits
+            self._stats.misses += len(hashes) - len(found)
+        return found
+
+    def put_many(self, model: str, items: Dict[str, Embedding]) -> None:
+        self.memory.put_many(model, items)
+        if self.persistent is not None:
+            try:
+                self.persistent.put_many(model, items)
+            except Exception as exc:
+                logger.warning("Embedding cache write failed: %s", exc)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            stats = asdict(self._stats)
+        stats["evictions"] = self.memory.evictions + (
+            self.persistent.evictions if self.persistent is not None else 0
+        )
+        stats["memory_entries"] = len(self.memory)
+        return stats
+
+
+class CachedEmbedder(BaseEmbedder):
+    """Consults an EmbeddingCache and only embeds the misses."""
+
+    def __init__(self, embedder: BaseEmbedder, cache: EmbeddingCache) -> None:
+        self.embedder = embedder
+        self.cache = cache
+        self.name = embedder.name
+        self.dimension = getattr(embedder, "dimension", None)
+        # The model identity is part of the key: switching models must miss
+        self.model_key = f"{embedder.name}:{getattr(embedder, 'model', embedder.name)}"
+
+    def embed(self, chunks: List[Chunk]) -> List[Embedding]:
+        hashes = [text_hash(str(chunk.content)) for chunk in chunks]
+        found = self.cache.get_many(self.model_key, list(dict.fromkeys(hashes)))
+
+        # Embed each distinct missing text once, even if repeated in this call
+        to_embed: Dict[str, Chunk] = {}
+        for h, chunk in zip(hashes, chunks):
+            if h not in found and h not in to_embed:
+                to_embed[h] = chunk
+
+        if to_embed:
+            vectors = self.embedder.embed(list(to_embed.values()))
+            computed = dict(zip(to_embed.keys(), vectors))
+            self.cache.put_many(self.model_key, computed)
+            found.update(computed)
+
+        return [found[h] for h in hashes]
+
+
+@lru_cache
+def get_embedding_cache(
+    max_entries: int = 10_000,
+    dsn: Optional[str] = None,
+    max_rows: int = 1_000_000,
+) -> EmbeddingCache:
+    """Process-wide cache, so the LRU tier survives across embedder instances."""
+    persistent = PostgresEmbeddingCache(dsn, max_rows=max_rows) if dsn else None
+    return EmbeddingCache(LRUEmbeddingCache(max_entries), persistent)
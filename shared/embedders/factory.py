@@ -1,4 +1,5 @@
 # shared/embedders/factory.py
+from shared.embedders.cache import CachedEmbedder, get_embedding_cache
 from shared.embedders.mock import MockEmbedder
 from shared.embedders.ollama import OllamaEmbedder
 
@@ -9,6 +10,39 @@ def get_embedder(
     ollama_base_url: str | None = None,
     ollama_model: str | None = None,
     ollama_batch_size: int = 50,
+    ollama_max_concurrency: int = 4,
+    ollama_max_retries: int = 3,
+    embedding_cache_size: int = 0,
+    embedding_cache_dsn: str | None = None,
+    embedding_cache_max_rows: int = 1_000_000,
+):
+    embedder = _build_embedder(
+        provider=provider,
+        ollama_base_url=ollama_base_url,
+        ollama_model=ollama_model,
+        ollama_batch_size=ollama_batch_size,
+        ollama_max_concurrency=ollama_max_concurrency,
+        ollama_max_retries=ollama_max_retries,
+    )
+    if embedding_cache_size <= 0 and not embedding_cache_dsn:
+        return embedder
+
+    cache = get_embedding_cache(
+        max_entries=embedding_cache_size,
+        dsn=embedding_cache_dsn,
+        max_rows=embedding_cache_max_rows,
+    )
+    return CachedEmbedder(embedder, cache)
+
+
+def _build_embedder(
+    *,
+    provider: str,
+    ollama_base_url: str | None,
+    ollama_model: str | None,
+    ollama_batch_size: int,
+    ollama_max_concurrency: int,
+    ollama_max_retries: int,
 ):
     if provider == "ollama":
         if not ollama_base_url or not ollama_model:
@@ -18,6 +52,8 @@ def get_embedder(
             base_url=ollama_base_url,
             model=ollama_model,
             batch_size=ollama_batch_size,
+            max_concurrency=ollama_max_concurrency,
+            max_retries=ollama_max_retries,
         )
 
     if provider == "mock":
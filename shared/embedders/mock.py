@@ -1,8 +1,10 @@
 from __future__ import annotations
+from array import array
 from typing import List
 
 from shared.chunks import Chunk
 from shared.embedders.base import BaseEmbedder
+from shared.models.vector import Embedding
 
 
 class MockEmbedder(BaseEmbedder):
@@ -14,17 +16,20 @@ class MockEmbedder(BaseEmbedder):
     name = "mock"
     dimension = 768
 
-    def embed(self, chunks: List[Chunk]) -> List[List[float]]:
-        embeddings: List[List[float]] = []
+    def embed(self, chunks: List[Chunk]) -> List[Embedding]:
+        embeddings: List[Embedding] = []
 
         for chunk in chunks:
             length = len(str(chunk.content))
             embeddings.append(
-                [
-                    float(length),
-                    float(length % 10),
-                    1.0,
-                ]
+                array(
+                    "f",
+                    [
+                        float(length),
+                        float(length % 10),
+                        1.0,
+                    ],
+                )
             )
 
         return embeddings
@@ -1,50 +1,134 @@
 # src/ingestion_service/core/embedders/ollama.py
 import requests
 import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import List
 
+from requests.adapters import HTTPAdapter
+
 from shared.embedders.base import BaseEmbedder
 from shared.chunks import Chunk
+from shared.models.vector import Embedding, to_embedding
 
 logging.basicConfig(level=logging.DEBUG)
 
+RETRYABLE_STATUS = {429, 500, 502, 503, 504}
+
 
 class OllamaEmbedder(BaseEmbedder):
+    """
+    Embeds chunks through Ollama's /api/embed.
+
+    Texts are split into `batch_size` micro-batches; up to `max_concurrency`
+    batches are in flight at once over a keep-alive session. Output order
+    matches input order. Each batch is retried independently on connection
+    errors and retryable HTTP statuses. Each response vector is packed into
+    a float32 array as soon as it is parsed.
+    """
+
     name = "ollama"
     dimension = 768
 
-    def __init__(self, base_url: str, model: str, batch_size: int = 50):
+    def __init__(
+        self,
+        base_url: str,
+        model: str,
+        batch_size: int = 50,
+        max_concurrency: int = 4,
+        max_retries: int = 3,
+        retry_backoff: float = 0.5,
+        timeout: float = 300.0,
+    ):
+        if batch_size < 1:
+            raise ValueError("batch_size must be >= 1")
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be >= 1")
+
         self.base_url = base_url.rstrip("/")
         self.model = model
         self.batch_size = batch_size
+        self.max_concurrency = max_concurrency
+        self.max_retries = max_retries
+        self.retry_backoff = retry_backoff
+        self.timeout = timeout
+
+        # One pooled connection per concurrent batch, reused across calls
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=max_concurrency)
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+
         logging.debug("OllamaEmbedder self.base_url %s", self.base_url)
         logging.debug("OllamaEmbedder self.model %s", self.model)
 
-    def embed(self, chunks: List[Chunk]) -> List[List[float]]:
+    def embed(self, chunks: List[Chunk]) -> List[Embedding]:
         logging.debug(
             "OllamaEmbedder received %d items, types: %s",
             len(chunks),
             [type(c).__name__ for c in chunks[:3]],
         )
         texts = [chunk.content for chunk in chunks]
+        if not texts:
+            return []
+
+        batches = [
+            texts[start:start + self.batch_size]
+            for start in range(0, len(texts), self.batch_size)
+        ]
         try:
-            payload = {"model": self.model, "input": texts}
-            logging.debug("OllamaEmbedder.embed payload %s", payload)
-            logging.debug("OllamaEmbedder starting embedding")
-            response = requests.post(f"{self.base_url}/api/embed", json=payload)
-            logging.debug("OllamaEmbedder finished embedding")
-            logging.debug("OllamaEmbedder response: %s", response)
-            if response.status_code != 200:
-                raise RuntimeError(
-                    f"Ollama embedding failed "
-                    f"(status={response.status_code}): {response.text}"
-                )
-            result = response.json()
-            logging.debug("OllamaEmbedder response.json: %s", result)
-            return (
-                result.get("embeddings", [result["embeddings"]])
-                if isinstance(texts, list)
-                else [result["embeddings"]]
-            )
+            if len(batches) == 1 or self.max_concurrency == 1:
+                results = [self._embed_batch(batch) for batch in batches]
+            else:
+                workers = min(self.max_concurrency, len(batches))
+                with ThreadPoolExecutor(
+                    max_workers=workers, thread_name_prefix="ollama-embed"
+                ) as pool:
+                    # map() yields in submission order, so output order matches input
+                    results = list(pool.map(self._embed_batch, batches))
         except Exception as e:
             raise RuntimeError(f"Ollama embedder error: {e}") from e
+
+        logging.debug("OllamaEmbedder finished embedding %d batches", len(batches))
+        return [vector for batch_vectors in results for vector in batch_vectors]
+
+    def close(self) -> None:
+        self._session.close()
+
+    # ------------------------------------------------------------------
+    # Internal
+    # ------------------------------------------------------------------
+    def _embed_batch(self, texts: List[str]) -> List[Embedding]:
+        payload = {"model": self.model, "input": texts}
+        attempt = 0
+        while True:
+            attempt += 1
+            try:
+                response = self._session.post(
+                    f"{self.base_url}/api/embed", json=payload, timeout=self.timeout
+                )
+            except (requests.ConnectionError, requests.Timeout) as exc:
+                if attempt > self.max_retries:
+                    raise
+                logging.warning(
+                    "OllamaEmbedder batch attempt %d failed: %s", attempt, exc
+                )
+            else:
+                if response.status_code == 200:
+                    embeddings = response.json().get("embeddings", [])
+                    if len(embeddings) != len(texts):
+                        raise RuntimeError(
+                            f"Expected {len(texts)} embeddings, got {len(embeddings)}"
+                        )
+                    return [to_embedding(vector) for vector in embeddings]
+                retryable = response.status_code in RETRYABLE_STATUS
+                if not retryable or attempt > self.max_retries:
+                    raise RuntimeError(
+                        f"Ollama embedding failed "
+                        f"(status={response.status_code}): {response.text}"
+                    )
+                logging.warning(
+                    "OllamaEmbedder batch attempt %d got status %d",
+                    attempt, response.status_code,
+                )
+            time.sleep(self.retry_backoff * (2 ** (attempt - 1)))
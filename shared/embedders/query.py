@@ -1,24 +1,26 @@
 from __future__ import annotations
 
 import uuid
-from typing import List
 
 from shared.chunks import Chunk
 
 # from shared.embedders.factory import get_embedder
 from shared.embedders.base import BaseEmbedder
+from shared.models.vector import Embedding
 
 
-def embed_query(query: str, embedder: BaseEmbedder) -> List[float]:
+def embed_query(query: str, embedder: BaseEmbedder) -> Embedding:
     """
     Embed a single query string using the provided embedder.
 
     This is a thin helper that:
     - Wraps the query in a temporary Chunk
     - Uses the given embedder
-    - Returns a single embedding vector
+    - Returns a single float32 embedding vector
 
-    No persistence, no chunking, no side effects.
+    No chunking, no side effects beyond the embedder's own cache
+    (a CachedEmbedder from get_embedder returns repeated queries without
+    calling the model).
     """
     query_chunk = Chunk(
         chunk_id=f"query:{uuid.uuid4()}",
@@ -1,4 +1,4 @@
 # shared/models/__init__.py
-from .vector import VectorRecord, VectorMetadata
+from .vector import VectorRecord, VectorMetadata, VectorSearchFilters
 
-__all__ = ["VectorRecord", "VectorMetadata"]
+__all__ = ["VectorRecord", "VectorMetadata", "VectorSearchFilters"]
@@ -1,11 +1,106 @@
 # shared/models/vector.py
 from __future__ import annotations
 
+import base64
+import struct
+import sys
+from array import array
 from dataclasses import dataclass, field
-from typing import Sequence, Dict, Optional
+from typing import Any, Sequence, Dict, List, Optional, Union
 
+# Embeddings are float32 arrays: 4 bytes per dimension in one contiguous
+# buffer, instead of a list of boxed Python floats (~32 bytes each).
+Embedding = array
 
-@dataclass
+_PGVECTOR_HEADER = struct.Struct(">HH")  # dim, unused
+
+
+def to_embedding(values: Any) -> Embedding:
+    """
+    float32 array('f') from an array, a NumPy array or any float sequence.
+
+    Contiguous float32 buffers (array('f'), float32 ndarrays) are copied as
+    raw bytes; other NumPy arrays are cast once; lists are converted last.
+    """
+    if isinstance(values, array) and values.typecode == "f":
+        return values
+    try:
+        view = memoryview(values)
+    except TypeError:
+        return array("f", values)
+    if view.format == "f" and view.c_contiguous:
+        embedding = array("f")
+        embedding.frombytes(view.cast("B"))
+        return embedding
+    astype = getattr(values, "astype", None)
+    if astype is not None:
+        return to_embedding(astype("float32"))
+    return array("f", view.tolist())
+
+
+def encode_embedding(vector: Any) -> str:
+    """Base64 of the little-endian float32 bytes (the JSON wire format)."""
+    embedding = to_embedding(vector)
+    if sys.byteorder == "big":
+        embedding = array("f", embedding)
+        embedding.byteswap()
+    return base64.b64encode(embedding).decode("ascii")
+
+
+def decode_embedding(data: str) -> Embedding:
+    embedding = array("f")
+    embedding.frombytes(base64.b64decode(data, validate=True))
+    if sys.byteorder == "big":
+        embedding.byteswap()
+    return embedding
+
+
+def _float32_bytes(values: Any) -> memoryview:
+    """Byte view of `values` as float32, without copying contiguous float32 buffers."""
+    try:
+        view = memoryview(values)
+    except TypeError:
+        view = None
+    if view is None or view.format != "f" or not view.c_contiguous:
+        view = memoryview(to_embedding(values))
+    return view.cast("B")
+
+
+def pgvector_binary(vector: Any) -> memoryview:
+    """
+    pgvector's binary send format: dim and unused as int16, then float32s, big-endian.
+
+    Built with a single copy of the vector's bytes: the 4-byte header takes
+    the first float32 slot of the output array, so on little-endian hosts one
+    in-place byteswap converts header and values together.
+    """
+    data = _float32_bytes(vector)
+    header = _PGVECTOR_HEADER.pack(len(data) // 4, 0)
+    out = array("f")
+    if sys.byteorder == "little":
+        out.frombytes(header[::-1])  # swapped back by the byteswap below
+        out.frombytes(data)
+        out.byteswap()
+    else:
+        out.frombytes(header)
+        out.frombytes(data)
+    return memoryview(out).cast("B")
+
+
+def from_pgvector_binary(data: Union[bytes, bytearray, memoryview]) -> Embedding:
+    """Embedding from pgvector's binary format: one copy, then an in-place byteswap."""
+    dim, _ = _PGVECTOR_HEADER.unpack_from(data)
+    end = _PGVECTOR_HEADER.size + 4 * dim
+    if len(data) != end:
+        raise ValueError(f"pgvector binary length {len(data)} does not match dim {dim}")
+    embedding = array("f")
+    embedding.frombytes(memoryview(data)[_PGVECTOR_HEADER.size:end])
+    if sys.byteorder == "little":
+        embedding.byteswap()
+    return embedding
+
+
+@dataclass(slots=True)
 class VectorMetadata:
     ingestion_id: str
     chunk_id: str
@@ -15,9 +110,37 @@ class VectorMetadata:
     source_metadata: Optional[Dict] = field(default_factory=dict)
     provider: str = "mock"  # New attribute for provider name
     document_id: Optional[str] = None  # MS6-IS3: NEW
+    token_count: Optional[int] = None  # tokens in chunk_text (chunking tokenizer)
 
 
-@dataclass
+@dataclass(slots=True)
 class VectorRecord:
-    vector: Sequence[float]
+    vector: Sequence[float]  # an Embedding (float32 array) on the ingest path
     metadata: VectorMetadata
+
+
+@dataclass
+class VectorSearchFilters:
+    """
+    Metadata predicates applied inside the vector search query (SQL WHERE),
+    so only the matching slice of vector_chunks is ranked.
+
+    All set fields are AND-ed; source_metadata uses JSONB containment (@>).
+    An empty document_ids list matches nothing (scope to zero documents).
+    """
+
+    ingestion_id: Optional[str] = None
+    document_ids: Optional[List[str]] = None
+    provider: Optional[str] = None
+    chunk_strategy: Optional[str] = None
+    source_metadata: Optional[Dict[str, Any]] = None
+
+    def is_empty(self) -> bool:
+        return self.document_ids is None and not any(
+            (
+                self.ingestion_id,
+                self.provider,
+                self.chunk_strategy,
+                self.source_metadata,
+            )
+        )
@@ -1,5 +1,6 @@
 from fastapi import FastAPI
 from src.api.v1 import ingestions, vectors
+from src.core.config import get_async_vector_store, get_vector_store
 
 app = FastAPI(title="Vector Store Service")
 
@@ -7,6 +8,12 @@ app.include_router(ingestions.router)
 app.include_router(vectors.router)
 
 
+@app.on_event("shutdown")
+async def close_vector_store_pool():
+    await get_async_vector_store().close()
+    get_vector_store().close()
+
+
 # ✅ Health check endpoint for Docker
 @app.get("/health")
 def health_check():
@@ -1,12 +1,20 @@
 # vector_store_service/src/api/v1/vectors.py
-from fastapi import APIRouter, Depends, HTTPException
-from pydantic import BaseModel
+from fastapi import APIRouter, Depends, HTTPException, Query
+from pydantic import BaseModel, PrivateAttr, model_validator
 from typing import List, Dict, Any, Optional
 import logging
+import time
 
-from src.core.vectorstore.pgvector_store import PgVectorStore
-from src.core.config import get_vector_store
-from shared.models.vector import VectorRecord, VectorMetadata
+from src.core.vectorstore.async_pgvector_store import AsyncPgVectorStore
+from src.core.config import get_async_vector_store
+from shared.models.vector import (
+    Embedding,
+    VectorRecord,
+    VectorMetadata,
+    VectorSearchFilters,
+    decode_embedding,
+    to_embedding,
+)
 
 router = APIRouter(prefix="/v1/vectors", tags=["vectors"])
 logger = logging.getLogger(__name__)
@@ -20,43 +28,114 @@ class VectorMetadataAPI(BaseModel):
     source_metadata: Optional[Dict[str, Any]] = {}
     provider: str = "mock"
     document_id: Optional[str] = None  # MS6-IS3: NEW
+    token_count: Optional[int] = None
+
+def _embedding(vector: Optional[List[float]], vector_b64: Optional[str]) -> Embedding:
+    """float32 vector from either wire form; base64 skips per-float parsing."""
+    if vector_b64 is not None:
+        return decode_embedding(vector_b64)
+    if vector is not None:
+        return to_embedding(vector)
+    raise ValueError("one of vector or vector_b64 is required")
 
 class VectorRecordAPI(BaseModel):
-    vector: List[float]
+    vector: Optional[List[float]] = None  # JSON floats
+    vector_b64: Optional[str] = None  # base64 of little-endian float32 bytes
     metadata: VectorMetadataAPI
+    _embedding: Embedding = PrivateAttr()
+
+    @model_validator(mode="after")
+    def _decode_vector(self) -> "VectorRecordAPI":
+        self._embedding = _embedding(self.vector, self.vector_b64)
+        return self
+
+    @property
+    def embedding(self) -> Embedding:
+        return self._embedding
 
 class VectorBatchRequest(BaseModel):
     records: List[VectorRecordAPI]
 
+class KeptChunkAPI(BaseModel):
+    chunk_id: str
+    chunk_index: int
+    char_start: Optional[int] = None  # new offsets in the updated document
+    char_end: Optional[int] = None
+
+class DocumentSyncRequest(BaseModel):
+    ingestion_id: str
+    keep: List[KeptChunkAPI] = []
+    records: List[VectorRecordAPI] = []
+
+class VectorSearchFiltersAPI(BaseModel):
+    ingestion_id: Optional[str] = None
+    document_ids: Optional[List[str]] = None
+    provider: Optional[str] = None
+    chunk_strategy: Optional[str] = None
+    source_metadata: Optional[Dict[str, Any]] = None  # JSONB containment (@>)
+
 class VectorSearchRequest(BaseModel):
-    query_vector: List[float]
+    query_vector: Optional[List[float]] = None  # JSON floats
+    query_vector_b64: Optional[str] = None  # base64 of little-endian float32 bytes
     k: int = 5
+    filters: Optional[VectorSearchFiltersAPI] = None
+    ef_search: Optional[int] = None  # HNSW candidate list size (recall vs. latency)
+    probes: Optional[int] = None  # IVFFlat lists probed per query
+    exact: Optional[bool] = None  # True → bypass ANN index, full exact scan
+    _embedding: Embedding = PrivateAttr()
+
+    @model_validator(mode="after")
+    def _decode_vector(self) -> "VectorSearchRequest":
+        self._embedding = _embedding(self.query_vector, self.query_vector_b64)
+        return self
+
+    @property
+    def embedding(self) -> Embedding:
+        return self._embedding
+
+def _to_domain_records(api_records: List[VectorRecordAPI]) -> List[VectorRecord]:
+    domain_records = []
+    for api_record in api_records:
+        metadata = VectorMetadata(
+            ingestion_id=api_record.metadata.ingestion_id,
+            chunk_id=api_record.metadata.chunk_id,
+            chunk_index=api_record.metadata.chunk_index,
+            chunk_strategy=api_record.metadata.chunk_strategy,
+            chunk_text=api_record.metadata.chunk_text,
+            source_metadata=api_record.metadata.source_metadata,
+            provider=api_record.metadata.provider,
+            document_id=api_record.metadata.document_id,  # MS6-IS3: Pass through
+            token_count=api_record.metadata.token_count,
+        )
+        domain_records.append(
+            VectorRecord(vector=api_record.embedding, metadata=metadata)
+        )
+    return domain_records
+
 
 @router.post("/batch")
 async def add_vectors(
-    batch: VectorBatchRequest, store: PgVectorStore = Depends(get_vector_store)
+    batch: VectorBatchRequest,
+    store: AsyncPgVectorStore = Depends(get_async_vector_store),
 ):
     """Add a batch of vectors to the store."""
     try:
-        domain_records = []
-        for api_record in batch.records:
-            metadata = VectorMetadata(
-                ingestion_id=api_record.metadata.ingestion_id,
-                chunk_id=api_record.metadata.chunk_id,
-                chunk_index=api_record.metadata.chunk_index,
-                chunk_strategy=api_record.metadata.chunk_strategy,
-                chunk_text=api_record.metadata.chunk_text,
-                source_metadata=api_record.metadata.source_metadata,
-                provider=api_record.metadata.provider,
-                document_id=api_record.metadata.document_id,  # MS6-IS3: Pass through
-            )
-            domain_records.append(
-                VectorRecord(vector=api_record.vector, metadata=metadata)
-            )
-
-        store.add(domain_records)
-        logger.info(f"Added {len(domain_records)} vectors to store")
-        return {"status": "ok", "count": len(domain_records)}
+        domain_records = _to_domain_records(batch.records)
+
+        started = time.perf_counter()
+        await store.add(domain_records)
+        elapsed = time.perf_counter() - started
+        rows_per_sec = len(domain_records) / elapsed if elapsed > 0 else 0.0
+        logger.info(
+            f"Added {len(domain_records)} vectors to store "
+            f"in {elapsed:.3f}s ({rows_per_sec:.0f} rows/sec)"
+        )
+        return {
+            "status": "ok",
+            "count": len(domain_records),
+            "elapsed_ms": round(elapsed * 1000, 2),
+            "rows_per_sec": round(rows_per_sec, 1),
+        }
     except Exception as e:
         logger.error(f"Error adding vectors: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -66,12 +145,24 @@ async def add_vectors(
 
 @router.post("/search")
 async def similarity_search(
-    request: VectorSearchRequest, store: PgVectorStore = Depends(get_vector_store)
+    request: VectorSearchRequest,
+    store: AsyncPgVectorStore = Depends(get_async_vector_store),
 ):
     """Search for similar vectors - MS6 RAG compatible."""
     try:
         logger.debug("similarity_search Search for similar vectors - MS6 RAG compatible")
-        results = store.similarity_search(request.query_vector, request.k)
+        results = await store.similarity_search(
+            request.embedding,
+            request.k,
+            ef_search=request.ef_search,
+            probes=request.probes,
+            exact=request.exact,
+            filters=(
+                VectorSearchFilters(**request.filters.model_dump())
+                if request.filters
+                else None
+            ),
+        )
 
         # MS6 RAG FIX: Match exact fields expected by rag-orchestrator
         return {
@@ -80,6 +171,7 @@ async def similarity_search(
                     "chunk_id": r.metadata.chunk_id,
                     "text": r.metadata.chunk_text,           #  TOP-LEVEL text
                     "document_id": r.metadata.document_id,   #  TOP-LEVEL document_id
+                    "token_count": r.metadata.token_count,   #  for context budgets
                     "score": 0.1,                            #  Add dummy score
                     "metadata": {
                         "ingestion_id": r.metadata.ingestion_id,
@@ -97,15 +189,107 @@ async def similarity_search(
         raise HTTPException(status_code=500, detail=str(e))
 
 
+async def _list_chunks(
+    store: AsyncPgVectorStore, key: str, value: str, cursor: Optional[str], limit: int
+) -> Dict[str, Any]:
+    try:
+        chunks, next_cursor = await store.list_chunks(
+            key=key, value=value, cursor=cursor, limit=limit
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.error(f"Error listing chunks for {key}={value}: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+    return {
+        "chunks": [
+            {
+                "chunk_id": m.chunk_id,
+                "text": m.chunk_text,
+                "document_id": m.document_id,
+                "token_count": m.token_count,
+                "metadata": {
+                    "ingestion_id": m.ingestion_id,
+                    "chunk_index": m.chunk_index,
+                    "chunk_strategy": m.chunk_strategy,
+                    "source_metadata": m.source_metadata,
+                    "provider": m.provider,
+                },
+            }
+            for m in chunks
+        ],
+        "next_cursor": next_cursor,
+    }
+
+
+@router.get("/by-ingestion/{ingestion_id}")
+async def list_by_ingestion(
+    ingestion_id: str,
+    cursor: Optional[str] = None,
+    limit: int = Query(default=500, ge=1, le=1000),
+    store: AsyncPgVectorStore = Depends(get_async_vector_store),
+):
+    """List an ingestion's chunks in chunk_index order (cursor paginated)."""
+    return await _list_chunks(store, "ingestion_id", ingestion_id, cursor, limit)
+
+
+@router.get("/by-document/{document_id}")
+async def list_by_document(
+    document_id: str,
+    cursor: Optional[str] = None,
+    limit: int = Query(default=500, ge=1, le=1000),
+    store: AsyncPgVectorStore = Depends(get_async_vector_store),
+):
+    """List a document's chunks in chunk_index order (cursor paginated)."""
+    return await _list_chunks(store, "document_id", document_id, cursor, limit)
+
+
+@router.post("/by-document/{document_id}/sync")
+async def sync_document(
+    document_id: str,
+    request: DocumentSyncRequest,
+    store: AsyncPgVectorStore = Depends(get_async_vector_store),
+):
+    """
+    Incrementally update a document: keep unchanged chunks, delete stale
+    ones and insert the (already embedded) new / changed ones.
+    """
+    if any(r.metadata.document_id != document_id for r in request.records):
+        raise HTTPException(
+            status_code=400, detail="records must belong to the document"
+        )
+    try:
+        result = await store.sync_document(
+            document_id=document_id,
+            ingestion_id=request.ingestion_id,
+            keep=[
+                (k.chunk_id, k.chunk_index, k.char_start, k.char_end)
+                for k in request.keep
+            ],
+            records=_to_domain_records(request.records),
+        )
+    except Exception as e:
+        logger.error(f"Error syncing document {document_id}: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+    return {"status": "ok", **result}
+
+
 @router.delete("/by-ingestion/{ingestion_id}")
 async def delete_by_ingestion(
-    ingestion_id: str, store: PgVectorStore = Depends(get_vector_store)
+    ingestion_id: str, store: AsyncPgVectorStore = Depends(get_async_vector_store)
 ):
     """Delete all vectors for a given ingestion_id."""
     try:
-        store.delete_by_ingestion_id(ingestion_id)
+        await store.delete_by_ingestion_id(ingestion_id)
         logger.info(f"Deleted vectors for ingestion_id: {ingestion_id}")
         return {"status": "deleted", "ingestion_id": ingestion_id}
     except Exception as e:
         logger.error(f"Error deleting vectors: {e}")
         raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/pool-stats")
+def pool_stats(store: AsyncPgVectorStore = Depends(get_async_vector_store)):
+    """Connection pool size and wait metrics."""
+    return store.pool_stats()
@@ -1,10 +1,12 @@
 # vector_store_service/src/core/config.py
 from functools import lru_cache
+from typing import Any, Dict, Optional
 import os
 
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 from src.core.vectorstore.pgvector_store import PgVectorStore
+from src.core.vectorstore.async_pgvector_store import AsyncPgVectorStore
 
 
 class Settings(BaseSettings):
@@ -14,6 +16,27 @@ class Settings(BaseSettings):
     OLLAMA_EMBED_MODEL: str = "nomic-embed-text:v1.5"
     OLLAMA_BATCH_SIZE: int = 50
 
+    # ANN index search defaults (per-request values on /search override these)
+    VECTOR_SEARCH_EF_SEARCH: Optional[int] = None
+    VECTOR_SEARCH_PROBES: Optional[int] = None
+    VECTOR_SEARCH_EXACT: bool = False
+    # hnsw.iterative_scan for filtered searches ("strict_order" | "relaxed_order"
+    # | "off"); applied when the server's pgvector is >= 0.8, otherwise (or when
+    # "off") filtered searches oversample ef_search instead. relaxed_order
+    # results are re-sorted by distance in SQL, since callers rank by order.
+    VECTOR_SEARCH_ITERATIVE_SCAN: Optional[str] = "strict_order"
+
+    # Bulk write engine for /v1/vectors/batch: "copy" | "executemany"
+    VECTOR_WRITE_METHOD: str = "copy"
+    # "dual" (legacy vectors + vector_chunks) | "chunks_only"
+    VECTOR_WRITE_MODE: str = "dual"
+
+    # psycopg_pool sizing for PgVectorStore
+    VECTOR_DB_POOL_MIN_SIZE: int = 1
+    VECTOR_DB_POOL_MAX_SIZE: int = 10
+    VECTOR_DB_POOL_TIMEOUT: float = 30.0  # max seconds to wait for a connection
+    VECTOR_DB_POOL_MAX_IDLE: float = 600.0
+
     model_config = SettingsConfigDict(
         env_file=".env",
         env_file_encoding="utf-8",
@@ -26,17 +49,34 @@ def get_settings() -> Settings:
     return Settings()
 
 
+def _vector_store_kwargs() -> Dict[str, Any]:
+    """Constructor arguments shared by the sync and async stores."""
+    settings = get_settings()
+
+    return {
+        "dsn": settings.DATABASE_URL,
+        "dimension": int(os.getenv("VECTOR_DIMENSION", "768")),
+        "provider": settings.EMBEDDING_PROVIDER,
+        "ef_search": settings.VECTOR_SEARCH_EF_SEARCH,
+        "probes": settings.VECTOR_SEARCH_PROBES,
+        "exact_search": settings.VECTOR_SEARCH_EXACT,
+        "iterative_scan": settings.VECTOR_SEARCH_ITERATIVE_SCAN,
+        "write_method": settings.VECTOR_WRITE_METHOD,
+        "write_mode": settings.VECTOR_WRITE_MODE,
+        "pool_min_size": settings.VECTOR_DB_POOL_MIN_SIZE,
+        "pool_max_size": settings.VECTOR_DB_POOL_MAX_SIZE,
+        "pool_timeout": settings.VECTOR_DB_POOL_TIMEOUT,
+        "pool_max_idle": settings.VECTOR_DB_POOL_MAX_IDLE,
+    }
+
+
 @lru_cache()
 def get_vector_store() -> PgVectorStore:
-    """Dependency that provides the vector store instance."""
-    settings = get_settings()
+    """Dependency that provides the vector store instance (owns the DB pool)."""
+    return PgVectorStore(**_vector_store_kwargs())
 
-    dsn = settings.DATABASE_URL
-    dimension = int(os.getenv("VECTOR_DIMENSION", "768"))
-    provider = settings.EMBEDDING_PROVIDER
 
-    return PgVectorStore(
-        dsn=dsn,
-        dimension=dimension,
-        provider=provider,
-    )
+@lru_cache()
+def get_async_vector_store() -> AsyncPgVectorStore:
+    """Dependency that provides the non-blocking store used by async routes."""
+    return AsyncPgVectorStore(**_vector_store_kwargs())
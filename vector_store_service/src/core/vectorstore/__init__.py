@@ -7,13 +7,17 @@ from shared.models.vector import (
 
 from src.core.vectorstore.base import (
     VectorStore,
+    AsyncVectorStore,
 )
 
 from src.core.vectorstore.pgvector_store import PgVectorStore
+from src.core.vectorstore.async_pgvector_store import AsyncPgVectorStore
 
 __all__ = [
     "VectorStore",
+    "AsyncVectorStore",
     "VectorRecord",
     "VectorMetadata",
     "PgVectorStore",
+    "AsyncPgVectorStore",
 ]
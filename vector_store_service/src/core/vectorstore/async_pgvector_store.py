@@ -0,0 +1,201 @@
+# vector_store_service/src/core/vectorstore/async_pgvector_store.py
+from __future__ import annotations
+from typing import Any, Dict, Sequence, Iterable, List, Optional, Tuple
+import asyncio
+import logging
+
+import psycopg
+from psycopg_pool import AsyncConnectionPool
+from pgvector.psycopg import register_vector_async
+
+from src.core.vectorstore.base import AsyncVectorStore
+from src.core.vectorstore.embedding_adapters import register_embedding_adapters
+from src.core.vectorstore.pgvector_store import KeptChunk, PgVectorSQL
+from shared.models.vector import VectorRecord, VectorMetadata, VectorSearchFilters
+
+
+class AsyncPgVectorStore(PgVectorSQL, AsyncVectorStore):
+    """
+    psycopg async implementation of the vector store.
+
+    Shares SQL, row mapping and configuration with PgVectorStore; only the
+    connection handling differs (AsyncConnectionPool, awaited I/O).
+    """
+
+    def __init__(
+        self, dsn: str, dimension: int, provider: str = "mock", **options: Any
+    ) -> None:
+        super().__init__(dsn, dimension, provider, **options)
+        self._pool: Optional[AsyncConnectionPool] = None
+        self._pool_lock = asyncio.Lock()
+
+    # ------------------------------------------------------------------
+    # Connection pool
+    # ------------------------------------------------------------------
+    async def _get_pool(self) -> AsyncConnectionPool:
+        """Return the shared pool, opening it inside the running event loop."""
+        if self._pool is None:
+            async with self._pool_lock:
+                if self._pool is None:
+                    pool = AsyncConnectionPool(
+                        self._dsn,
+                        name="pgvector-store-async",
+                        configure=self._configure_connection,
+                        check=AsyncConnectionPool.check_connection,
+                        open=False,
+                        **self._pool_kwargs,
+                    )
+                    await pool.open()
+                    self._pool = pool
+                    logging.info(
+                        "AsyncPgVectorStore: opened connection pool (min=%s, max=%s)",
+                        self._pool_kwargs["min_size"],
+                        self._pool_kwargs["max_size"],
+                    )
+        return self._pool
+
+    async def _configure_connection(self, conn: psycopg.AsyncConnection) -> None:
+        """Run once per new pooled connection: load vector adapters, detect the
+        pgvector version."""
+        await register_vector_async(conn)
+        register_embedding_adapters(conn)
+        cursor = await conn.execute(self.PGVECTOR_VERSION_SQL)
+        row = await cursor.fetchone()
+        self._record_pgvector_version(row[0] if row else None)
+        await conn.commit()  # pool requires the connection back in idle state
+
+    def pool_stats(self) -> Dict[str, Any]:
+        """Pool size and wait metrics (requests_waiting, requests_wait_ms, ...)."""
+        if self._pool is None:
+            return {"pool_open": False}
+        return {"pool_open": True, **self._pool.get_stats()}
+
+    async def close(self) -> None:
+        """Close the connection pool (application shutdown)."""
+        if self._pool is not None:
+            await self._pool.close()
+            self._pool = None
+
+    # ------------------------------------------------------------------
+    # VectorStore operations
+    # ------------------------------------------------------------------
+    async def add(self, records: Iterable[VectorRecord]) -> None:
+        """MS6 write (see PgVectorStore.add), one transaction per batch."""
+        records = list(records)
+        if not records:
+            return
+
+        vector_rows, chunk_rows = self._build_rows(records)
+
+        pool = await self._get_pool()
+        async with pool.connection() as conn:
+            async with conn.transaction():
+                await self._write_rows(conn, vector_rows, chunk_rows)
+        logging.info(
+            f"MS6 {self._write_mode} write async ({self._write_method}): "
+            f"{len(vector_rows)} vectors + {len(chunk_rows)} chunks complete"
+        )
+
+    async def _write_rows(
+        self,
+        conn: psycopg.AsyncConnection,
+        vector_rows: List[tuple],
+        chunk_rows: List[tuple],
+    ) -> None:
+        for table, columns, rows in (
+            ("vectors", self.VECTOR_COLUMNS, vector_rows),
+            ("vector_chunks", self.CHUNK_COLUMNS, chunk_rows),
+        ):
+            if not rows:
+                continue
+            async with conn.cursor() as cur:
+                if self._write_method == "copy":
+                    async with cur.copy(self._copy_sql(table, columns)) as copy:
+                        copy.set_types([pg_type for _, pg_type in columns])
+                        for row in rows:
+                            await copy.write_row(row)
+                else:
+                    await cur.executemany(self._insert_sql(table, columns), rows)
+
+    async def sync_document(
+        self,
+        *,
+        document_id: str,
+        ingestion_id: str,
+        keep: Sequence[KeptChunk],
+        records: Iterable[VectorRecord],
+    ) -> Dict[str, int]:
+        """Incremental document update (see PgVectorStore.sync_document)."""
+        records = list(records)
+        vector_rows, chunk_rows = self._build_rows(records)
+        statements = self._sync_document_statements(document_id, ingestion_id, keep)
+
+        pool = await self._get_pool()
+        async with pool.connection() as conn:
+            async with conn.transaction():
+                rowcounts = []
+                async with conn.cursor() as cur:
+                    for statement, params in statements:
+                        await cur.execute(statement, params)
+                        rowcounts.append(cur.rowcount)
+                await self._write_rows(conn, vector_rows, chunk_rows)
+
+        deleted, kept = rowcounts[-2], rowcounts[-1]
+        logging.info(
+            f"Document {document_id} sync async: kept={kept} deleted={deleted} "
+            f"added={len(chunk_rows)}"
+        )
+        return {"kept": kept, "deleted": deleted, "added": len(chunk_rows)}
+
+    async def similarity_search(
+        self,
+        query_vector: Sequence[float],
+        k: int,
+        *,
+        ef_search: Optional[int] = None,
+        probes: Optional[int] = None,
+        exact: Optional[bool] = None,
+        filters: Optional[VectorSearchFilters] = None,
+    ) -> List[VectorRecord]:
+        """MS6: Search vector_chunks (see PgVectorStore.similarity_search)."""
+        filtered = filters is not None and not filters.is_empty()
+        query, params = self._search_query(
+            query_vector, k, filters, reorder=self._reorders_results(filtered)
+        )
+        settings = self._search_settings(
+            k=k,
+            ef_search=ef_search,
+            probes=probes,
+            exact=exact,
+            filtered=filtered,
+        )
+        pool = await self._get_pool()
+        async with pool.connection() as conn:
+            async with conn.cursor() as cur:
+                for statement, setting_params in settings:
+                    await cur.execute(statement, setting_params)
+                await cur.execute(query, params)
+                return [self._record_from_row(row) for row in await cur.fetchall()]
+
+    async def delete_by_ingestion_id(self, ingestion_id: str) -> None:
+        pool = await self._get_pool()
+        async with pool.connection() as conn:
+            async with conn.cursor() as cur:
+                for table in ["vectors", "vector_chunks"]:
+                    await cur.execute(self._delete_sql(table), (ingestion_id,))
+
+    async def list_chunks(
+        self,
+        *,
+        key: str,
+        value: str,
+        cursor: Optional[str] = None,
+        limit: int = 500,
+    ) -> Tuple[List[VectorMetadata], Optional[str]]:
+        """One page of chunks (see PgVectorStore.list_chunks)."""
+        query, params = self._list_chunks_query(key, value, cursor, limit)
+        pool = await self._get_pool()
+        async with pool.connection() as conn:
+            async with conn.cursor() as cur:
+                await cur.execute(query, params)
+                return self._chunk_page(await cur.fetchall(), limit)
@@ -0,0 +1,133 @@
+# vector_store_service/src/core/vectorstore/backfill.py
+"""
+One-shot backfill: copy legacy `vectors` rows into `vector_chunks`.
+
+Run this before switching VECTOR_WRITE_MODE to "chunks_only" so nothing
+that only exists in the legacy table is lost:
+
+    python -m src.core.vectorstore.backfill --dsn "$DATABASE_URL" [--delete-legacy]
+
+- Works in id-range batches, one transaction per batch (restartable).
+- Idempotent: rows already present in vector_chunks (same ingestion_id +
+  chunk_id) are skipped.
+- document_id is recovered from document_nodes via ingestion_id.
+- --delete-legacy removes each copied batch from `vectors`.
+"""
+from __future__ import annotations
+
+import argparse
+import logging
+import os
+from dataclasses import dataclass
+
+import psycopg
+from psycopg import sql
+
+from src.core.vectorstore.pgvector_store import PgVectorSQL
+
+logger = logging.getLogger(__name__)
+
+SCHEMA = PgVectorSQL.SCHEMA
+
+
+@dataclass
+class BackfillResult:
+    scanned_batches: int = 0
+    copied_rows: int = 0
+    deleted_rows: int = 0
+
+
+COPY_BATCH_SQL = sql.SQL("""
+    INSERT INTO {schema}.vector_chunks
+        (vector, ingestion_id, chunk_id, chunk_index, chunk_strategy,
+         chunk_text, source_metadata, provider, document_id)
+    SELECT v.vector, v.ingestion_id, v.chunk_id, v.chunk_index, v.chunk_strategy,
+           v.chunk_text, v.source_metadata, v.provider,
+           (SELECT d.document_id FROM {schema}.document_nodes d
+             WHERE d.ingestion_id = v.ingestion_id
+             LIMIT 1)
+    FROM {schema}.vectors v
+    WHERE v.id > %s AND v.id <= %s
+      AND NOT EXISTS (
+          SELECT 1 FROM {schema}.vector_chunks c
+          WHERE c.ingestion_id = v.ingestion_id AND c.chunk_id = v.chunk_id
+      )
+""").format(schema=sql.Identifier(SCHEMA))
+
+DELETE_BATCH_SQL = sql.SQL("""
+    DELETE FROM {schema}.vectors v
+    WHERE v.id > %s AND v.id <= %s
+      AND EXISTS (
+          SELECT 1 FROM {schema}.vector_chunks c
+          WHERE c.ingestion_id = v.ingestion_id AND c.chunk_id = v.chunk_id
+      )
+""").format(schema=sql.Identifier(SCHEMA))
+
+MAX_ID_SQL = sql.SQL("SELECT COALESCE(MAX(id), 0) FROM {schema}.vectors").format(
+    schema=sql.Identifier(SCHEMA)
+)
+
+
+def backfill_vector_chunks(
+    conn: psycopg.Connection,
+    *,
+    batch_size: int = 5000,
+    delete_legacy: bool = False,
+) -> BackfillResult:
+    """Copy legacy vectors rows into vector_chunks in id-range batches."""
+    result = BackfillResult()
+
+    with conn.cursor() as cur:
+        cur.execute(MAX_ID_SQL)
+        row = cur.fetchone()
+        max_id = row[0] if row else 0
+    conn.commit()
+
+    low = 0
+    while low < max_id:
+        high = low + batch_size
+        with conn.transaction():
+            with conn.cursor() as cur:
+                cur.execute(COPY_BATCH_SQL, (low, high))
+                result.copied_rows += max(cur.rowcount, 0)
+                if delete_legacy:
+                    cur.execute(DELETE_BATCH_SQL, (low, high))
+                    result.deleted_rows += max(cur.rowcount, 0)
+        result.scanned_batches += 1
+        logger.info(
+            "Backfill ids (%d, %d]: copied=%d deleted=%d",
+            low, high, result.copied_rows, result.deleted_rows,
+        )
+        low = high
+
+    return result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Copy legacy vectors rows into vector_chunks"
+    )
+    parser.add_argument("--dsn", default=os.getenv("DATABASE_URL"))
+    parser.add_argument("--batch-size", type=int, default=5000)
+    parser.add_argument(
+        "--delete-legacy",
+        action="store_true",
+        help="Delete copied rows from the legacy vectors table",
+    )
+    args = parser.parse_args()
+    if not args.dsn:
+        parser.error("--dsn or DATABASE_URL is required")
+
+    logging.basicConfig(level=logging.INFO)
+    with psycopg.connect(args.dsn) as conn:
+        result = backfill_vector_chunks(
+            conn, batch_size=args.batch_size, delete_legacy=args.delete_legacy
+        )
+    logger.info(
+        "Backfill complete: %d batches, %d rows copied, %d legacy rows deleted",
+        result.scanned_batches, result.copied_rows, result.deleted_rows,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -32,3 +32,37 @@ class VectorStore(ABC):
     def delete_by_ingestion_id(self, ingestion_id: str) -> None:
         """Delete all vectors associated with a given ingestion_id."""
         ...
+
+
+class AsyncVectorStore(ABC):
+    """
+    Non-blocking counterpart of VectorStore for use from async API handlers.
+
+    Same contract as VectorStore; every operation is a coroutine so a slow
+    database round trip never blocks the event loop.
+    """
+
+    @property
+    @abstractmethod
+    def dimension(self) -> int:
+        """Return the dimension of the vectors."""
+        ...
+
+    @abstractmethod
+    async def add(self, records: Iterable[VectorRecord]) -> None:
+        """Add a list of VectorRecords to the store."""
+        ...
+
+    @abstractmethod
+    async def similarity_search(
+        self,
+        query_vector: Sequence[float],
+        k: int,
+    ) -> List[VectorRecord]:
+        """Return the top k most similar vectors."""
+        ...
+
+    @abstractmethod
+    async def delete_by_ingestion_id(self, ingestion_id: str) -> None:
+        """Delete all vectors associated with a given ingestion_id."""
+        ...
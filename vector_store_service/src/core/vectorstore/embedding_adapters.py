@@ -0,0 +1,67 @@
+# vector_store_service/src/core/vectorstore/embedding_adapters.py
+"""
+psycopg adapters mapping pgvector's `vector` type straight to Embeddings
+(float32 array('f')), registered on top of pgvector's own adapters.
+
+Writes dump an Embedding in pgvector's binary format with one copy of its
+bytes (shared.models.vector.pgvector_binary); reads load the binary column
+into an Embedding with one copy. No pgvector Vector / NumPy array is built
+in between.
+"""
+from __future__ import annotations
+
+from array import array
+from typing import Any
+
+import psycopg
+from psycopg.abc import AdaptContext, Buffer
+from psycopg.adapt import Dumper, Loader
+from psycopg.pq import Format
+from pgvector import Vector
+
+from shared.models.vector import Embedding, from_pgvector_binary, pgvector_binary
+
+
+class EmbeddingBinaryDumper(Dumper):
+    """Embedding (or Vector / ndarray / list, for COPY by oid) → pgvector binary."""
+
+    format = Format.BINARY
+
+    def dump(self, obj: Any) -> Buffer:
+        if isinstance(obj, Vector):
+            return obj.to_binary()
+        return pgvector_binary(obj)
+
+
+class EmbeddingBinaryLoader(Loader):
+    format = Format.BINARY
+
+    def load(self, data: Buffer) -> Embedding:
+        return from_pgvector_binary(data)
+
+
+class EmbeddingTextLoader(Loader):
+    """'[1,2,3]' → Embedding (results fetched in text format)."""
+
+    format = Format.TEXT
+
+    def load(self, data: Buffer) -> Embedding:
+        text = bytes(data).decode("ascii")
+        return array("f", map(float, text[1:-1].split(",")))
+
+
+def register_embedding_adapters(context: AdaptContext) -> None:
+    """
+    Dump Embeddings and load `vector` columns as Embeddings on `context`.
+
+    Must run after pgvector's register_vector(), which registers the
+    `vector` TypeInfo whose oid these adapters are bound to. Registered
+    last, they also take over COPY ... set_types(["vector"]).
+    """
+    info = context.adapters.types.get("vector")
+    if info is None:
+        raise psycopg.ProgrammingError("vector type not found in the database")
+    dumper = type("EmbeddingBinaryDumper", (EmbeddingBinaryDumper,), {"oid": info.oid})
+    context.adapters.register_dumper(array, dumper)
+    context.adapters.register_loader(info.oid, EmbeddingTextLoader)
+    context.adapters.register_loader(info.oid, EmbeddingBinaryLoader)
@@ -1,23 +1,112 @@
 # src/core/vectorstore/pgvector_store.py - HOTFIX (no TABLE_NAME confusion)
 from __future__ import annotations
-from typing import Sequence, Iterable, List
+from typing import Any, Dict, Sequence, Iterable, List, LiteralString, Optional, Tuple
+from uuid import UUID
+import re
+import threading
 import psycopg
 from psycopg import sql
+from psycopg_pool import ConnectionPool
 from psycopg.types.json import Jsonb
+from pgvector.psycopg import register_vector
 import logging
 
 from src.core.vectorstore.base import VectorStore
-from shared.models.vector import VectorRecord, VectorMetadata
+from src.core.vectorstore.embedding_adapters import register_embedding_adapters
+from shared.models.vector import (
+    VectorRecord,
+    VectorMetadata,
+    VectorSearchFilters,
+    to_embedding,
+)
 
 logging.basicConfig(level=logging.DEBUG)
 
-class PgVectorStore(VectorStore):
+# sync_document: (chunk_id, new chunk_index, new char_start, new char_end)
+KeptChunk = Tuple[str, int, Optional[int], Optional[int]]
+
+
+class PgVectorSQL:
+    """
+    SQL + row mapping shared by PgVectorStore and AsyncPgVectorStore.
+
+    Holds configuration only; never opens connections itself.
+    """
+
     SCHEMA = "ingestion_service"
-    
-    def __init__(self, dsn: str, dimension: int, provider: str = "mock") -> None:
+    HNSW_MAX_EF_SEARCH = 1000  # pgvector upper bound for hnsw.ef_search
+    ITERATIVE_SCAN_MIN_VERSION = (0, 8)  # first pgvector with hnsw.iterative_scan
+    # Filtered searches without iterative scans: ef_search = k * factor, since
+    # candidates failing the filter are dropped after the index scan
+    FILTERED_EF_SEARCH_FACTOR = 4
+    PGVECTOR_VERSION_SQL = (
+        "SELECT extversion FROM pg_extension WHERE extname = 'vector'"
+    )
+    WRITE_METHODS = ("copy", "executemany")
+    # dual: legacy vectors + vector_chunks; chunks_only: vector_chunks alone
+    WRITE_MODES = ("dual", "chunks_only")
+
+    # (column, postgres type) in write order; types drive binary COPY
+    VECTOR_COLUMNS = (
+        ("vector", "vector"),
+        ("ingestion_id", "uuid"),
+        ("chunk_id", "text"),
+        ("chunk_index", "int4"),
+        ("chunk_strategy", "text"),
+        ("chunk_text", "text"),
+        ("source_metadata", "jsonb"),
+        ("provider", "text"),
+    )
+    CHUNK_COLUMNS = VECTOR_COLUMNS + (("document_id", "uuid"), ("token_count", "int4"))
+    # sync_document's kept chunks, one array parameter per KeptChunk field
+    KEPT_CHUNKS_SQL = sql.SQL(
+        "unnest(%s::text[], %s::int[], %s::int[], %s::int[])"
+        " AS k(chunk_id, chunk_index, char_start, char_end)"
+    )
+
+    def __init__(
+        self,
+        dsn: str,
+        dimension: int,
+        provider: str = "mock",
+        ef_search: Optional[int] = None,
+        probes: Optional[int] = None,
+        exact_search: bool = False,
+        write_method: str = "copy",
+        write_mode: str = "dual",
+        iterative_scan: Optional[str] = "strict_order",
+        pool_min_size: int = 1,
+        pool_max_size: int = 10,
+        pool_timeout: float = 30.0,
+        pool_max_idle: float = 600.0,
+    ) -> None:
+        if write_method not in self.WRITE_METHODS:
+            raise ValueError(
+                f"Unknown write_method '{write_method}'. Valid: {self.WRITE_METHODS}"
+            )
+        if write_mode not in self.WRITE_MODES:
+            raise ValueError(
+                f"Unknown write_mode '{write_mode}'. Valid: {self.WRITE_MODES}"
+            )
         self._dsn = dsn
         self._dimension = dimension
         self._provider = provider
+        # ANN index defaults (overridable per query)
+        self._ef_search = ef_search
+        self._probes = probes
+        self._exact_search = exact_search
+        self._iterative_scan = iterative_scan
+        # Server pgvector version, detected on each new pooled connection
+        self._pgvector_version: Optional[Tuple[int, ...]] = None
+        self._write_method = write_method
+        self._write_mode = write_mode
+        # Connection pool is opened lazily on first use (see _get_pool)
+        self._pool_kwargs = {
+            "min_size": pool_min_size,
+            "max_size": pool_max_size,
+            "timeout": pool_timeout,
+            "max_idle": pool_max_idle,
+        }
         # TEMP DISABLE VALIDATION - tables exist ✓
         logging.info("PgVectorStore MS6: Skipping table validation for dual-write test")
 
@@ -25,80 +114,588 @@ class PgVectorStore(VectorStore):
     def dimension(self) -> int:
         return self._dimension
 
+    # ------------------------------------------------------------------
+    # Writes
+    # ------------------------------------------------------------------
+    def _build_rows(
+        self, records: List[VectorRecord]
+    ) -> Tuple[List[tuple], List[tuple]]:
+        """
+        Return (vectors rows, vector_chunks rows) in *_COLUMNS order.
+
+        In "chunks_only" mode the legacy table gets nothing and every record
+        lands in vector_chunks (document_id may be NULL).
+        """
+        rows = [self._row(record) for record in records]
+        if self._write_mode == "chunks_only":
+            return [], [
+                row + self._chunk_columns(record)
+                for row, record in zip(rows, records)
+            ]
+        # MS6 vector_chunks only holds rows linked to a DocumentNode
+        chunk_rows = [
+            row + self._chunk_columns(record)
+            for row, record in zip(rows, records)
+            if record.metadata.document_id
+        ]
+        return rows, chunk_rows
+
+    @staticmethod
+    def _document_uuid(record: VectorRecord) -> Optional[UUID]:
+        document_id = record.metadata.document_id
+        return UUID(str(document_id)) if document_id else None
+
+    @classmethod
+    def _chunk_columns(cls, record: VectorRecord) -> tuple:
+        """vector_chunks-only values appended to _row() (CHUNK_COLUMNS order)."""
+        return (cls._document_uuid(record), record.metadata.token_count)
+
+    def _row(self, record: VectorRecord) -> tuple:
+        """Build a vectors-table row (column order = VECTOR_COLUMNS)."""
+        metadata = record.metadata
+        return (
+            to_embedding(record.vector),
+            UUID(str(metadata.ingestion_id)),
+            metadata.chunk_id,
+            metadata.chunk_index,
+            metadata.chunk_strategy,
+            metadata.chunk_text,
+            Jsonb(metadata.source_metadata or {}),
+            metadata.provider or self._provider,
+        )
+
+    @classmethod
+    def _copy_sql(
+        cls, table: str, columns: Sequence[tuple[str, str]]
+    ) -> sql.Composed:
+        return sql.SQL(
+            "COPY {schema}.{table} ({columns}) FROM STDIN (FORMAT BINARY)"
+        ).format(
+            schema=sql.Identifier(cls.SCHEMA),
+            table=sql.Identifier(table),
+            columns=sql.SQL(", ").join(sql.Identifier(name) for name, _ in columns),
+        )
+
+    @classmethod
+    def _insert_sql(
+        cls, table: str, columns: Sequence[tuple[str, str]]
+    ) -> sql.Composed:
+        return sql.SQL(
+            "INSERT INTO {schema}.{table} ({columns}) VALUES ({values})"
+        ).format(
+            schema=sql.Identifier(cls.SCHEMA),
+            table=sql.Identifier(table),
+            columns=sql.SQL(", ").join(sql.Identifier(name) for name, _ in columns),
+            values=sql.SQL(", ").join(sql.Placeholder() * len(columns)),
+        )
+
+    # ------------------------------------------------------------------
+    # Search
+    # ------------------------------------------------------------------
+    @classmethod
+    def _search_query(
+        cls,
+        query_vector: Sequence[float],
+        k: int,
+        filters: Optional[VectorSearchFilters] = None,
+        reorder: bool = False,
+    ) -> Tuple[sql.Composed, list]:
+        """
+        Build the top-k query with metadata filters compiled into WHERE.
+
+        reorder=True re-sorts the index scan's rows by distance, as needed
+        under hnsw.iterative_scan = relaxed_order, which may return them
+        slightly out of order. The MATERIALIZED CTE keeps the planner from
+        folding the outer ORDER BY (over k rows only) into the index scan.
+        """
+        clauses, params = cls._filter_clauses(filters)
+        where = (
+            sql.SQL("WHERE ") + sql.SQL(" AND ").join(clauses)
+            if clauses
+            else sql.SQL("")
+        )
+        query = sql.SQL("""
+            SELECT vector, ingestion_id, chunk_id, chunk_index, chunk_strategy,
+                   chunk_text, source_metadata, provider, document_id, token_count
+            FROM {schema}.vector_chunks
+            {where}
+            ORDER BY vector <-> (%s::vector)
+            LIMIT %s
+        """).format(schema=sql.Identifier(cls.SCHEMA), where=where)
+        params = params + [to_embedding(query_vector), k]
+        if reorder:
+            query = sql.SQL("""
+                WITH candidates AS MATERIALIZED ({query})
+                SELECT * FROM candidates ORDER BY vector <-> (%s::vector)
+            """).format(query=query)
+            params.append(to_embedding(query_vector))
+        return query, params
+
+    @staticmethod
+    def _filter_clauses(
+        filters: Optional[VectorSearchFilters],
+    ) -> Tuple[List[sql.Composable], list]:
+        """Translate VectorSearchFilters into parameterised WHERE clauses."""
+        clauses: List[sql.Composable] = []
+        params: list = []
+        if filters is None:
+            return clauses, params
+
+        if filters.ingestion_id:
+            clauses.append(sql.SQL("ingestion_id = %s::uuid"))
+            params.append(filters.ingestion_id)
+        if filters.document_ids is not None:
+            clauses.append(sql.SQL("document_id = ANY(%s::uuid[])"))
+            params.append(list(filters.document_ids))
+        if filters.provider:
+            clauses.append(sql.SQL("provider = %s"))
+            params.append(filters.provider)
+        if filters.chunk_strategy:
+            clauses.append(sql.SQL("chunk_strategy = %s"))
+            params.append(filters.chunk_strategy)
+        if filters.source_metadata:
+            # JSONB containment, served by the GIN (jsonb_path_ops) index
+            clauses.append(sql.SQL("source_metadata @> %s"))
+            params.append(Jsonb(filters.source_metadata))
+        return clauses, params
+
+    def _search_settings(
+        self,
+        *,
+        k: int,
+        ef_search: Optional[int],
+        probes: Optional[int],
+        exact: Optional[bool],
+        filtered: bool = False,
+    ) -> List[Tuple[LiteralString, tuple]]:
+        """
+        Transaction-local planner/index knobs to run before the search query.
+
+        set_config(..., true) is the parameterisable form of SET LOCAL, so the
+        values never leak to other requests sharing the connection.
+        Per-call values override the store defaults.
+        """
+        ef_search = ef_search if ef_search is not None else self._ef_search
+        probes = probes if probes is not None else self._probes
+        exact = exact if exact is not None else self._exact_search
+
+        if exact:
+            return [("SELECT set_config('enable_indexscan', 'off', true)", ())]
+
+        # HNSW returns at most ef_search candidates, so never go below k
+        # (pgvector default ef_search is 40; summarization asks for k=1000).
+        # Filtered searches keep scanning with hnsw.iterative_scan where the
+        # server supports it, and oversample the candidates otherwise.
+        iterative = filtered and self._iterative_scan_enabled()
+        floor = k * self.FILTERED_EF_SEARCH_FACTOR if filtered and not iterative else k
+        effective_ef = min(max(ef_search or 0, floor), self.HNSW_MAX_EF_SEARCH)
+        statements: List[Tuple[LiteralString, tuple]] = [
+            ("SELECT set_config('hnsw.ef_search', %s, true)", (str(effective_ef),))
+        ]
+        if probes is not None:
+            statements.append(
+                ("SELECT set_config('ivfflat.probes', %s, true)", (str(probes),))
+            )
+        if iterative:
+            # pgvector >= 0.8: keep scanning the index until k rows pass the filter
+            statements.append((
+                "SELECT set_config('hnsw.iterative_scan', %s, true)",
+                (self._iterative_scan,),
+            ))
+        return statements
+
+    def _reorders_results(self, filtered: bool) -> bool:
+        """Whether a search runs under relaxed_order and must be re-sorted."""
+        return (
+            filtered
+            and self._iterative_scan == "relaxed_order"
+            and self._iterative_scan_enabled()
+        )
+
+    def _iterative_scan_enabled(self) -> bool:
+        """Configured and, once the server version is known, supported."""
+        if self._iterative_scan in (None, "off"):
+            return False
+        return (
+            self._pgvector_version is None
+            or self._pgvector_version >= self.ITERATIVE_SCAN_MIN_VERSION
+        )
+
+    def _record_pgvector_version(self, version: Optional[str]) -> None:
+        """Remember the server's pgvector version ("0.8.0" → (0, 8, 0))."""
+        if version:
+            parts = re.findall(r"\d+", version)
+            self._pgvector_version = tuple(int(part) for part in parts)
+
+    @staticmethod
+    def _record_from_row(row: tuple) -> VectorRecord:
+        (vector, ingestion_id, chunk_id, chunk_index, chunk_strategy,
+         chunk_text, source_metadata, provider, document_id, token_count) = row
+        metadata = VectorMetadata(
+            ingestion_id=ingestion_id, chunk_id=chunk_id,
+            chunk_index=chunk_index, chunk_strategy=chunk_strategy,
+            chunk_text=chunk_text, source_metadata=source_metadata,
+            provider=provider, document_id=document_id, token_count=token_count)
+        return VectorRecord(vector=vector, metadata=metadata)
+
+    # ------------------------------------------------------------------
+    # Listing (keyset pagination by (chunk_index, id))
+    # ------------------------------------------------------------------
+    LIST_KEYS = ("ingestion_id", "document_id")
+
+    @classmethod
+    def _list_chunks_query(
+        cls,
+        key: str,
+        value: str,
+        cursor: Optional[str],
+        limit: int,
+    ) -> Tuple[sql.Composed, list]:
+        """
+        Chunks of one ingestion / document in chunk_index order.
+
+        Served by the (key, chunk_index, id) indexes, so each page costs
+        O(page) regardless of corpus size. Fetches limit + 1 rows so the
+        caller can tell whether another page exists.
+        """
+        if key not in cls.LIST_KEYS:
+            raise ValueError(f"Unknown list key '{key}'. Valid: {cls.LIST_KEYS}")
+
+        clauses: List[sql.Composable] = [
+            sql.SQL("{key} = %s::uuid").format(key=sql.Identifier(key))
+        ]
+        params: list = [value]
+        if cursor is not None:
+            clauses.append(sql.SQL("(chunk_index, id) > (%s, %s)"))
+            params.extend(cls.decode_cursor(cursor))
+
+        query = sql.SQL("""
+            SELECT id, ingestion_id, chunk_id, chunk_index, chunk_strategy,
+                   chunk_text, source_metadata, provider, document_id, token_count
+            FROM {schema}.vector_chunks
+            WHERE {where}
+            ORDER BY chunk_index, id
+            LIMIT %s
+        """).format(
+            schema=sql.Identifier(cls.SCHEMA),
+            where=sql.SQL(" AND ").join(clauses),
+        )
+        return query, params + [limit + 1]
+
+    @classmethod
+    def _chunk_page(
+        cls, rows: List[tuple], limit: int
+    ) -> Tuple[List[VectorMetadata], Optional[str]]:
+        """Map listed rows to metadata and compute the next-page cursor."""
+        page = rows[:limit]
+        chunks = [
+            VectorMetadata(
+                ingestion_id=ingestion_id, chunk_id=chunk_id,
+                chunk_index=chunk_index, chunk_strategy=chunk_strategy,
+                chunk_text=chunk_text, source_metadata=source_metadata,
+                provider=provider, document_id=document_id, token_count=token_count)
+            for (_, ingestion_id, chunk_id, chunk_index, chunk_strategy,
+                 chunk_text, source_metadata, provider, document_id,
+                 token_count) in page
+        ]
+        next_cursor = None
+        if len(rows) > limit and page:
+            last = page[-1]
+            next_cursor = cls.encode_cursor(chunk_index=last[3], row_id=last[0])
+        return chunks, next_cursor
+
+    @staticmethod
+    def encode_cursor(*, chunk_index: int, row_id: int) -> str:
+        return f"{chunk_index}:{row_id}"
+
+    @staticmethod
+    def decode_cursor(cursor: str) -> Tuple[int, int]:
+        try:
+            chunk_index, row_id = cursor.split(":")
+            return int(chunk_index), int(row_id)
+        except ValueError as exc:
+            raise ValueError(f"Invalid cursor '{cursor}'") from exc
+
+    # ------------------------------------------------------------------
+    # Deletes
+    # ------------------------------------------------------------------
+    @classmethod
+    def _delete_sql(cls, table: str) -> sql.Composed:
+        return sql.SQL("""
+            DELETE FROM {schema}.{table_name} WHERE ingestion_id = %s
+        """).format(schema=sql.Identifier(cls.SCHEMA), table_name=sql.Identifier(table))
+
+
+    # ------------------------------------------------------------------
+    # Incremental document update
+    # ------------------------------------------------------------------
+    def _sync_document_statements(
+        self,
+        document_id: str,
+        ingestion_id: str,
+        keep: Sequence[KeptChunk],
+    ) -> List[Tuple[sql.Composed, tuple]]:
+        """
+        Statements that reconcile a document's stored chunks with `keep`.
+
+        Rows whose chunk_id is in `keep` stay in place (their embedding is
+        reused) and are moved to the new chunk_index / ingestion_id, with
+        source_metadata char_start / char_end set to the new offsets (removed
+        when the new chunk has none); every other row of the document is
+        deleted. New rows are written by the caller afterwards, in the same
+        transaction.
+        """
+        keep_ids, keep_indexes, keep_starts, keep_ends = (
+            [list(column) for column in zip(*keep)] if keep else ([], [], [], [])
+        )
+        kept = (keep_ids, keep_indexes, keep_starts, keep_ends)
+        schema = sql.Identifier(self.SCHEMA)
+        statements: List[Tuple[sql.Composed, tuple]] = []
+
+        if self._write_mode == "dual":
+            # Legacy rows are matched through vector_chunks (no document_id)
+            statements.append((sql.SQL("""
+                DELETE FROM {schema}.vectors v
+                USING {schema}.vector_chunks c
+                WHERE c.document_id = %s::uuid
+                  AND NOT (c.chunk_id = ANY(%s::text[]))
+                  AND v.ingestion_id = c.ingestion_id AND v.chunk_id = c.chunk_id
+            """).format(schema=schema), (document_id, keep_ids)))
+            statements.append((sql.SQL("""
+                UPDATE {schema}.vectors v
+                SET ingestion_id = %s::uuid, chunk_index = k.chunk_index,
+                    source_metadata = {offsets}
+                FROM {schema}.vector_chunks c,
+                     {kept}
+                WHERE c.document_id = %s::uuid AND c.chunk_id = k.chunk_id
+                  AND v.ingestion_id = c.ingestion_id AND v.chunk_id = c.chunk_id
+            """).format(
+                schema=schema,
+                offsets=self._kept_offsets_sql("v"),
+                kept=self.KEPT_CHUNKS_SQL,
+            ), (ingestion_id, *kept, document_id)))
+
+        statements.append((sql.SQL("""
+            DELETE FROM {schema}.vector_chunks
+            WHERE document_id = %s::uuid AND NOT (chunk_id = ANY(%s::text[]))
+        """).format(schema=schema), (document_id, keep_ids)))
+        statements.append((sql.SQL("""
+            UPDATE {schema}.vector_chunks c
+            SET ingestion_id = %s::uuid, chunk_index = k.chunk_index,
+                source_metadata = {offsets}
+            FROM {kept}
+            WHERE c.document_id = %s::uuid AND c.chunk_id = k.chunk_id
+        """).format(
+            schema=schema,
+            offsets=self._kept_offsets_sql("c"),
+            kept=self.KEPT_CHUNKS_SQL,
+        ), (ingestion_id, *kept, document_id)))
+        return statements
+
+    @staticmethod
+    def _kept_offsets_sql(alias: str) -> sql.Composed:
+        """A kept row's source_metadata with char_start / char_end from `k`."""
+        return sql.SQL("""CASE WHEN k.char_start IS NULL
+                    THEN {metadata} - 'char_start' - 'char_end'
+                    ELSE {metadata} || jsonb_build_object(
+                        'char_start', k.char_start, 'char_end', k.char_end)
+                    END""").format(metadata=sql.Identifier(alias, "source_metadata"))
+
+
+class PgVectorStore(PgVectorSQL, VectorStore):
+    def __init__(
+        self, dsn: str, dimension: int, provider: str = "mock", **options: Any
+    ) -> None:
+        super().__init__(dsn, dimension, provider, **options)
+        self._pool: Optional[ConnectionPool] = None
+        self._pool_lock = threading.Lock()
+
+    # ------------------------------------------------------------------
+    # Connection pool
+    # ------------------------------------------------------------------
+    def _get_pool(self) -> ConnectionPool:
+        """Return the shared pool, creating it on first use."""
+        if self._pool is None:
+            with self._pool_lock:
+                if self._pool is None:
+                    self._pool = ConnectionPool(
+                        self._dsn,
+                        name="pgvector-store",
+                        configure=self._configure_connection,
+                        check=ConnectionPool.check_connection,
+                        open=True,
+                        **self._pool_kwargs,
+                    )
+                    logging.info(
+                        "PgVectorStore: opened connection pool (min=%s, max=%s)",
+                        self._pool_kwargs["min_size"],
+                        self._pool_kwargs["max_size"],
+                    )
+        return self._pool
+
+    def _configure_connection(self, conn: psycopg.Connection) -> None:
+        """Run once per new pooled connection: load vector adapters, detect the
+        pgvector version."""
+        register_vector(conn)
+        register_embedding_adapters(conn)
+        row = conn.execute(self.PGVECTOR_VERSION_SQL).fetchone()
+        self._record_pgvector_version(row[0] if row else None)
+        conn.commit()  # pool requires the connection back in idle state
+
+    def pool_stats(self) -> Dict[str, Any]:
+        """Pool size and wait metrics (requests_waiting, requests_wait_ms, ...)."""
+        if self._pool is None:
+            return {"pool_open": False}
+        return {"pool_open": True, **self._pool.get_stats()}
+
+    def close(self) -> None:
+        """Close the connection pool (application shutdown)."""
+        if self._pool is not None:
+            self._pool.close()
+            self._pool = None
+
     def persist(self, records: list[VectorRecord]) -> None:
         self.add(records)
         logging.debug("PgVectorStore.persist: added %d records", len(records))
 
     def add(self, records: Iterable[VectorRecord]) -> None:
-        """MS6 Dual-write: vectors + vector_chunks"""
-        vectors_sql = sql.SQL("""
-            INSERT INTO {schema}.vectors 
-            (vector, ingestion_id, chunk_id, chunk_index, chunk_strategy, 
-             chunk_text, source_metadata, provider)
-            VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
-        """).format(schema=sql.Identifier(self.SCHEMA))
-        
-        chunks_sql = sql.SQL("""
-            INSERT INTO {schema}.vector_chunks 
-            (vector, ingestion_id, chunk_id, chunk_index, chunk_strategy, 
-             chunk_text, source_metadata, provider, document_id)
-            VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s)
-        """).format(schema=sql.Identifier(self.SCHEMA))
-
-        with psycopg.connect(self._dsn) as conn:
+        """
+        MS6 write: vectors + vector_chunks ("dual") or vector_chunks only.
+
+        The whole batch is written in one transaction. With the default
+        "copy" write method each table receives a single binary
+        COPY ... FROM STDIN stream; "executemany" falls back to psycopg's
+        pipelined executemany (one round trip per table, not per row).
+        """
+        records = list(records)
+        if not records:
+            return
+
+        vector_rows, chunk_rows = self._build_rows(records)
+
+        with self._get_pool().connection() as conn:
+            with conn.transaction():
+                self._write_rows(conn, vector_rows, chunk_rows)
+        logging.info(
+            f"MS6 {self._write_mode} write ({self._write_method}): "
+            f"{len(vector_rows)} vectors + {len(chunk_rows)} chunks complete"
+        )
+
+    def _write_rows(
+        self,
+        conn: psycopg.Connection,
+        vector_rows: List[tuple],
+        chunk_rows: List[tuple],
+    ) -> None:
+        for table, columns, rows in (
+            ("vectors", self.VECTOR_COLUMNS, vector_rows),
+            ("vector_chunks", self.CHUNK_COLUMNS, chunk_rows),
+        ):
+            if not rows:
+                continue
             with conn.cursor() as cur:
-                for record in records:
-                    # Legacy vectors
-                    cur.execute(vectors_sql, (
-                        record.vector, record.metadata.ingestion_id,
-                        record.metadata.chunk_id, record.metadata.chunk_index,
-                        record.metadata.chunk_strategy, record.metadata.chunk_text,
-                        Jsonb(record.metadata.source_metadata or {}),
-                        record.metadata.provider or self._provider,
-                    ))
-                    
-                    # MS6 vector_chunks (w/ document_id)
-                    if record.metadata.document_id:
-                        cur.execute(chunks_sql, (
-                            record.vector, record.metadata.ingestion_id,
-                            record.metadata.chunk_id, record.metadata.chunk_index,
-                            record.metadata.chunk_strategy, record.metadata.chunk_text,
-                            Jsonb(record.metadata.source_metadata or {}),
-                            record.metadata.provider or self._provider,
-                            record.metadata.document_id,
-                        ))
-        logging.info(f"MS6 DUAL-WRITE: {len(records)} vectors + chunks complete")
-
-    def similarity_search(self, query_vector: Sequence[float], k: int) -> List[VectorRecord]:
-        """MS6: Search vector_chunks (provenance)"""
-        search_sql = sql.SQL("""
-            SELECT vector, ingestion_id, chunk_id, chunk_index, chunk_strategy,
-                   chunk_text, source_metadata, provider, document_id
-            FROM {schema}.vector_chunks
-            ORDER BY vector <-> (%s::vector)
-            LIMIT %s
-        """).format(schema=sql.Identifier(self.SCHEMA))
+                if self._write_method == "copy":
+                    with cur.copy(self._copy_sql(table, columns)) as copy:
+                        copy.set_types([pg_type for _, pg_type in columns])
+                        for row in rows:
+                            copy.write_row(row)
+                else:
+                    cur.executemany(self._insert_sql(table, columns), rows)
+
+    def sync_document(
+        self,
+        *,
+        document_id: str,
+        ingestion_id: str,
+        keep: Sequence[KeptChunk],
+        records: Iterable[VectorRecord],
+    ) -> Dict[str, int]:
+        """
+        Incrementally update one document in a single transaction.
+
+        `keep` lists (chunk_id, chunk_index, char_start, char_end) of stored
+        chunks whose text is unchanged, at their new position; `records` are
+        the new / changed chunks (already embedded).
+        Everything else stored for the document is deleted.
+        """
+        records = list(records)
+        vector_rows, chunk_rows = self._build_rows(records)
+        statements = self._sync_document_statements(document_id, ingestion_id, keep)
 
-        results: List[VectorRecord] = []
-        with psycopg.connect(self._dsn) as conn:
+        with self._get_pool().connection() as conn:
+            with conn.transaction():
+                rowcounts = []
+                with conn.cursor() as cur:
+                    for statement, params in statements:
+                        cur.execute(statement, params)
+                        rowcounts.append(cur.rowcount)
+                self._write_rows(conn, vector_rows, chunk_rows)
+
+        # vector_chunks delete / update are always the last two statements
+        deleted, kept = rowcounts[-2], rowcounts[-1]
+        logging.info(
+            f"Document {document_id} sync: kept={kept} deleted={deleted} "
+            f"added={len(chunk_rows)}"
+        )
+        return {"kept": kept, "deleted": deleted, "added": len(chunk_rows)}
+
+    def similarity_search(
+        self,
+        query_vector: Sequence[float],
+        k: int,
+        *,
+        ef_search: Optional[int] = None,
+        probes: Optional[int] = None,
+        exact: Optional[bool] = None,
+        filters: Optional[VectorSearchFilters] = None,
+    ) -> List[VectorRecord]:
+        """
+        MS6: Search vector_chunks (provenance).
+
+        Uses the HNSW / IVFFlat index on vector_chunks.vector when present.
+        ef_search / probes tune recall vs. latency for this query only;
+        exact=True disables index scans and falls back to a full exact scan.
+        filters are compiled into the WHERE clause (see VectorSearchFilters).
+        """
+        filtered = filters is not None and not filters.is_empty()
+        query, params = self._search_query(
+            query_vector, k, filters, reorder=self._reorders_results(filtered)
+        )
+        settings = self._search_settings(
+            k=k,
+            ef_search=ef_search,
+            probes=probes,
+            exact=exact,
+            filtered=filtered,
+        )
+        with self._get_pool().connection() as conn:
             with conn.cursor() as cur:
-                cur.execute(search_sql, (query_vector, k))
-                for row in cur.fetchall():
-                    (vector, ingestion_id, chunk_id, chunk_index, chunk_strategy,
-                     chunk_text, source_metadata, provider, document_id) = row
-                    metadata = VectorMetadata(
-                        ingestion_id=ingestion_id, chunk_id=chunk_id,
-                        chunk_index=chunk_index, chunk_strategy=chunk_strategy,
-                        chunk_text=chunk_text, source_metadata=source_metadata,
-                        provider=provider, document_id=document_id)
-                    results.append(VectorRecord(vector=vector, metadata=metadata))
-        return results
+                for statement, setting_params in settings:
+                    cur.execute(statement, setting_params)
+                cur.execute(query, params)
+                return [self._record_from_row(row) for row in cur.fetchall()]
 
     def delete_by_ingestion_id(self, ingestion_id: str) -> None:
-        for table in ["vectors", "vector_chunks"]:
-            delete_sql = sql.SQL("""
-                DELETE FROM {schema}.{table_name} WHERE ingestion_id = %s
-            """).format(schema=sql.Identifier(self.SCHEMA), table_name=sql.Identifier(table))
-            with psycopg.connect(self._dsn) as conn:
-                with conn.cursor() as cur:
-                    cur.execute(delete_sql, (ingestion_id,))
+        with self._get_pool().connection() as conn:
+            with conn.cursor() as cur:
+                for table in ["vectors", "vector_chunks"]:
+                    cur.execute(self._delete_sql(table), (ingestion_id,))
+
+    def list_chunks(
+        self,
+        *,
+        key: str,
+        value: str,
+        cursor: Optional[str] = None,
+        limit: int = 500,
+    ) -> Tuple[List[VectorMetadata], Optional[str]]:
+        """
+        One page of chunks for an ingestion_id / document_id in chunk_index
+        order. Returns (chunks, next_cursor); next_cursor is None on the
+        last page.
+        """
+        query, params = self._list_chunks_query(key, value, cursor, limit)
+        with self._get_pool().connection() as conn:
+            with conn.cursor() as cur:
+                cur.execute(query, params)
+                return self._chunk_page(cur.fetchall(), limit)
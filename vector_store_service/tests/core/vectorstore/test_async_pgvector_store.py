@@ -0,0 +1,93 @@
+# tests/core/vectorstore/test_async_pgvector_store.py
+import asyncio
+from unittest.mock import patch, MagicMock, AsyncMock
+
+import pytest
+
+from src.core.vectorstore.async_pgvector_store import AsyncPgVectorStore
+from shared.models.vector import VectorRecord, VectorMetadata
+
+pytestmark = pytest.mark.unit
+
+
+def _mock_async_pool(mock_pool_cls):
+    """Wire AsyncConnectionPool → connection() → cursor() as async context managers."""
+    mock_cursor = MagicMock()
+    mock_cursor.execute = AsyncMock()
+    mock_cursor.executemany = AsyncMock()
+    mock_cursor.fetchall = AsyncMock(return_value=[])
+
+    mock_conn = MagicMock()
+    mock_conn.cursor.return_value.__aenter__.return_value = mock_cursor
+    mock_conn.transaction.return_value.__aenter__.return_value = None
+
+    mock_pool = mock_pool_cls.return_value
+    mock_pool.open = AsyncMock()
+    mock_pool.close = AsyncMock()
+    mock_pool.connection.return_value.__aenter__.return_value = mock_conn
+    return mock_pool, mock_cursor
+
+
+class TestAsyncPgVectorStore:
+    @patch("src.core.vectorstore.async_pgvector_store.AsyncConnectionPool")
+    def test_similarity_search_awaits_query(self, mock_pool_cls):
+        mock_pool, mock_cursor = _mock_async_pool(mock_pool_cls)
+        mock_cursor.fetchall.return_value = [
+            ("[0.1,0.2]", "ing-1", "c1", 0, "sentence", "hello", {}, "mock", "doc-1", 2)
+        ]
+
+        store = AsyncPgVectorStore(dsn="mock_dsn", dimension=768)
+        results = asyncio.run(store.similarity_search([0.1, 0.2], k=3))
+
+        mock_pool.open.assert_awaited_once()
+        assert len(results) == 1
+        assert results[0].metadata.chunk_id == "c1"
+        assert results[0].metadata.document_id == "doc-1"
+        assert results[0].metadata.token_count == 2
+        executed = [str(call) for call in mock_cursor.execute.await_args_list]
+        assert any("hnsw.ef_search" in sql for sql in executed)
+        assert any("vector_chunks" in sql for sql in executed)
+
+    @patch("src.core.vectorstore.async_pgvector_store.AsyncConnectionPool")
+    def test_add_executemany_runs_in_one_transaction(self, mock_pool_cls):
+        mock_pool, mock_cursor = _mock_async_pool(mock_pool_cls)
+
+        store = AsyncPgVectorStore(
+            dsn="mock_dsn", dimension=768, write_method="executemany"
+        )
+        records = [
+            VectorRecord(
+                vector=[0.1, 0.2],
+                metadata=VectorMetadata(
+                    ingestion_id="00000000-0000-0000-0000-000000000001",
+                    chunk_id="c1",
+                    chunk_index=0,
+                    chunk_strategy="paragraph",
+                    chunk_text="text chunk",
+                    document_id="00000000-0000-0000-0000-0000000000d1",
+                ),
+            )
+        ]
+        asyncio.run(store.add(records))
+
+        conn = mock_pool.connection.return_value.__aenter__.return_value
+        conn.transaction.assert_called_once()
+        # vectors + vector_chunks
+        assert mock_cursor.executemany.await_count == 2
+
+    @patch("src.core.vectorstore.async_pgvector_store.AsyncConnectionPool")
+    def test_pool_opened_once_and_closed(self, mock_pool_cls):
+        mock_pool, _ = _mock_async_pool(mock_pool_cls)
+        store = AsyncPgVectorStore(dsn="mock_dsn", dimension=768)
+
+        async def scenario():
+            await store.delete_by_ingestion_id("ing-1")
+            await store.delete_by_ingestion_id("ing-2")
+            await store.close()
+
+        asyncio.run(scenario())
+
+        mock_pool_cls.assert_called_once()
+        mock_pool.open.assert_awaited_once()
+        mock_pool.close.assert_awaited_once()
+        assert store.pool_stats() == {"pool_open": False}
@@ -0,0 +1,41 @@
+# tests/core/vectorstore/test_backfill.py
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.core.vectorstore.backfill import backfill_vector_chunks
+
+pytestmark = pytest.mark.unit
+
+
+def test_backfill_walks_id_ranges_in_batches():
+    """Each id-range batch is copied (and optionally deleted) in its own transaction."""
+    cursor = MagicMock()
+    cursor.fetchone.return_value = (250,)
+    cursor.rowcount = 100
+    conn = MagicMock()
+    conn.cursor.return_value.__enter__.return_value = cursor
+
+    result = backfill_vector_chunks(conn, batch_size=100, delete_legacy=True)
+
+    assert result.scanned_batches == 3
+    assert conn.transaction.call_count == 3
+    ranges = [
+        call.args[1] for call in cursor.execute.call_args_list
+        if "INSERT INTO" in str(call.args[0])
+    ]
+    assert ranges == [(0, 100), (100, 200), (200, 300)]
+    assert result.copied_rows == 300
+    assert result.deleted_rows == 300
+
+
+def test_backfill_empty_legacy_table_is_noop():
+    cursor = MagicMock()
+    cursor.fetchone.return_value = (0,)
+    conn = MagicMock()
+    conn.cursor.return_value.__enter__.return_value = cursor
+
+    result = backfill_vector_chunks(conn)
+
+    assert result.scanned_batches == 0
+    conn.transaction.assert_not_called()
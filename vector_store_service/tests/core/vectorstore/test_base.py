@@ -87,3 +87,14 @@ def test_vectorstore_contract_with_minimal_implementation():
 
     assert len(results) == 1
     assert results[0] is record
+
+
+def test_async_vectorstore_is_abstract():
+    """
+    AsyncVectorStore mirrors the VectorStore contract for async callers
+    and must not be instantiable without the abstract coroutines.
+    """
+    from src.core.vectorstore.base import AsyncVectorStore
+
+    with pytest.raises(TypeError):
+        AsyncVectorStore()  # type: ignore[abstract]
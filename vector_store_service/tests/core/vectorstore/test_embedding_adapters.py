@@ -0,0 +1,69 @@
+# tests/core/vectorstore/test_embedding_adapters.py
+from array import array
+
+import numpy as np
+import psycopg
+import pytest
+from pgvector import Vector
+from pgvector.psycopg.vector import register_vector_info
+from psycopg.adapt import AdaptersMap, PyFormat
+from psycopg.pq import Format
+from psycopg.types import TypeInfo
+
+from src.core.vectorstore.embedding_adapters import (
+    EmbeddingBinaryLoader,
+    EmbeddingTextLoader,
+    register_embedding_adapters,
+)
+
+VALUES = [0.5, -1.25, 3.0]
+VECTOR_OID = 16385
+
+
+@pytest.fixture
+def adapters():
+    """Adapters as register_vector() leaves them, plus ours on top."""
+    adapters = AdaptersMap(psycopg.adapters)
+    # AdaptersMap is an AdaptContext, which is all register_vector_info uses
+    info = TypeInfo("vector", VECTOR_OID, 0)
+    register_vector_info(adapters, info)  # type: ignore[reportArgumentType]
+    register_embedding_adapters(adapters)
+    return adapters
+
+
+def test_embedding_dumps_to_pgvector_binary(adapters):
+    dumper_cls = adapters.get_dumper(array, PyFormat.AUTO)
+    dumper = dumper_cls(array)
+
+    assert dumper.format == Format.BINARY
+    assert dumper.oid == VECTOR_OID
+    assert bytes(dumper.dump(array("f", VALUES))) == Vector(VALUES).to_binary()
+
+
+@pytest.mark.parametrize(
+    "value",
+    [array("f", VALUES), Vector(VALUES), np.array(VALUES), VALUES],
+    ids=["embedding", "vector", "ndarray", "list"],
+)
+def test_copy_dumper_by_oid_accepts_any_vector_value(adapters, value):
+    """COPY set_types(["vector"]) looks the dumper up by oid, whatever the value."""
+
+    dumper = adapters.get_dumper_by_oid(VECTOR_OID, Format.BINARY)(type(value))
+
+    assert bytes(dumper.dump(value)) == Vector(VALUES).to_binary()
+
+
+def test_vector_columns_load_as_embeddings(adapters):
+    binary = adapters.get_loader(VECTOR_OID, Format.BINARY)
+    text = adapters.get_loader(VECTOR_OID, Format.TEXT)
+
+    assert binary is EmbeddingBinaryLoader
+    assert text is EmbeddingTextLoader
+    stored = memoryview(Vector(VALUES).to_binary())
+    assert binary(VECTOR_OID).load(stored) == array("f", VALUES)
+    assert text(VECTOR_OID).load(b"[0.5,-1.25,3]") == array("f", VALUES)
+
+
+def test_register_requires_vector_type():
+    with pytest.raises(psycopg.ProgrammingError):
+        register_embedding_adapters(AdaptersMap(psycopg.adapters))
@@ -1,61 +1,120 @@
 # tests/core/vectorstore/test_pgvector_store.py
+from array import array
 from unittest.mock import patch, MagicMock
 import pytest
 
 from src.core.vectorstore.pgvector_store import PgVectorStore
-from shared.models.vector import VectorRecord, VectorMetadata
+from shared.models.vector import VectorRecord, VectorMetadata, VectorSearchFilters
 
 
 class TestPgVectorStore:
-    @patch("src.core.vectorstore.pgvector_store.psycopg.connect")
-    def test_add_vectors_calls_execute(self, mock_connect):
-        """Ensure add() calls cursor.execute once per record."""
-
-        # Setup mocks
-        mock_cursor = MagicMock()
-        mock_conn = MagicMock()
-        mock_conn.cursor.return_value.__enter__.return_value = mock_cursor
-        mock_connect.return_value.__enter__.return_value = mock_conn
-
-        # Patch _validate_table at instantiation to avoid RuntimeError
-        with patch.object(PgVectorStore, "_validate_table", lambda self: None):
-            store = PgVectorStore(dsn="mock_dsn", dimension=768)
-
-        records = [
+    @staticmethod
+    def _records(n, document_id=None):
+        return [
             VectorRecord(
                 vector=[0.1, 0.2],
                 metadata=VectorMetadata(
-                    ingestion_id="ing_1",
-                    chunk_id="c1",
-                    chunk_index=0,
+                    ingestion_id="00000000-0000-0000-0000-000000000001",
+                    chunk_id=f"c{i}",
+                    chunk_index=i,
                     chunk_strategy="paragraph",
                     chunk_text="text chunk",
                     source_metadata={},
                     provider="mock",
+                    document_id=document_id,
                 ),
             )
+            for i in range(n)
         ]
 
+    @patch("src.core.vectorstore.pgvector_store.ConnectionPool")
+    def test_add_vectors_streams_one_copy_per_table(self, mock_pool):
+        """Ensure add() issues one COPY per table, not one INSERT per record."""
+
+        mock_copy = MagicMock()
+        mock_cursor = MagicMock()
+        mock_cursor.copy.return_value.__enter__.return_value = mock_copy
+        mock_conn = MagicMock()
+        mock_conn.cursor.return_value.__enter__.return_value = mock_cursor
+        connection = mock_pool.return_value.connection.return_value
+        connection.__enter__.return_value = mock_conn
+
+        store = PgVectorStore(dsn="mock_dsn", dimension=768)
+        records = self._records(3, document_id="00000000-0000-0000-0000-0000000000d1")
+
         store.add(records)
 
-        # Only count INSERT statements
-        insert_calls = [
-            call for call in mock_cursor.execute.call_args_list
-            if "INSERT INTO" in str(call)
-        ]
-        assert len(insert_calls) == len(records)
+        copy_statements = [str(call) for call in mock_cursor.copy.call_args_list]
+        assert len(copy_statements) == 2
+        assert "vectors" in copy_statements[0]
+        assert "vector_chunks" in copy_statements[1]
+        # 3 rows into vectors + 3 rows into vector_chunks
+        assert mock_copy.write_row.call_count == 2 * len(records)
+        mock_cursor.execute.assert_not_called()
+        mock_conn.transaction.assert_called_once()
+
+    def test_build_rows_appends_token_count_to_chunk_rows(self):
+        """vector_chunks rows carry token_count last; legacy rows don't."""
 
-    @patch("src.core.vectorstore.pgvector_store.psycopg.connect")
-    def test_delete_by_ingestion_id_calls_execute(self, mock_connect):
-        """Ensure delete_by_ingestion_id executes DELETE SQL."""
+        store = PgVectorStore(dsn="mock_dsn", dimension=768)
+        records = self._records(2, document_id="00000000-0000-0000-0000-0000000000d1")
+        records[0].metadata.token_count = 7
+
+        vector_rows, chunk_rows = store._build_rows(records)
+
+        assert len(vector_rows[0]) == len(store.VECTOR_COLUMNS)
+        assert len(chunk_rows[0]) == len(store.CHUNK_COLUMNS)
+        assert store.CHUNK_COLUMNS[-1] == ("token_count", "int4")
+        assert [row[-1] for row in chunk_rows] == [7, None]
+
+    def test_rows_carry_embeddings_without_copying(self):
+        """Embeddings go into rows as-is; the adapters dump them to pgvector binary."""
+
+        store = PgVectorStore(dsn="mock_dsn", dimension=768)
+        record = self._records(1)[0]
+        record.vector = array("f", [0.5, -1.25, 3.0])
+
+        (vector_row,), _ = store._build_rows([record])
+
+        assert vector_row[0] is record.vector
+
+        document_id = "00000000-0000-0000-0000-0000000000d1"
+        row = (vector_row[0],) + vector_row[1:] + (document_id, 2)
+        loaded = store._record_from_row(row)
+        assert loaded.vector == array("f", [0.5, -1.25, 3.0])
+
+    @patch("src.core.vectorstore.pgvector_store.ConnectionPool")
+    def test_add_vectors_executemany_batches_per_table(self, mock_pool):
+        """The executemany write method sends each table's rows in one call."""
 
         mock_cursor = MagicMock()
         mock_conn = MagicMock()
         mock_conn.cursor.return_value.__enter__.return_value = mock_cursor
-        mock_connect.return_value.__enter__.return_value = mock_conn
+        connection = mock_pool.return_value.connection.return_value
+        connection.__enter__.return_value = mock_conn
 
-        with patch.object(PgVectorStore, "_validate_table", lambda self: None):
-            store = PgVectorStore(dsn="mock_dsn", dimension=768)
+        store = PgVectorStore(dsn="mock_dsn", dimension=768, write_method="executemany")
+        store.add(self._records(4))
+
+        # No document_id → only the legacy vectors table is written
+        assert mock_cursor.executemany.call_count == 1
+        assert len(mock_cursor.executemany.call_args.args[1]) == 4
+
+    def test_unknown_write_method_rejected(self):
+        with pytest.raises(ValueError):
+            PgVectorStore(dsn="mock_dsn", dimension=768, write_method="bogus")
+
+    @patch("src.core.vectorstore.pgvector_store.ConnectionPool")
+    def test_delete_by_ingestion_id_calls_execute(self, mock_pool):
+        """Ensure delete_by_ingestion_id deletes from both tables on one connection."""
+
+        mock_cursor = MagicMock()
+        mock_conn = MagicMock()
+        mock_conn.cursor.return_value.__enter__.return_value = mock_cursor
+        connection = mock_pool.return_value.connection.return_value
+        connection.__enter__.return_value = mock_conn
+
+        store = PgVectorStore(dsn="mock_dsn", dimension=768)
 
         store.delete_by_ingestion_id("ing_123")
 
@@ -64,5 +123,302 @@ class TestPgVectorStore:
             call for call in mock_cursor.execute.call_args_list
             if "DELETE FROM" in str(call)
         ]
-        assert len(delete_calls) == 1
+        assert len(delete_calls) == 2
+        mock_pool.return_value.connection.assert_called_once()
+
+    @patch("src.core.vectorstore.pgvector_store.ConnectionPool")
+    def test_pool_is_created_once_and_reused(self, mock_pool):
+        """The pool is opened lazily and shared by every store call."""
+
+        mock_cursor = MagicMock()
+        mock_cursor.fetchall.return_value = []
+        mock_conn = MagicMock()
+        mock_conn.cursor.return_value.__enter__.return_value = mock_cursor
+        connection = mock_pool.return_value.connection.return_value
+        connection.__enter__.return_value = mock_conn
+
+        store = PgVectorStore(dsn="mock_dsn", dimension=768, pool_max_size=4)
+        assert store.pool_stats() == {"pool_open": False}
+        mock_pool.assert_not_called()
+
+        store.similarity_search([0.1, 0.2], k=5)
+        store.delete_by_ingestion_id("ing_123")
+
+        mock_pool.assert_called_once()
+        assert mock_pool.call_args.kwargs["max_size"] == 4
+        assert mock_pool.return_value.connection.call_count == 2
+
+    @patch("src.core.vectorstore.pgvector_store.ConnectionPool")
+    def test_similarity_search_sets_ef_search_at_least_k(self, mock_pool):
+        """HNSW ef_search is raised to k so LIMIT k can be satisfied."""
+
+        mock_cursor = MagicMock()
+        mock_cursor.fetchall.return_value = []
+        mock_conn = MagicMock()
+        mock_conn.cursor.return_value.__enter__.return_value = mock_cursor
+        connection = mock_pool.return_value.connection.return_value
+        connection.__enter__.return_value = mock_conn
+
+        store = PgVectorStore(dsn="mock_dsn", dimension=768, ef_search=40)
+        store.similarity_search([0.1, 0.2], k=100, probes=10)
+
+        set_config_calls = [
+            call for call in mock_cursor.execute.call_args_list
+            if "set_config" in str(call)
+        ]
+        assert "hnsw.ef_search" in str(set_config_calls[0])
+        assert set_config_calls[0].args[1] == ("100",)
+        assert "ivfflat.probes" in str(set_config_calls[1])
+        assert set_config_calls[1].args[1] == ("10",)
+
+    @patch("src.core.vectorstore.pgvector_store.ConnectionPool")
+    def test_similarity_search_exact_disables_index_scan(self, mock_pool):
+        """exact=True forces a full scan instead of the ANN index."""
+
+        mock_cursor = MagicMock()
+        mock_cursor.fetchall.return_value = []
+        mock_conn = MagicMock()
+        mock_conn.cursor.return_value.__enter__.return_value = mock_cursor
+        connection = mock_pool.return_value.connection.return_value
+        connection.__enter__.return_value = mock_conn
+
+        store = PgVectorStore(dsn="mock_dsn", dimension=768)
+        store.similarity_search([0.1, 0.2], k=5, exact=True)
+
+        executed = [str(call) for call in mock_cursor.execute.call_args_list]
+        assert any("enable_indexscan" in sql for sql in executed)
+        assert not any("hnsw.ef_search" in sql for sql in executed)
+
+    @patch("src.core.vectorstore.pgvector_store.ConnectionPool")
+    def test_chunks_only_mode_skips_legacy_table(self, mock_pool):
+        """chunks_only writes every record to vector_chunks and nothing to vectors."""
+
+        mock_copy = MagicMock()
+        mock_cursor = MagicMock()
+        mock_cursor.copy.return_value.__enter__.return_value = mock_copy
+        mock_conn = MagicMock()
+        mock_conn.cursor.return_value.__enter__.return_value = mock_cursor
+        connection = mock_pool.return_value.connection.return_value
+        connection.__enter__.return_value = mock_conn
+
+        store = PgVectorStore(dsn="mock_dsn", dimension=768, write_mode="chunks_only")
+        # No document_id: dual mode would drop these from vector_chunks
+        store.add(self._records(2))
+
+        copy_statements = [str(call) for call in mock_cursor.copy.call_args_list]
+        assert len(copy_statements) == 1
+        assert "vector_chunks" in copy_statements[0]
+        assert mock_copy.write_row.call_count == 2
+        assert mock_copy.write_row.call_args.args[0][-1] is None
+
+
+    @patch("src.core.vectorstore.pgvector_store.ConnectionPool")
+    def test_similarity_search_compiles_filters_into_where(self, mock_pool):
+        """Metadata filters become SQL predicates with bound parameters."""
+
+        mock_cursor = MagicMock()
+        mock_cursor.fetchall.return_value = []
+        mock_conn = MagicMock()
+        mock_conn.cursor.return_value.__enter__.return_value = mock_cursor
+        connection = mock_pool.return_value.connection.return_value
+        connection.__enter__.return_value = mock_conn
+
+        store = PgVectorStore(
+            dsn="mock_dsn", dimension=768, iterative_scan="strict_order"
+        )
+        filters = VectorSearchFilters(
+            ingestion_id="ing-1",
+            document_ids=["doc-1", "doc-2"],
+            source_metadata={"source_file": "a.pdf"},
+        )
+        store.similarity_search([0.1, 0.2], k=5, filters=filters)
+
+        search_call = mock_cursor.execute.call_args_list[-1]
+        query = search_call.args[0].as_string(None)
+        params = search_call.args[1]
+        assert "WHERE ingestion_id = %s::uuid" in query
+        assert "document_id = ANY(%s::uuid[])" in query
+        assert "source_metadata @> %s" in query
+        assert params[0] == "ing-1"
+        assert params[1] == ["doc-1", "doc-2"]
+        assert params[-2:] == [array("f", [0.1, 0.2]), 5]
+        executed = [str(call) for call in mock_cursor.execute.call_args_list]
+        assert any("hnsw.iterative_scan" in sql for sql in executed)
+
+    @staticmethod
+    def _search_statements(store, filters):
+        mock_cursor = MagicMock()
+        mock_cursor.fetchall.return_value = []
+        mock_conn = MagicMock()
+        mock_conn.cursor.return_value.__enter__.return_value = mock_cursor
+        with patch("src.core.vectorstore.pgvector_store.ConnectionPool") as mock_pool:
+            connection = mock_pool.return_value.connection.return_value
+            connection.__enter__.return_value = mock_conn
+            store.similarity_search([0.1, 0.2], k=10, filters=filters)
+        calls = mock_cursor.execute.call_args_list[:-1]
+        return [(c.args[0], c.args[1]) for c in calls]
+
+    def test_filtered_search_uses_iterative_scan_by_default(self):
+        store = PgVectorStore(dsn="mock_dsn", dimension=768)
+        store._record_pgvector_version("0.8.0")
+
+        filters = VectorSearchFilters(document_ids=["d"])
+        statements = self._search_statements(store, filters)
+
+        assert (
+            "SELECT set_config('hnsw.iterative_scan', %s, true)", ("strict_order",)
+        ) in statements
+        assert ("SELECT set_config('hnsw.ef_search', %s, true)", ("10",)) in statements
+
+    @patch("src.core.vectorstore.pgvector_store.ConnectionPool")
+    def test_relaxed_order_search_is_resorted_by_distance(self, mock_pool):
+        mock_cursor = MagicMock()
+        mock_cursor.fetchall.return_value = []
+        mock_conn = MagicMock()
+        mock_conn.cursor.return_value.__enter__.return_value = mock_cursor
+        pool = mock_pool.return_value
+        pool.connection.return_value.__enter__.return_value = mock_conn
+        store = PgVectorStore(
+            dsn="mock_dsn", dimension=768, iterative_scan="relaxed_order"
+        )
+        store._record_pgvector_version("0.8.0")
+
+        filters = VectorSearchFilters(document_ids=["d"])
+        store.similarity_search([0.1, 0.2], k=5, filters=filters)
+
+        query, params = mock_cursor.execute.call_args_list[-1].args
+        query = " ".join(query.as_string(None).split())
+        assert "WITH candidates AS MATERIALIZED" in query
+        assert "FROM candidates ORDER BY vector <-> (%s::vector)" in query
+        assert params[0] == ["d"] and params[2] == 5 and len(params) == 4
+
+    def test_filtered_search_oversamples_without_iterative_scan(self):
+        store = PgVectorStore(dsn="mock_dsn", dimension=768)
+        store._record_pgvector_version("0.7.4")
+
+        filters = VectorSearchFilters(document_ids=["d"])
+        statements = self._search_statements(store, filters)
+
+        assert not any("iterative_scan" in sql for sql, _ in statements)
+        assert ("SELECT set_config('hnsw.ef_search', %s, true)", ("40",)) in statements
+
+    def test_configure_connection_detects_pgvector_version(self):
+        store = PgVectorStore(dsn="mock_dsn", dimension=768)
+        conn = MagicMock()
+        conn.execute.return_value.fetchone.return_value = ("0.7.4",)
+
+        with patch("src.core.vectorstore.pgvector_store.register_vector"):
+            store._configure_connection(conn)
+
+        assert store._pgvector_version == (0, 7, 4)
+        assert not store._iterative_scan_enabled()
+
+    @patch("src.core.vectorstore.pgvector_store.ConnectionPool")
+    def test_similarity_search_without_filters_has_no_where(self, mock_pool):
+        mock_cursor = MagicMock()
+        mock_cursor.fetchall.return_value = []
+        mock_conn = MagicMock()
+        mock_conn.cursor.return_value.__enter__.return_value = mock_cursor
+        connection = mock_pool.return_value.connection.return_value
+        connection.__enter__.return_value = mock_conn
+
+        store = PgVectorStore(
+            dsn="mock_dsn", dimension=768, iterative_scan="relaxed_order"
+        )
+        store.similarity_search([0.1, 0.2], k=5)
+
+        query = mock_cursor.execute.call_args_list[-1].args[0].as_string(None)
+        assert "WHERE" not in query
+        executed = [str(call) for call in mock_cursor.execute.call_args_list]
+        assert not any("hnsw.iterative_scan" in sql for sql in executed)
+
+    @patch("src.core.vectorstore.pgvector_store.ConnectionPool")
+    def test_list_chunks_pages_with_keyset_cursor(self, mock_pool):
+        """list_chunks returns one page plus a cursor when more rows exist."""
+
+        rows = [
+            (10 + i, "ing-1", f"c{i}", i, "simple", f"text {i}", {}, "mock", "doc-1", 2)
+            for i in range(3)
+        ]
+        mock_cursor = MagicMock()
+        mock_cursor.fetchall.return_value = rows
+        mock_conn = MagicMock()
+        mock_conn.cursor.return_value.__enter__.return_value = mock_cursor
+        connection = mock_pool.return_value.connection.return_value
+        connection.__enter__.return_value = mock_conn
+
+        store = PgVectorStore(dsn="mock_dsn", dimension=768)
+        chunks, next_cursor = store.list_chunks(
+            key="ingestion_id", value="ing-1", cursor="0:9", limit=2
+        )
+
+        assert [c.chunk_id for c in chunks] == ["c0", "c1"]
+        assert next_cursor == "1:11"
+        query = mock_cursor.execute.call_args.args[0].as_string(None)
+        params = mock_cursor.execute.call_args.args[1]
+        assert '"ingestion_id" = %s::uuid' in query
+        assert "(chunk_index, id) > (%s, %s)" in query
+        assert "ORDER BY chunk_index, id" in query
+        assert params == ["ing-1", 0, 9, 3]
+
+    @patch("src.core.vectorstore.pgvector_store.ConnectionPool")
+    def test_list_chunks_last_page_has_no_cursor(self, mock_pool):
+        mock_cursor = MagicMock()
+        mock_cursor.fetchall.return_value = [
+            (1, "ing-1", "c0", 0, "simple", "text", {}, "mock", "doc-1", 2)
+        ]
+        mock_conn = MagicMock()
+        mock_conn.cursor.return_value.__enter__.return_value = mock_cursor
+        connection = mock_pool.return_value.connection.return_value
+        connection.__enter__.return_value = mock_conn
+
+        store = PgVectorStore(dsn="mock_dsn", dimension=768)
+        chunks, next_cursor = store.list_chunks(key="document_id", value="doc-1")
+
+        assert len(chunks) == 1
+        assert next_cursor is None
+
+    def test_list_chunks_rejects_bad_key_and_cursor(self):
+        store = PgVectorStore(dsn="mock_dsn", dimension=768)
+        with pytest.raises(ValueError):
+            store.list_chunks(key="provider", value="x")
+        with pytest.raises(ValueError):
+            store.list_chunks(key="ingestion_id", value="x", cursor="garbage")
+
+    @patch("src.core.vectorstore.pgvector_store.ConnectionPool")
+    def test_sync_document_keeps_unchanged_and_inserts_changed(self, mock_pool):
+        """sync_document deletes stale rows, re-indexes kept ones, writes new rows."""
+
+        mock_cursor = MagicMock()
+        mock_cursor.rowcount = 3
+        mock_copy = MagicMock()
+        mock_cursor.copy.return_value.__enter__.return_value = mock_copy
+        mock_conn = MagicMock()
+        mock_conn.cursor.return_value.__enter__.return_value = mock_cursor
+        connection = mock_pool.return_value.connection.return_value
+        connection.__enter__.return_value = mock_conn
+
+        store = PgVectorStore(dsn="mock_dsn", dimension=768, write_mode="chunks_only")
+        document_id = "00000000-0000-0000-0000-0000000000d0"
+        records = self._records(1, document_id=document_id)
+        result = store.sync_document(
+            document_id=document_id,
+            ingestion_id=records[0].metadata.ingestion_id,
+            keep=[("keep-a", 0, 0, 10), ("keep-b", 2, None, None)],
+            records=records,
+        )
 
+        calls = mock_cursor.execute.call_args_list
+        statements = [c.args[0].as_string(None) for c in calls]
+        assert len(statements) == 2  # chunks_only: no legacy statements
+        assert "DELETE" in statements[0] and "NOT (chunk_id = ANY" in statements[0]
+        assert "UPDATE" in statements[1] and "unnest" in statements[1]
+        delete_params = mock_cursor.execute.call_args_list[0].args[1]
+        assert delete_params[1] == ["keep-a", "keep-b"]
+        assert "'char_start', k.char_start" in statements[1]
+        update_params = mock_cursor.execute.call_args_list[1].args[1]
+        assert update_params[1:5] == (
+            ["keep-a", "keep-b"], [0, 2], [0, None], [10, None]
+        )
+        assert mock_copy.write_row.call_count == 1
+        assert result == {"kept": 3, "deleted": 3, "added": 1}